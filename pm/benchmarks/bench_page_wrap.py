@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+页面包装性能基准
+对比原有的模板替换/正则切分方式与预拆分页面外壳（流式写入）方式包装业务内容的耗时
+"""
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 添加父目录到路径以支持导入
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.insert(0, str(parent_dir))
+
+from templates.html_templates import HTMLTemplates
+from utils.file_manager import FileManager
+
+
+def legacy_wrap(business_content: str, platform_type: str, page_name: str, role_name: str) -> str:
+    """原有实现：每次渲染完整模板后替换占位符/正则定位body"""
+    if platform_type == "mobile":
+        frame_template = HTMLTemplates.get_mobile_frame_template()
+        full_page = frame_template.replace('<!-- 页面内容将在这里替换 -->', business_content)
+        if page_name:
+            full_page = full_page.replace('手机页面框架', f'{page_name} - {role_name}')
+        return full_page
+
+    pc_template = HTMLTemplates.get_pc_page_template(page_name, "页面描述", role_name, "模块")
+    match = re.search(r'<body[^>]*>(.*?)</body>', pc_template, re.DOTALL)
+    if match:
+        body_start = pc_template.find('<body')
+        body_end = pc_template.find('>', body_start) + 1
+        body_close = pc_template.rfind('</body>')
+        return pc_template[:body_end] + '\n' + business_content + '\n' + pc_template[body_close:]
+    return business_content
+
+
+def make_fragments(count: int, pages: int):
+    """生成测试片段：count个片段分布在pages个页面标题上"""
+    fragments = []
+    for i in range(count):
+        body = '\n'.join(
+            f'<div class="p-4 bg-white rounded-lg"><h3>条目 {i}-{j}</h3><p>示例业务内容</p></div>'
+            for j in range(20)
+        )
+        fragments.append((f'功能页面{i % pages + 1}', body))
+    return fragments
+
+
+def write_fragments(fragments, fragment_dir: Path):
+    """将测试片段写入文件，返回 (页面名称, 片段文件) 列表"""
+    fragment_dir.mkdir()
+    fragment_files = []
+    for i, (page_name, body) in enumerate(fragments):
+        fragment_file = fragment_dir / f'{i}.html'
+        fragment_file.write_text(body, encoding='utf-8')
+        fragment_files.append((page_name, fragment_file))
+    return fragment_files
+
+
+def bench(label: str, fragment_files, wrap, output_dir: Path) -> float:
+    """
+    执行一轮基准测试，返回耗时（秒）
+
+    每轮写入新建的空目录：目标页面已存在且内容一致时写入会被跳过，复用目录会使后一轮没有实际写入
+    """
+    output_dir.mkdir()
+    start = time.perf_counter()
+    for i, (page_name, fragment_file) in enumerate(fragment_files):
+        wrap(output_dir / f'{i}.html', fragment_file, page_name)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<12} {elapsed * 1000:9.1f} ms  ({elapsed / len(fragment_files) * 1e6:7.1f} µs/页)")
+    return elapsed
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description='页面包装性能基准')
+    parser.add_argument('--count', type=int, default=1000, help='片段数量（默认1000）')
+    parser.add_argument('--pages', type=int, default=50, help='不同页面标题数量（默认50）')
+    args = parser.parse_args()
+
+    fragments = make_fragments(args.count, args.pages)
+    role_name = "角色1"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_manager = FileManager(tmp)
+        output_dir = Path(tmp)
+        fragment_files = write_fragments(fragments, output_dir / 'fragments')
+        for platform_type in ("mobile", "pc"):
+            print(f"📊 {platform_type}: {args.count} 个片段, {args.pages} 个页面标题")
+
+            def legacy(target, fragment_file, page_name):
+                body = fragment_file.read_text(encoding='utf-8')
+                target.write_text(legacy_wrap(body, platform_type, page_name, role_name), encoding='utf-8')
+
+            def shell(target, fragment_file, page_name):
+                file_manager._write_wrapped_page(target, fragment_file, platform_type, page_name, role_name)
+
+            FileManager._get_page_shell.cache_clear()
+            legacy_time = bench("模板替换", fragment_files, legacy, output_dir / f'{platform_type}-legacy')
+            shell_time = bench("预拆分外壳", fragment_files, shell, output_dir / f'{platform_type}-shell')
+            print(f"  加速比: {legacy_time / shell_time:.2f}x\n")
+
+
+if __name__ == "__main__":
+    main()
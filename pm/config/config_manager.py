@@ -190,6 +190,27 @@ class ConfigManager:
         
         return None
     
+    def find_page_by_url(self, page_url: str) -> Optional[Dict[str, Any]]:
+        """
+        根据页面URL查找页面信息
+        
+        Args:
+            page_url: 页面URL（相对于项目根目录）
+            
+        Returns:
+            Optional[Dict[str, Any]]: 页面信息字典，如果未找到返回None
+        """
+        if not self.menu_data:
+            return None
+        
+        for role in self.menu_data:
+            for module in role.get('modules', []):
+                for page in module.get('pages', []):
+                    if page.get('url') == page_url:
+                        return page
+        
+        return None
+    
     def list_all_pages(self) -> list:
         """
         列出所有页面信息
@@ -18,9 +18,13 @@ from templates.html_templates import HTMLTemplates
 class TemplateGenerator:
     """HTML模板生成器类"""
     
-    def __init__(self, config: Dict[str, Any], platform_type: str = "mobile"):
+    # 页面外壳文件（shell布局下所有页面共享）
+    SHELL_FILES = {"mobile": "shell-mobile.html", "pc": "shell-pc.html"}
+    
+    def __init__(self, config: Dict[str, Any], platform_type: str = "mobile", layout: str = "standalone"):
         self.config = config
         self.platform_type = platform_type
+        self.layout = layout
         self.html_templates = HTMLTemplates()
     
     def generate_index_html(self) -> str:
@@ -31,8 +35,35 @@ class TemplateGenerator:
             str: index.html文件内容
         """
         index_content = self.html_templates.get_index_template()
+        if self.layout == "shell":
+            # shell布局：通过页面外壳加载页面片段
+            index_content = index_content.replace(
+                "document.getElementById('preview').src = url;",
+                f"document.getElementById('preview').src = '{self.get_shell_filename()}?page=' + encodeURIComponent(url);"
+            )
         return index_content.replace("原型导航", f"{self.config['project_name']} - 原型导航")
     
+    def get_shell_filename(self) -> str:
+        """
+        获取当前平台的页面外壳文件名
+        
+        Returns:
+            str: 页面外壳文件名（相对于项目根目录）
+        """
+        return self.SHELL_FILES[self.platform_type]
+    
+    def generate_shell_html(self) -> str:
+        """
+        生成页面外壳文件内容（shell布局）
+        
+        Returns:
+            str: 页面外壳HTML内容
+        """
+        if self.platform_type == "mobile":
+            return self.html_templates.get_mobile_shell_template()
+        else:
+            return self.html_templates.get_pc_shell_template()
+    
     def generate_page_html(self, page_name: str, page_description: str, 
                           role_name: str, module_name: str) -> str:
         """
@@ -45,8 +76,11 @@ class TemplateGenerator:
             module_name: 模块名称
             
         Returns:
-            str: 页面HTML内容
+            str: 页面HTML内容（shell布局下为页面片段）
         """
+        if self.layout == "shell":
+            return self.generate_page_fragment(page_name, page_description, role_name, module_name)
+        
         if self.platform_type == "mobile":
             return self.html_templates.get_mobile_page_template(
                 page_name, page_description, role_name, module_name
@@ -56,6 +90,29 @@ class TemplateGenerator:
                 page_name, page_description, role_name, module_name
             )
     
+    def generate_page_fragment(self, page_name: str, page_description: str, 
+                               role_name: str, module_name: str) -> str:
+        """
+        生成页面片段（shell布局下由页面外壳加载）
+        
+        Args:
+            page_name: 页面名称
+            page_description: 页面描述
+            role_name: 角色名称
+            module_name: 模块名称
+            
+        Returns:
+            str: 页面片段HTML
+        """
+        if self.platform_type == "mobile":
+            return self.html_templates.get_mobile_page_content(
+                page_name, page_description, role_name, module_name
+            )
+        else:
+            return self.html_templates.get_pc_page_content(
+                page_name, page_description, role_name, module_name
+            )
+    
     def generate_page_content_only(self, page_name: str, page_description: str, 
                                   role_name: str, module_name: str) -> str:
         """
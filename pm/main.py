@@ -30,6 +30,9 @@ from generators.style_manager import StyleManager
 from generators.script_manager import ScriptManager
 from utils.file_manager import FileManager
 from utils.cli_parser import CLIParser
+from utils.asset_pipeline import AssetPipeline
+from utils.dev_server import DevServer
+from utils.bundle_exporter import BundleExporter
 
 
 class PrototypeGenerator:
@@ -70,6 +73,29 @@ class PrototypeGenerator:
                 if not self._update_page(args):
                     return
                 self._print_update_success_info(args)
+            elif hasattr(args, 'undo_page') and args.undo_page:
+                # 页面撤销模式
+                if not self._undo_page(args):
+                    return
+            elif hasattr(args, 'page_history') and args.page_history:
+                # 页面历史模式
+                if not self._show_page_history(args):
+                    return
+            elif hasattr(args, 'import_dir') and args.import_dir:
+                # 批量导入模式
+                if not self._import_pages(args):
+                    return
+            elif (hasattr(args, 'build_assets') and args.build_assets) or (hasattr(args, 'precompress') and args.precompress):
+                # 静态资源构建模式
+                if not self._build_assets(args):
+                    return
+                self._print_build_success_info(args)
+            elif hasattr(args, 'serve') and args.serve:
+                # 预览服务模式
+                DevServer(args.name, args.port).serve()
+            elif hasattr(args, 'single_file') and args.single_file:
+                # 单文件导出模式
+                BundleExporter(args.name).export(args.single_file)
             else:
                 # 项目创建模式
                 # 加载配置
@@ -117,7 +143,8 @@ class PrototypeGenerator:
             return False
         
         # 创建生成器
-        template_generator = TemplateGenerator(config, args.platform)
+        layout = getattr(args, 'layout', 'standalone')
+        template_generator = TemplateGenerator(config, args.platform, layout)
         style_manager = StyleManager(args.platform)
         script_manager = ScriptManager()
         
@@ -130,6 +157,8 @@ class PrototypeGenerator:
             ("design-standards.md", template_generator.generate_design_standards()),
             ("README.md", template_generator.generate_readme()),
         ]
+        if layout == "shell":
+            files_to_create.append((template_generator.get_shell_filename(), template_generator.generate_shell_html()))
         
         # 写入所有文件
         for filename, content in files_to_create:
@@ -191,7 +220,8 @@ class PrototypeGenerator:
                 page_desc,
                 role_name,
                 module_name,
-                keep_source
+                keep_source,
+                not getattr(args, 'no_validate', False)
             ):
                 return False
             print(f"✅ 页面 '{args.update_page}' 内容已更新（{platform_type}模式）")
@@ -200,6 +230,159 @@ class PrototypeGenerator:
         if not self.config_manager.save_menu_json(args.name):
             return False
         
+        # 已构建的项目需要同步刷新静态资源
+        return self._refresh_assets(args.name)
+    
+    def _import_pages(self, args) -> bool:
+        """批量导入页面内容"""
+        import json
+        from datetime import datetime
+        
+        # 创建文件管理器
+        file_manager = FileManager(args.name)
+        
+        # 加载现有的menu.json配置（整个导入过程只加载和保存一次）
+        if not self.config_manager.load_menu_json(args.name):
+            return False
+        
+        # 读取映射文件：片段文件名 -> 页面名称
+        import_map = {}
+        if getattr(args, 'import_map', None):
+            with open(args.import_map, 'r', encoding='utf-8') as f:
+                import_map = json.load(f)
+        
+        pages_by_name = {page['name']: page for page in self.config_manager.list_all_pages()}
+        pages_by_url = {page['url']: page for page in pages_by_name.values() if page.get('url')}
+        
+        # 匹配片段与页面：映射文件 > 页面名称 > 与pages/目录一致的相对路径
+        import_dir = Path(args.import_dir)
+        updates = []
+        unmatched = []
+        missing_url = []
+        for fragment in sorted(import_dir.rglob('*.html')):
+            relative = fragment.relative_to(import_dir).as_posix()
+            page = None
+            if relative in import_map or fragment.name in import_map:
+                page = pages_by_name.get(import_map.get(relative, import_map.get(fragment.name)))
+            elif fragment.stem in pages_by_name:
+                page = pages_by_name[fragment.stem]
+            else:
+                page = pages_by_url.get(f"pages/{relative}")
+            
+            if not page:
+                unmatched.append(relative)
+                continue
+            
+            # 通过 --add-page 新增的页面在menu.json中没有url，无法定位页面文件
+            if not page.get('url'):
+                print(f"⚠️  页面 '{page['name']}' 在menu.json中缺少url，已跳过: {relative}")
+                missing_url.append(relative)
+                continue
+            
+            updates.append({
+                "page_url": page['url'],
+                "content_file": str(fragment),
+                "page_name": page['name'],
+                "page_desc": f"{page['name']}页面",
+                "role_name": page['role_name'],
+                "module_name": page['module_name']
+            })
+        
+        for relative in unmatched:
+            print(f"⚠️  未找到与片段匹配的页面，已跳过: {relative}")
+        
+        if not updates:
+            print("❌ 没有可导入的页面片段")
+            return False
+        
+        # 并行包装并写入页面
+        platform_type = getattr(args, 'platform', 'mobile')
+        keep_source = getattr(args, 'keep_source', False)
+        results = file_manager.import_page_contents(
+            updates, platform_type, keep_source, validate=not getattr(args, 'no_validate', False)
+        )
+        
+        # 更新页面状态
+        imported = [update for update in updates if results.get(update['page_url']) in ('updated', 'unchanged')]
+        unchanged = [update for update in imported if results[update['page_url']] == 'unchanged']
+        invalid = [update for update in updates if results.get(update['page_url']) == 'invalid']
+        if getattr(args, 'status', None):
+            for update in imported:
+                page_info = self.config_manager.find_page_by_url(update['page_url'])
+                page_info['status'] = args.status
+                if args.status == 'completed':
+                    page_info['completed_at'] = datetime.now().isoformat()
+        
+        # 保存更新后的menu.json
+        if not self.config_manager.save_menu_json(args.name):
+            return False
+        
+        print(f"\n🎉 批量导入完成!")
+        print(f"📄 项目: {args.name}")
+        print(f"📝 已导入页面: {len(imported)}/{len(updates)} 个（{platform_type}模式）")
+        if unchanged:
+            print(f"⏭️  内容未变化已跳过写入: {len(unchanged)} 个")
+        if invalid:
+            print(f"❌ 结构校验未通过未写入: {len(invalid)} 个")
+        if unmatched:
+            print(f"⚠️  未匹配片段: {len(unmatched)} 个")
+        if missing_url:
+            print(f"⚠️  页面缺少url未导入: {len(missing_url)} 个")
+        if getattr(args, 'status', None):
+            print(f"📊 状态: {args.status}")
+        
+        # 已构建的项目需要同步刷新静态资源（所有页面均未变化时无需刷新）
+        if len(unchanged) < len(imported) and not self._refresh_assets(args.name):
+            return False
+        
+        return len(imported) == len(updates)
+    
+    def _undo_page(self, args) -> bool:
+        """撤销页面更新（从撤销日志重建历史版本）"""
+        if not self.config_manager.load_menu_json(args.name):
+            return False
+        
+        page_info = self.config_manager.find_page_by_name(args.undo_page)
+        if not page_info:
+            print(f"❌ 未找到页面: {args.undo_page}")
+            return False
+        
+        try:
+            version = FileManager(args.name).page_journal.undo(page_info['url'], args.to_version)
+        except ValueError as e:
+            print(f"❌ 撤销失败: {e}")
+            return False
+        if version is None:
+            print(f"❌ 页面 '{args.undo_page}' 没有可恢复的版本")
+            return False
+        
+        print(f"✅ 页面 '{args.undo_page}' 已恢复到版本 {version}")
+        
+        # 已构建的项目需要同步刷新静态资源
+        return self._refresh_assets(args.name)
+    
+    def _show_page_history(self, args) -> bool:
+        """查看页面历史版本"""
+        if not self.config_manager.load_menu_json(args.name):
+            return False
+        
+        page_info = self.config_manager.find_page_by_name(args.page_history)
+        if not page_info:
+            print(f"❌ 未找到页面: {args.page_history}")
+            return False
+        
+        versions = FileManager(args.name).page_journal.history(page_info['url'])
+        if not versions:
+            print(f"📝 页面 '{args.page_history}' 暂无历史记录")
+            return True
+        
+        action_text = {"initial": "初始版本", "update": "内容更新", "undo": "撤销恢复", "external": "外部修改"}
+        print(f"📜 页面 '{args.page_history}' 的历史版本（{page_info['url']}）:")
+        for version in reversed(versions):
+            marker = "  ← 当前" if version['current'] else ""
+            created_at = version['created_at'][:19].replace('T', ' ') if version['created_at'] else "-"
+            print(f"   #{version['version']:<4} {created_at:<19}  {action_text.get(version['action'], version['action']):<6}"
+                  f"  {version['size']} 字节{marker}")
         return True
     
     def _add_page(self, args) -> bool:
@@ -236,7 +419,8 @@ class PrototypeGenerator:
         if not self.config_manager.save_menu_json(args.name):
             return False
         
-        return True
+        # 已构建的项目需要同步刷新静态资源
+        return self._refresh_assets(args.name)
     
     def _add_module(self, args) -> bool:
         """新增模块"""
@@ -293,7 +477,8 @@ class PrototypeGenerator:
         if not self.config_manager.save_menu_json(args.name):
             return False
         
-        return True
+        # 已构建的项目需要同步刷新静态资源
+        return self._refresh_assets(args.name)
     
     def _add_role(self, args) -> bool:
         """新增角色"""
@@ -340,7 +525,22 @@ class PrototypeGenerator:
         if not self.config_manager.save_menu_json(args.name):
             return False
         
-        return True
+        # 已构建的项目需要同步刷新静态资源
+        return self._refresh_assets(args.name)
+    
+    def _build_assets(self, args) -> bool:
+        """构建静态资源"""
+        asset_pipeline = AssetPipeline(args.name)
+        precompress = True if getattr(args, 'precompress', False) else None
+        return asset_pipeline.run(precompress)
+    
+    def _refresh_assets(self, project_name: str) -> bool:
+        """如果项目已构建过静态资源，则重新构建以覆盖新增或更新的页面"""
+        asset_pipeline = AssetPipeline(project_name)
+        if not asset_pipeline.is_built():
+            return True
+        print("🔄 检测到项目已构建静态资源，正在重新构建...")
+        return asset_pipeline.run()
     
     def _print_update_success_info(self, args):
         """打印页面更新成功信息"""
@@ -391,6 +591,12 @@ class PrototypeGenerator:
         print(f"📱 平台: {platform_text}")
         print(f"📦 已创建默认模块和页面")
     
+    def _print_build_success_info(self, args):
+        """打印静态资源构建成功信息"""
+        print(f"\n🎉 静态资源构建完成!")
+        print(f"📄 项目: {args.name}")
+        print(f"📋 构建清单: {Path(args.name) / AssetPipeline.MANIFEST_NAME}")
+    
     def _print_success_info(self, args):
         """打印成功信息"""
         file_manager = FileManager(args.name)
@@ -399,6 +605,8 @@ class PrototypeGenerator:
         print(f"📱 平台类型: {'手机端' if args.platform == 'mobile' else 'PC端'}")
         if args.platform == 'mobile':
             print("📱 已包含iPhone手机壳模板")
+        if getattr(args, 'layout', 'standalone') == 'shell':
+            print("🧩 页面布局: 共享页面外壳 + 页面片段")
         
         print("\n🎉 重构版本特性:")
         print("   ✅ 模块化架构，代码更清晰易维护")
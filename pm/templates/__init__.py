@@ -6,5 +6,6 @@
 from .html_templates import HTMLTemplates
 from .css_templates import CSSTemplates
 from .js_templates import JSTemplates
+from .icon_templates import IconTemplates
 
-__all__ = ['HTMLTemplates', 'CSSTemplates', 'JSTemplates']
\ No newline at end of file
+__all__ = ['HTMLTemplates', 'CSSTemplates', 'JSTemplates', 'IconTemplates']
\ No newline at end of file
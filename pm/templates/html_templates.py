@@ -496,7 +496,15 @@ class HTMLTemplates:
   </script>
 </head>
 <body class="font-sans bg-gray-custom">
-  <div class="max-w-6xl mx-auto p-5">
+  {HTMLTemplates.get_pc_page_content(page_name, page_description, role_name, module_name)}
+</body>
+</html>'''
+    
+    @staticmethod
+    def get_pc_page_content(page_name: str, page_description: str, 
+                           role_name: str, module_name: str) -> str:
+        """获取PC端页面内容 - 仅返回body内的页面内容部分"""
+        return f'''<div class="max-w-6xl mx-auto p-5">
     <div class="border-b-2 border-text-primary pb-2 mb-5">
       <div class="text-text-secondary text-sm mb-2">
         <i class="fas fa-home mr-1"></i>{role_name} > {module_name}
@@ -557,6 +565,151 @@ class HTMLTemplates:
         <p><i class="fas fa-lightbulb mr-2 text-orange-500"></i><strong>设计说明：</strong>这是一个低保真线稿页面，展示了页面的基本布局和功能区域划分。实际开发时需要根据具体需求进行详细设计。</p>
       </div>
     </div>
+  </div>'''
+    
+    @staticmethod
+    def get_shell_loader_script() -> str:
+        """获取页面外壳的片段加载脚本 - 按 ?page= 参数加载页面片段并插入到 #page-body"""
+        return '''<script id="shell-loader">
+    (function () {
+      const page = new URLSearchParams(location.search).get('page');
+      const container = document.getElementById('page-body');
+      if (!page) {
+        container.innerHTML = '<p class="p-4 text-text-secondary">未指定页面</p>';
+        return;
+      }
+
+      // 页面标题与独立页面一致：页面名称 - 角色名称
+      fetch(new URL('menu.json', location.href))
+        .then(response => response.json())
+        .then(menu => {
+          menu.forEach(role => (role.modules || []).forEach(module => (module.pages || []).forEach(item => {
+            if (item.url === page) document.title = item.name + ' - ' + role.name;
+          })));
+        })
+        .catch(() => {});
+
+      const pageUrl = new URL(page, location.href);
+      fetch(pageUrl)
+        .then(response => {
+          if (!response.ok) throw new Error(response.status);
+          return response.text();
+        })
+        .then(html => {
+          const template = document.createElement('template');
+          template.innerHTML = html;
+
+          // 片段中的相对地址以片段文件所在目录为基准
+          template.content.querySelectorAll('[src], [href]').forEach(el => {
+            ['src', 'href'].forEach(attr => {
+              const value = el.getAttribute(attr);
+              if (value && !/^(#|[a-z][a-z0-9+.-]*:|\\/)/i.test(value)) {
+                el.setAttribute(attr, new URL(value, pageUrl).href);
+              }
+            });
+          });
+
+          // 通过innerHTML解析的脚本不会执行，重新创建后按顺序执行
+          template.content.querySelectorAll('script').forEach(original => {
+            const script = document.createElement('script');
+            Array.from(original.attributes).forEach(attr => script.setAttribute(attr.name, attr.value));
+            script.async = false;
+            script.textContent = original.textContent;
+            original.replaceWith(script);
+          });
+
+          container.replaceChildren(template.content);
+        })
+        .catch(error => {
+          // 浏览器不允许通过 file:// 读取页面片段，需经由预览服务访问
+          const message = document.createElement('p');
+          message.className = 'p-4 text-text-secondary';
+          message.textContent = location.protocol === 'file:'
+            ? '页面片段无法通过 file:// 直接打开，请使用 python main.py -n <项目名> --serve 启动预览服务后访问，或使用 --single-file 导出单文件原型'
+            : '页面加载失败: ' + page + ' (' + error.message + ')';
+          container.replaceChildren(message);
+        });
+    })();
+  </script>'''
+    
+    @staticmethod
+    def get_mobile_shell_template() -> str:
+        """获取手机端页面外壳模板 - 共享的手机框架，页面内容由片段加载"""
+        return f'''<!DOCTYPE html>
+<html lang="zh">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>手机页面框架</title>
+  <script src="https://cdn.tailwindcss.com"></script>
+  <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+  <link rel="stylesheet" href="style.css">
+  <script>
+    tailwind.config = {{
+      theme: {{
+        extend: {{
+          colors: {{
+            'gray-custom': '#f5f5f5',
+            'border-custom': '#cccccc',
+            'text-primary': '#333333',
+            'text-secondary': '#666666'
+          }}
+        }}
+      }}
+    }}
+  </script>
+</head>
+<body class="m-0 p-0 font-sans bg-gray-custom">
+  <div class="iphone-frame">
+    <div class="iphone-screen">
+      <div class="status-bar">
+        <div class="status-left">
+          <span class="carrier">中国移动</span>
+          <i class="fas fa-wifi" style="font-size: 11px; margin: 0 3px;"></i>
+        </div>
+        <div class="status-center">
+          <span class="time">9:41</span>
+        </div>
+        <div class="status-right">
+          <span class="battery">100%</span>
+        </div>
+      </div>
+      
+      <div class="page-content" id="page-body"></div>
+    </div>
   </div>
+  {HTMLTemplates.get_shell_loader_script()}
 </body>
-</html>'''
\ No newline at end of file
+</html>'''
+    
+    @staticmethod
+    def get_pc_shell_template() -> str:
+        """获取PC端页面外壳模板 - 共享的页面头部，页面内容由片段加载"""
+        return f'''<!DOCTYPE html>
+<html lang="zh">
+<head>
+  <meta charset="UTF-8">
+  <title>页面框架</title>
+  <script src="https://cdn.tailwindcss.com"></script>
+  <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+  <link rel="stylesheet" href="style.css">
+  <script>
+    tailwind.config = {{
+      theme: {{
+        extend: {{
+          colors: {{
+            'gray-custom': '#f5f5f5',
+            'border-custom': '#cccccc',
+            'text-primary': '#333333',
+            'text-secondary': '#666666'
+          }}
+        }}
+      }}
+    }}
+  </script>
+</head>
+<body class="font-sans bg-gray-custom">
+  <div id="page-body"></div>
+  {HTMLTemplates.get_shell_loader_script()}
+</body>
+</html>'''
@@ -0,0 +1,153 @@
+"""
+图标模板定义
+内置的低保真线稿图标集（24x24 SVG路径），用于替代CDN加载的完整Font Awesome
+"""
+
+from typing import Optional
+
+
+class IconTemplates:
+    """图标模板类"""
+
+    VIEW_BOX = "0 0 24 24"
+
+    # 图标名称（不含 fa- 前缀） -> SVG路径（fill-rule: evenodd）
+    ICONS = {
+        'user': 'M12 12a5 5 0 1 0 0-10 5 5 0 0 0 0 10zM3 22a9 7 0 0 1 18 0z',
+        'users': 'M9 11a4 4 0 1 0 0-8 4 4 0 0 0 0 8zM1 21a8 6 0 0 1 16 0zM17 11a3 3 0 1 0 0-6 '
+                 '3 3 0 0 0 0 6zm1.5 2a6 5 0 0 1 5.5 8h-4.5a9 8 0 0 0-3-7.3 6 6 0 0 1 2-.7z',
+        'user-circle': 'M12 2a10 10 0 1 0 0 20 10 10 0 0 0 0-20zm0 4a3.5 3.5 0 1 1 0 7 3.5 3.5 0 0 1 '
+                       '0-7zm0 14a8 8 0 0 1-6-2.7c1-2 3.3-3.3 6-3.3s5 1.3 6 3.3a8 8 0 0 1-6 2.7z',
+        'user-cog': 'M10 12a5 5 0 1 0 0-10 5 5 0 0 0 0 10zM2 22a8 7 0 0 1 12.5-5.8A5 5 0 0 0 14 22zm16-7a3 '
+                    '3 0 1 0 0 6 3 3 0 0 0 0-6zm0 2a1 1 0 1 1 0 2 1 1 0 0 1 0-2z',
+        'folder': 'M2 5a2 2 0 0 1 2-2h6l2 2h8a2 2 0 0 1 2 2v11a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2z',
+        'folder-open': 'M2 5a2 2 0 0 1 2-2h6l2 2h6a2 2 0 0 1 2 2v2H7.5a2 2 0 0 0-1.9 1.4L3 18.5zm4.5 '
+                       '6h16l-3 9H3.5z',
+        'file-alt': 'M6 2h8l6 6v12a2 2 0 0 1-2 2H6a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2zm7 1.5V9h5.5zM8 '
+                    '12v2h8v-2zm0 4v2h8v-2z',
+        'file-image': 'M6 2h8l6 6v12a2 2 0 0 1-2 2H6a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2zm1 17h10l-3.5-5-2.5 '
+                      '3-1.5-1.5zm2.5-7a1.5 1.5 0 1 0 0-3 1.5 1.5 0 0 0 0 3z',
+        'file-pdf': 'M6 2h8l6 6v12a2 2 0 0 1-2 2H6a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2zm1 11v5h10v-5z',
+        'home': 'M12 3l10 9h-3v9h-5v-6h-4v6H5v-9H2z',
+        'wifi': 'M12 18a2 2 0 1 1 0 4 2 2 0 0 1 0-4zM1 9a16 16 0 0 1 22 0l-2 2a13 13 0 0 0-18 0zm4 '
+                '4a10.5 10.5 0 0 1 14 0l-2 2a7.5 7.5 0 0 0-10 0z',
+        'cog': 'M11.5 2 13.5 2.1 14.5 4.9 15.9 5.6 18.7 4.6 20 6 18.8 8.8 19.3 10.2 22 11.5 21.9 13.5 '
+               '19.1 14.5 18.4 15.9 19.4 18.7 18 20 15.2 18.8 13.8 19.3 12.5 22 10.5 21.9 9.5 19.1 8.1 '
+               '18.4 5.3 19.4 4 18 5.2 15.2 4.7 13.8 2 12.5 2.1 10.5 4.9 9.5 5.6 8.1 4.6 5.3 6 4 8.8 '
+               '5.2 10.2 4.7zM12 9a3 3 0 1 0 0 6 3 3 0 1 0 0-6z',
+        'cogs': 'M8.6 1 10.2 1.1 11 3.4 12.1 3.9 14.4 3.1 15.4 4.2 14.4 6.4 14.8 7.5 17 8.6 16.9 10.2 '
+                '14.6 11 14.1 12.1 14.9 14.4 13.8 15.4 11.6 14.4 10.5 14.8 9.4 17 7.8 16.9 7 14.6 5.9 '
+                '14.1 3.6 14.9 2.6 13.8 3.6 11.6 3.2 10.5 1 9.4 1.1 7.8 3.4 7 3.9 5.9 3.1 3.6 4.2 2.6 '
+                '6.4 3.6 7.5 3.2zM9 6.5a2.5 2.5 0 1 0 0 5 2.5 2.5 0 1 0 0-5zM18.2 13.5 19.5 13.6 20.2 '
+                '15.1 21 15.6 22.7 15.7 23.2 16.9 22.3 18.3 22.2 19.2 23 20.7 22.3 21.8 20.6 21.7 19.7 '
+                '22.1 18.8 23.5 17.5 23.4 16.8 21.9 16 21.4 14.3 21.3 13.8 20.1 14.7 18.7 14.8 17.8 14 '
+                '16.3 14.7 15.2 16.4 15.3 17.3 14.9zM18.5 17a1.5 1.5 0 1 0 0 3 1.5 1.5 0 1 0 0-3z',
+        'cube': 'M12 2l9 5v10l-9 5-9-5V7zm0 2.3L5.5 8 12 11.7 18.5 8zM5 9.7v6.1l6 3.4v-6.1zm14 0l-6 '
+                '3.4v6.1l6-3.4z',
+        'tools': 'M21 6.5a5 5 0 0 1-6.6 4.7L6 19.6a2 2 0 0 1-2.8-2.8l8.4-8.4A5 5 0 0 1 17.5 2l-3 3 .5 3 '
+                 '3 .5z',
+        'puzzle-piece': 'M4 6h4.5a2.5 2.5 0 0 1 5 0H18v4.5a2.5 2.5 0 0 1 0 5V20H4z',
+        'mouse-pointer': 'M5 2l14 11h-6.5l3.5 7.5-2.7 1.2-3.5-7.6L5 19z',
+        'play': 'M7 4l13 8-13 8z',
+        'arrow-left': 'M10 5l-7 7 7 7 1.4-1.4L6.8 13H21v-2H6.8l4.6-4.6z',
+        'arrow-right': 'M14 5l7 7-7 7-1.4-1.4 4.6-4.6H3v-2h14.2l-4.6-4.6z',
+        'info-circle': 'M12 2a10 10 0 1 0 0 20 10 10 0 0 0 0-20zm-1 8h2v7h-2zm1-4a1.3 1.3 0 1 1 0 2.6 '
+                       '1.3 1.3 0 0 1 0-2.6z',
+        'question-circle': 'M12 2a10 10 0 1 0 0 20 10 10 0 0 0 0-20zm-1 14h2v2h-2zm1-10a3.5 3.5 0 0 1 1 '
+                           '6.9V14h-2v-3h1a1.5 1.5 0 1 0-1.5-1.5h-2A3.5 3.5 0 0 1 12 6z',
+        'exclamation-triangle': 'M12 2l11 19H1zm-1 7v6h2V9zm0 8v2h2v-2z',
+        'bullseye': 'M12 2a10 10 0 1 0 0 20 10 10 0 0 0 0-20zm0 3a7 7 0 1 1 0 14 7 7 0 0 1 0-14zm0 '
+                    '3a4 4 0 1 0 0 8 4 4 0 0 0 0-8zm0 2.5a1.5 1.5 0 1 1 0 3 1.5 1.5 0 0 1 0-3z',
+        'lightbulb': 'M12 2a7 7 0 0 0-4 12.7V17h8v-2.3A7 7 0 0 0 12 2zM9 18h6v2H9zm1 3h4v1h-4z',
+        'check': 'M9 16.2L4.8 12l-1.4 1.4L9 19 21 7l-1.4-1.4z',
+        'times': 'M6.4 5L12 10.6 17.6 5 19 6.4 13.4 12 19 17.6 17.6 19 12 13.4 6.4 19 5 17.6 10.6 12 '
+                 '5 6.4z',
+        'chevron-up': 'M12 7l8 8-1.6 1.6L12 10.2l-6.4 6.4L4 15z',
+        'chevron-down': 'M12 17l8-8-1.6-1.6L12 13.8 5.6 7.4 4 9z',
+        'search': 'M10 3a7 7 0 1 0 4.2 12.6l5.6 5.6 1.4-1.4-5.6-5.6A7 7 0 0 0 10 3zm0 2a5 5 0 1 1 0 10 '
+                  '5 5 0 0 1 0-10z',
+        'save': 'M4 3h13l4 4v13a1 1 0 0 1-1 1H4a1 1 0 0 1-1-1V4a1 1 0 0 1 1-1zm2 2v5h10V5zm6 9a2.5 '
+                '2.5 0 1 0 0 5 2.5 2.5 0 0 0 0-5z',
+        'edit': 'M3 17.2V21h3.8L17.8 10l-3.8-3.8zM20.7 7.1a1 1 0 0 0 0-1.4l-2.4-2.4a1 1 0 0 0-1.4 '
+                '0l-1.8 1.8 3.8 3.8z',
+        'trash': 'M9 3h6l1 1h4v2H4V4h4zM5 7h14l-1 14H6zm4 3v8h2v-8zm4 0v8h2v-8z',
+        'upload': 'M11 16V7.8L7.4 11.4 6 10l6-6 6 6-1.4 1.4L13 7.8V16zM4 18h16v2H4z',
+        'download': 'M11 4v8.2l-3.6-3.6L6 10l6 6 6-6-1.4-1.4-3.6 3.6V4zM4 18h16v2H4z',
+        'star': 'M12 2l3.1 6.3 6.9 1-5 4.9 1.2 6.8L12 17.8 5.8 21l1.2-6.8-5-4.9 6.9-1z',
+        'heart': 'M12 21l-1.5-1.3C5 14.8 2 12 2 8.5a5 5 0 0 1 5-5c1.9 0 3.7.9 5 2.3a6.6 6.6 0 0 1 5-2.3 '
+                 '5 5 0 0 1 5 5c0 3.5-3 6.3-8.5 11.2z',
+        'shopping-cart': 'M1 3h3.3l.8 3H22l-2.4 8H7.6l-.6 2H20v2H5.3L7 12.2 4.5 5H1zm7 16a1.5 1.5 0 1 1 '
+                         '0 3 1.5 1.5 0 0 1 0-3zm10 0a1.5 1.5 0 1 1 0 3 1.5 1.5 0 0 1 0-3z',
+        'sort': 'M12 3l6 7H6zm0 18l-6-7h12z',
+        'filter': 'M3 4h18l-7 8.5V19l-4 2v-8.5z',
+        'desktop': 'M2 4h20v12H2zm2 2v8h16V6zm5 12h6l1 2H8z',
+        'mobile-alt': 'M7 2h10a2 2 0 0 1 2 2v16a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2zm0 '
+                      '3v13h10V5zm4 14h2v1.5h-2z',
+        'plus': 'M11 4h2v7h7v2h-7v7h-2v-7H4v-2h7z',
+        'minus': 'M4 11h16v2H4z',
+        'bars': 'M3 5h18v2H3zm0 6h18v2H3zm0 6h18v2H3z',
+        'bell': 'M12 2a6 6 0 0 0-6 6v5l-2 3v1h16v-1l-2-3V8a6 6 0 0 0-6-6zm-2 17a2 2 0 0 0 4 0z',
+        'envelope': 'M2 5h20v14H2zm2 2v.5l8 5 8-5V7zm0 2.9V17h16V9.9l-8 5z',
+        'lock': 'M7 10V7a5 5 0 0 1 10 0v3h2v12H5V10zm2 0h6V7a3 3 0 0 0-6 0z',
+        'eye': 'M12 5C6 5 2 12 2 12s4 7 10 7 10-7 10-7-4-7-10-7zm0 3a4 4 0 1 1 0 8 4 4 0 0 1 0-8z',
+        'spinner': 'M12 2a10 10 0 1 0 10 10h-3a7 7 0 1 1-7-7z',
+    }
+
+    # Font Awesome 6 的新名称 -> 内置图标名称
+    ALIASES = {
+        'house': 'home', 'file-lines': 'file-alt', 'gear': 'cog', 'gears': 'cogs',
+        'xmark': 'times', 'close': 'times', 'circle-info': 'info-circle',
+        'circle-question': 'question-circle', 'triangle-exclamation': 'exclamation-triangle',
+        'magnifying-glass': 'search', 'pen-to-square': 'edit', 'trash-can': 'trash',
+        'floppy-disk': 'save', 'arrow-pointer': 'mouse-pointer', 'cart-shopping': 'shopping-cart',
+        'mobile-screen-button': 'mobile-alt', 'circle-user': 'user-circle', 'user-gear': 'user-cog',
+        'screwdriver-wrench': 'tools', 'navicon': 'bars', 'circle-notch': 'spinner',
+    }
+
+    # 非图标的修饰类及对应样式
+    MODIFIERS = {
+        'fa-fw': 'width: 1.25em',
+        'fa-xs': 'font-size: 0.75em',
+        'fa-sm': 'font-size: 0.875em',
+        'fa-lg': 'font-size: 1.25em',
+        'fa-xl': 'font-size: 1.5em',
+        'fa-2x': 'font-size: 2em',
+        'fa-3x': 'font-size: 3em',
+        'fa-spin': 'animation: fa-spin 2s linear infinite',
+    }
+
+    # 无样式的修饰类（样式类别前缀），收集时直接忽略
+    STYLE_CLASSES = {'fa-solid', 'fa-regular', 'fa-brands', 'fa-light', 'fa-thin', 'fa-duotone'}
+
+    BASE_CSS = '''/* icons.css - 由原型生成工具根据页面实际使用的图标自动生成，请勿手动修改 */
+.fa, .fas, .far, .fab, .fa-solid, .fa-regular {
+  display: inline-block;
+  width: 1em;
+  height: 1em;
+  vertical-align: -0.125em;
+  font-style: normal;
+  background-color: currentColor;
+  -webkit-mask: var(--fa-icon) no-repeat center / contain;
+  mask: var(--fa-icon) no-repeat center / contain;
+}
+@keyframes fa-spin { to { transform: rotate(360deg); } }'''
+
+    @classmethod
+    def resolve(cls, name: str) -> Optional[str]:
+        """
+        获取图标的规范名称
+
+        Args:
+            name: 图标名称（不含 fa- 前缀）
+
+        Returns:
+            Optional[str]: 内置图标名称，不存在时返回None
+        """
+        name = cls.ALIASES.get(name, name)
+        return name if name in cls.ICONS else None
+
+    @classmethod
+    def get_icon_svg(cls, name: str) -> str:
+        """获取图标的完整SVG"""
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{cls.VIEW_BOX}">'
+                f'<path fill-rule="evenodd" d="{cls.ICONS[name]}"/></svg>')
@@ -0,0 +1,9 @@
+"""
+测试公共配置
+将 pm 目录加入导入路径，与各工具脚本的 `from utils.x import ...` 导入方式一致
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
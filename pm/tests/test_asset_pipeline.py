@@ -0,0 +1,99 @@
+"""静态资源构建流水线测试"""
+
+import json
+
+from utils.asset_pipeline import AssetPipeline
+
+PAGE_TEMPLATE = '''<!DOCTYPE html>
+<html>
+<head>
+  <script src="https://cdn.tailwindcss.com"></script>
+  <script>
+    tailwind.config = {}
+  </script>
+</head>
+<body class="%s"></body>
+</html>
+'''
+
+
+def make_project(tmp_path, body_class):
+    """创建只有一个页面的最小项目"""
+    page = tmp_path / 'pages' / 'page1.html'
+    page.parent.mkdir(parents=True)
+    page.write_text(PAGE_TEMPLATE % body_class, encoding='utf-8')
+    return page
+
+
+def test_supported_classes_replace_tailwind_cdn(tmp_path):
+    page = make_project(tmp_path, 'p-4 text-sm')
+    assert AssetPipeline(str(tmp_path)).run()
+
+    content = page.read_text(encoding='utf-8')
+    assert 'cdn.tailwindcss.com' not in content
+    assert 'utilities.' in content
+    manifest = json.loads((tmp_path / AssetPipeline.MANIFEST_NAME).read_text(encoding='utf-8'))
+    assert manifest['utilities']['unsupported'] == []
+
+
+def test_unsupported_classes_keep_tailwind_cdn(tmp_path):
+    page = make_project(tmp_path, 'p-4 ring-2')
+    assert AssetPipeline(str(tmp_path)).run()
+
+    assert 'cdn.tailwindcss.com' in page.read_text(encoding='utf-8')
+    manifest = json.loads((tmp_path / AssetPipeline.MANIFEST_NAME).read_text(encoding='utf-8'))
+    assert manifest['utilities']['unsupported'] == ['ring-2']
+
+
+def test_rebuild_restores_cdn_when_unsupported_class_is_added(tmp_path):
+    page = make_project(tmp_path, 'p-4')
+    assert AssetPipeline(str(tmp_path)).run()
+    assert 'cdn.tailwindcss.com' not in page.read_text(encoding='utf-8')
+
+    page.write_text(page.read_text(encoding='utf-8').replace('class="p-4"', 'class="p-4 from-blue-500"'),
+                    encoding='utf-8')
+    assert AssetPipeline(str(tmp_path)).run()
+
+    content = page.read_text(encoding='utf-8')
+    assert 'cdn.tailwindcss.com' in content
+    assert 'utilities.' not in content
+
+
+def test_precompressed_sidecars_share_source_mtime(tmp_path):
+    page = make_project(tmp_path, 'p-4 ' + 'text-sm ' * 300)
+    assert AssetPipeline(str(tmp_path)).run(precompress=True)
+
+    sidecar = page.with_name(page.name + '.gz')
+    assert sidecar.exists()
+    assert sidecar.stat().st_mtime_ns == page.stat().st_mtime_ns
+
+
+ICON_PAGE_TEMPLATE = '''<!DOCTYPE html>
+<html>
+<head>
+  <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+</head>
+<body><i class="fas %s"></i></body>
+</html>
+'''
+
+
+def test_rebuild_restores_font_awesome_cdn_when_icon_is_missing(tmp_path):
+    page = tmp_path / 'pages' / 'page1.html'
+    page.parent.mkdir(parents=True)
+    page.write_text(ICON_PAGE_TEMPLATE % 'fa-home', encoding='utf-8')
+    assert AssetPipeline(str(tmp_path)).run()
+    content = page.read_text(encoding='utf-8')
+    assert 'font-awesome' not in content
+    assert 'icons.' in content
+
+    page.write_text(content.replace('fa-home', 'fa-dragon'), encoding='utf-8')
+    assert AssetPipeline(str(tmp_path)).run()
+
+    content = page.read_text(encoding='utf-8')
+    assert f'<link rel="stylesheet" href="{AssetPipeline.FONT_AWESOME_CDN_URL}">' in content
+    assert 'icons.' not in content
+    manifest = json.loads((tmp_path / AssetPipeline.MANIFEST_NAME).read_text(encoding='utf-8'))
+    assert manifest['icons']['missing'] == ['fa-dragon']
+    assert AssetPipeline.ICONS_CSS not in manifest['assets']
+    assert not list(tmp_path.glob('icons*.css'))
@@ -0,0 +1,168 @@
+"""备份管理器测试"""
+
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+import utils.backup_manager as backup_module
+from utils.backup_manager import BackupManager
+
+
+@pytest.fixture
+def project(tmp_path):
+    """创建包含页面、菜单和样式的最小项目"""
+    root = tmp_path / 'project'
+    for role in ('role1', 'role2'):
+        for page in ('page1', 'page2'):
+            page_file = root / 'pages' / role / 'moduleA' / f'{page}.html'
+            page_file.parent.mkdir(parents=True, exist_ok=True)
+            page_file.write_text(f'<div>{role} {page}</div>\n', encoding='utf-8')
+    (root / 'index.html').write_text('<html></html>\n', encoding='utf-8')
+    (root / 'style.css').write_text('body { margin: 0; }\n', encoding='utf-8')
+    (root / 'menu.json').write_text('[]', encoding='utf-8')
+    return root
+
+
+def test_backup_includes_fingerprinted_assets(project):
+    (project / 'style.1a2b3c4d.css').write_text('body { margin: 0; }\n', encoding='utf-8')
+    (project / 'asset-manifest.json').write_text(
+        json.dumps({'assets': {'style.css': 'style.1a2b3c4d.css'}}), encoding='utf-8')
+    manager = BackupManager(str(project))
+    backup_id = os.path.basename(manager.create_backup('带构建产物'))
+
+    # 重新构建后旧指纹文件被删除，恢复备份时应一并恢复页面引用的旧指纹文件
+    (project / 'style.1a2b3c4d.css').unlink()
+    assert manager.restore_backup(backup_id, confirm=True)
+    assert (project / 'style.1a2b3c4d.css').read_text(encoding='utf-8') == 'body { margin: 0; }\n'
+    assert (project / 'asset-manifest.json').exists()
+
+
+def test_backup_skips_precompressed_sidecars(project):
+    page = project / 'pages' / 'role1' / 'moduleA' / 'page1.html'
+    page.with_name('page1.html.gz').write_bytes(b'compressed')
+    page.with_name('page1.html.br').write_bytes(b'compressed')
+    # 没有对应源文件的 .gz 文件属于项目内容，照常备份
+    (project / 'pages' / 'role1' / 'data.json.gz').write_bytes(b'data')
+
+    manager = BackupManager(str(project))
+    backup_id = os.path.basename(manager.create_backup('预压缩'))
+    manifest = manager._load_manifest(backup_id)
+    assert 'pages/role1/moduleA/page1.html' in manifest
+    assert 'pages/role1/moduleA/page1.html.gz' not in manifest
+    assert 'pages/role1/moduleA/page1.html.br' not in manifest
+    assert 'pages/role1/data.json.gz' in manifest
+
+
+def test_backups_in_same_second_get_unique_ids(project, monkeypatch):
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2024, 1, 1, 12, 0, 0)
+
+    monkeypatch.setattr(backup_module, 'datetime', FrozenDatetime)
+    manager = BackupManager(str(project))
+    first = os.path.basename(manager.create_backup('第一次'))
+    (project / 'style.css').write_text('body { margin: 1px; }\n', encoding='utf-8')
+    second = os.path.basename(manager.create_backup('第二次'))
+
+    assert first != second
+    assert {backup['backup_id'] for backup in manager.list_backups()} == {first, second}
+    assert manager.restore_backup(first, confirm=True)
+    assert (project / 'style.css').read_text(encoding='utf-8') == 'body { margin: 0; }\n'
+
+
+def test_html_diff_escapes_page_names(project, tmp_path):
+    menu = [{"name": "角色", "modules": [{"name": "模块", "pages": [
+        {"name": "<script>alert(1)</script>", "url": "pages/role1/moduleA/page1.html"}]}]}]
+    (project / 'menu.json').write_text(json.dumps(menu, ensure_ascii=False), encoding='utf-8')
+    manager = BackupManager(str(project))
+    first = os.path.basename(manager.create_backup('修改前'))
+    (project / 'pages' / 'role1' / 'moduleA' / 'page1.html').write_text('<div>新内容</div>\n', encoding='utf-8')
+    second = os.path.basename(manager.create_backup('修改后'))
+
+    output = tmp_path / 'diff.html'
+    assert manager.diff_backups(first, second, output_path=str(output))
+    report = output.read_text(encoding='utf-8')
+    assert '<script>alert(1)</script>' not in report
+    assert '&lt;script&gt;alert(1)&lt;/script&gt;' in report
+
+
+@pytest.mark.parametrize('compression', ['gz', 'xz'])
+def test_archive_backup_extract_and_restore(project, tmp_path, monkeypatch, compression):
+    # 较小的压缩分块，使大文件跨越多个分块
+    monkeypatch.setattr(BackupManager, 'ARCHIVE_CHUNK_SIZE', 4096)
+    large = os.urandom(20000)
+    (project / 'pages' / 'role1' / 'data.bin').write_bytes(large)
+    manager = BackupManager(str(project))
+    backup_id = os.path.basename(manager.create_backup('归档', storage='archive', compression=compression))
+
+    output = tmp_path / 'extracted.bin'
+    assert manager.extract_file(backup_id, 'pages/role1/data.bin', str(output))
+    assert output.read_bytes() == large
+    assert manager.extract_file(backup_id, 'pages/role2/moduleA/page2.html', str(tmp_path / 'page.html'))
+    assert (tmp_path / 'page.html').read_text(encoding='utf-8') == '<div>role2 page2</div>\n'
+
+    page = project / 'pages' / 'role1' / 'moduleA' / 'page1.html'
+    page.write_text('<div>已修改</div>\n', encoding='utf-8')
+    (project / 'pages' / 'role1' / 'data.bin').unlink()
+    (project / 'pages' / 'role1' / 'moduleA' / 'page3.html').write_text('<div>新增</div>\n', encoding='utf-8')
+    assert manager.restore_backup(backup_id, confirm=True)
+    assert page.read_text(encoding='utf-8') == '<div>role1 page1</div>\n'
+    assert (project / 'pages' / 'role1' / 'data.bin').read_bytes() == large
+    assert not (project / 'pages' / 'role1' / 'moduleA' / 'page3.html').exists()
+
+
+@pytest.mark.parametrize('storage', ['objects', 'archive'])
+def test_restore_by_path_prefix_and_dry_run(project, storage):
+    manager = BackupManager(str(project))
+    backup_id = os.path.basename(manager.create_backup('按路径恢复', storage=storage))
+    role1_page = project / 'pages' / 'role1' / 'moduleA' / 'page1.html'
+    role2_page = project / 'pages' / 'role2' / 'moduleA' / 'page1.html'
+    role1_page.write_text('<div>role1 已修改</div>\n', encoding='utf-8')
+    role2_page.write_text('<div>role2 已修改</div>\n', encoding='utf-8')
+
+    assert manager.restore_backup(backup_id, paths=['pages/role1'], dry_run=True)
+    assert role1_page.read_text(encoding='utf-8') == '<div>role1 已修改</div>\n'
+
+    assert manager.restore_backup(backup_id, confirm=True, paths=['pages/role1/'])
+    assert role1_page.read_text(encoding='utf-8') == '<div>role1 page1</div>\n'
+    assert role2_page.read_text(encoding='utf-8') == '<div>role2 已修改</div>\n'
+
+
+def test_backup_includes_shell_files(project, tmp_path):
+    (project / 'shell-mobile.html').write_text('<div id="page-body"></div>\n', encoding='utf-8')
+    manager = BackupManager(str(project))
+    backup_id = os.path.basename(manager.create_backup('shell布局'))
+    assert 'shell-mobile.html' in manager._load_manifest(backup_id)
+    assert 'shell-pc.html' not in manager._load_manifest(backup_id)
+
+    (project / 'shell-mobile.html').unlink()
+    assert manager.restore_backup(backup_id, confirm=True)
+    assert (project / 'shell-mobile.html').read_text(encoding='utf-8') == '<div id="page-body"></div>\n'
+
+
+@pytest.mark.parametrize('damage', ['truncate', 'corrupt'])
+def test_restore_from_damaged_archive_fails_cleanly(project, monkeypatch, damage):
+    monkeypatch.setattr(BackupManager, 'ARCHIVE_CHUNK_SIZE', 4096)
+    (project / 'pages' / 'role1' / 'data.bin').write_bytes(os.urandom(20000))
+    manager = BackupManager(str(project))
+    backup_dir = manager.create_backup('损坏的归档', storage='archive')
+    backup_id = os.path.basename(backup_dir)
+    info = json.loads((project.parent / backup_dir / 'backup_info.json').read_text(encoding='utf-8'))
+    archive = project.parent / backup_dir / info['archive']
+    data = archive.read_bytes()
+    if damage == 'truncate':
+        archive.write_bytes(data[:len(data) // 2])
+    else:
+        middle = len(data) // 2
+        archive.write_bytes(data[:middle] + bytes(b ^ 0xFF for b in data[middle:middle + 64]) + data[middle + 64:])
+
+    (project / 'pages' / 'role1' / 'data.bin').unlink()
+    added = project / 'pages' / 'role1' / 'moduleA' / 'page3.html'
+    added.write_text('<div>新增</div>\n', encoding='utf-8')
+    assert not manager.restore_backup(backup_id, confirm=True)
+    # 恢复失败时不删除文件，也不留下临时文件
+    assert added.exists()
+    assert not list(project.rglob('*.tmp'))
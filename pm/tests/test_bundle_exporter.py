@@ -0,0 +1,22 @@
+"""单文件导出器测试"""
+
+from templates.html_templates import HTMLTemplates
+from utils.bundle_exporter import BundleExporter
+
+
+def test_shell_pages_get_page_titles(tmp_path):
+    menu = [{"name": "用户<A>", "modules": [{"name": "账户", "pages": [
+        {"name": "登录", "url": "pages/role1/moduleA/page1.html"},
+        {"name": "注册"}
+    ]}]}]
+    exporter = BundleExporter(str(tmp_path))
+    titles = exporter._collect_page_titles(menu)
+    assert titles == {"pages/role1/moduleA/page1.html": "登录 - 用户<A>"}
+
+    shell_html = BundleExporter.SHELL_LOADER_PATTERN.sub('', HTMLTemplates.get_mobile_shell_template())
+    page_file = tmp_path / 'pages' / 'role1' / 'moduleA' / 'page1.html'
+    html = exporter._compose_shell_page(shell_html, '<div>登录表单</div>', page_file,
+                                        titles["pages/role1/moduleA/page1.html"])
+    assert '<title>登录 - 用户&lt;A&gt;</title>' in html
+    assert '手机页面框架' not in html
+    assert 'href="../../../style.css"' in html
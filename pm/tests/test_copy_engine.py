@@ -0,0 +1,107 @@
+"""并行文件复制引擎测试"""
+
+import errno
+import os
+
+import pytest
+
+from utils.copy_engine import CopyEngine
+
+CONTENT = os.urandom(3 * 1024 * 1024 + 17)
+
+
+def unsupported(*args):
+    raise OSError(errno.EXDEV, "跨文件系统")
+
+
+def copy(tmp_path, monkeypatch, chunk_size=1024 * 1024):
+    """用较小的块复制测试内容，返回 (复制字节数, 目标内容)"""
+    monkeypatch.setattr(CopyEngine, 'COPY_CHUNK_SIZE', chunk_size)
+    src, dst = tmp_path / 'src.bin', tmp_path / 'dst.bin'
+    src.write_bytes(CONTENT)
+    with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+        copied = CopyEngine.copy_fd(fsrc.fileno(), fdst.fileno())
+    return copied, dst.read_bytes()
+
+
+def test_copy_fd_default(tmp_path, monkeypatch):
+    assert copy(tmp_path, monkeypatch) == (len(CONTENT), CONTENT)
+
+
+def test_copy_fd_falls_back_to_sendfile(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, 'copy_file_range', unsupported, raising=False)
+    assert copy(tmp_path, monkeypatch) == (len(CONTENT), CONTENT)
+
+
+def test_copy_fd_falls_back_to_read_write(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, 'copy_file_range', unsupported, raising=False)
+    monkeypatch.setattr(os, 'sendfile', unsupported, raising=False)
+    assert copy(tmp_path, monkeypatch) == (len(CONTENT), CONTENT)
+
+
+def test_copy_fd_fallback_after_partial_copy(tmp_path, monkeypatch):
+    # 内核态复制中途失败时，已复制部分的文件偏移已前移，回退后只复制剩余内容
+    real_copy_file_range = os.copy_file_range if hasattr(os, 'copy_file_range') else None
+    calls = []
+
+    def fail_after_first_chunk(src_fd, dst_fd, size):
+        calls.append(size)
+        if len(calls) > 1 or real_copy_file_range is None:
+            raise OSError(errno.EINVAL, "不支持")
+        return real_copy_file_range(src_fd, dst_fd, size)
+
+    monkeypatch.setattr(os, 'copy_file_range', fail_after_first_chunk, raising=False)
+    monkeypatch.setattr(os, 'sendfile', unsupported, raising=False)
+    assert copy(tmp_path, monkeypatch) == (len(CONTENT), CONTENT)
+
+
+def test_copy_fd_handles_short_writes(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, 'copy_file_range', unsupported, raising=False)
+    monkeypatch.setattr(os, 'sendfile', unsupported, raising=False)
+    real_write = os.write
+    monkeypatch.setattr(os, 'write', lambda fd, data: real_write(fd, data[:4096]))
+    assert copy(tmp_path, monkeypatch) == (len(CONTENT), CONTENT)
+
+
+def test_copy_fd_raises_other_errors(tmp_path, monkeypatch):
+    def no_space(*args):
+        raise OSError(errno.ENOSPC, "磁盘已满")
+
+    monkeypatch.setattr(os, 'copy_file_range', no_space, raising=False)
+    with pytest.raises(OSError) as excinfo:
+        copy(tmp_path, monkeypatch)
+    assert excinfo.value.errno == errno.ENOSPC
+
+
+def test_copy_fd_continues_after_early_zero_return(tmp_path, monkeypatch):
+    # 部分文件系统上 copy_file_range 不报错但提前返回 0，剩余内容由下一种方式复制
+    real_copy_file_range = os.copy_file_range if hasattr(os, 'copy_file_range') else None
+    calls = []
+
+    def stop_after_first_chunk(src_fd, dst_fd, size):
+        calls.append(size)
+        if len(calls) > 1 or real_copy_file_range is None:
+            return 0
+        return real_copy_file_range(src_fd, dst_fd, size)
+
+    monkeypatch.setattr(os, 'copy_file_range', stop_after_first_chunk, raising=False)
+    assert copy(tmp_path, monkeypatch) == (len(CONTENT), CONTENT)
+
+    monkeypatch.setattr(os, 'sendfile', lambda *args: 0, raising=False)
+    assert copy(tmp_path, monkeypatch) == (len(CONTENT), CONTENT)
+
+
+def test_copy_fd_raises_on_short_copy(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, 'copy_file_range', lambda *args: 0, raising=False)
+    monkeypatch.setattr(os, 'sendfile', unsupported, raising=False)
+    real_read = os.read
+    reads = []
+
+    def truncated_read(fd, size):
+        reads.append(size)
+        return real_read(fd, size) if len(reads) == 1 else b''
+
+    monkeypatch.setattr(os, 'read', truncated_read)
+    with pytest.raises(OSError) as excinfo:
+        copy(tmp_path, monkeypatch)
+    assert excinfo.value.errno == errno.EIO
@@ -0,0 +1,13 @@
+"""原型预览开发服务器测试"""
+
+from utils.dev_server import PrototypeRequestHandler
+
+
+def test_accept_encoding_respects_q_values():
+    accepted = PrototypeRequestHandler._accepted_encodings('gzip, br;q=0, deflate;q=0.5')
+    assert accepted == {'gzip': 1.0, 'br': 0.0, 'deflate': 0.5}
+
+
+def test_accept_encoding_wildcard_and_empty_header():
+    assert PrototypeRequestHandler._accepted_encodings('*;q=0.1') == {'*': 0.1}
+    assert PrototypeRequestHandler._accepted_encodings('') == {}
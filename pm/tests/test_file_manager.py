@@ -0,0 +1,88 @@
+"""文件管理器测试"""
+
+import json
+
+import pytest
+
+from utils.copy_engine import CopyEngine
+from utils.file_manager import FileManager
+
+
+def test_new_pages_follow_files_in_module_dir(tmp_path):
+    project = tmp_path / 'project'
+    project.mkdir()
+    config = {"roles": [{"name": "用户", "modules": [{"name": "账户", "pages": [
+        {"name": "登录", "description": "登录页面"},
+        {"name": "注册", "description": "注册页面"}
+    ]}]}]}
+    manager = FileManager(str(project))
+    assert manager.create_page_files(config, lambda name, desc, role, module: f'<div>{name}</div>\n')
+    module_dir = project / 'pages' / '用户' / '账户'
+
+    # 初始页面位于 pages/role1/moduleA，新增页面所在目录从 page1 开始
+    assert manager.create_new_page_file('用户', '账户', '找回密码', '找回密码页面')
+    assert manager.create_new_page_file('用户', '账户', '修改密码', '修改密码页面')
+    (module_dir / 'page1.html').unlink()
+    assert manager.create_new_page_file('用户', '账户', '绑定手机', '绑定手机页面')
+    assert sorted(path.name for path in module_dir.iterdir()) == ['page2.html', 'page3.html']
+
+    meta = json.loads((project / FileManager.PROJECT_META_FILE).read_text(encoding='utf-8'))
+    assert meta['page_counters'] == {'用户/账户': 3}
+
+    # 目录被清空或重建后重新从 page1 开始
+    for page_file in module_dir.iterdir():
+        page_file.unlink()
+    module_dir.rmdir()
+    assert manager.create_new_page_file('用户', '账户', '注销账户', '注销账户页面')
+    assert [path.name for path in module_dir.iterdir()] == ['page1.html']
+
+
+def make_page(tmp_path):
+    """创建只有一个页面的 shell 布局项目（写入时不包装外壳）"""
+    project = tmp_path / 'project'
+    target = project / 'pages' / 'role1' / 'moduleA' / 'page1.html'
+    target.parent.mkdir(parents=True)
+    target.write_text('<div>旧内容</div>\n', encoding='utf-8')
+    fragment = tmp_path / 'fragment.html'
+    fragment.write_text('<div>新内容</div>\n', encoding='utf-8')
+    return FileManager(str(project)), target, fragment
+
+
+def test_failed_write_keeps_original_page(tmp_path, monkeypatch):
+    manager, target, fragment = make_page(tmp_path)
+
+    def fail(src, dst):
+        raise OSError("磁盘已满")
+
+    monkeypatch.setattr(CopyEngine, 'copy_fd', staticmethod(fail))
+    with pytest.raises(OSError):
+        manager._write_wrapped_page(target, fragment, 'mobile', '', '', layout='shell')
+    assert target.read_text(encoding='utf-8') == '<div>旧内容</div>\n'
+    assert [path.name for path in target.parent.iterdir()] == ['page1.html']
+
+
+def test_write_all_handles_short_writes():
+    class ShortWriter:
+        def __init__(self):
+            self.data = bytearray()
+
+        def write(self, view):
+            self.data += view[:3]
+            return min(3, len(view))
+
+    dst = ShortWriter()
+    FileManager._write_all(dst, b'0123456789')
+    assert bytes(dst.data) == b'0123456789'
+
+
+def test_failed_write_of_new_page_leaves_no_file(tmp_path, monkeypatch):
+    manager, target, fragment = make_page(tmp_path)
+    new_page = target.with_name('page2.html')
+
+    def fail(src, dst):
+        raise OSError("磁盘已满")
+
+    monkeypatch.setattr(CopyEngine, 'copy_fd', staticmethod(fail))
+    with pytest.raises(OSError):
+        manager._write_wrapped_page(new_page, fragment, 'mobile', '', '', layout='shell')
+    assert not new_page.exists()
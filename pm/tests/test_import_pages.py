@@ -0,0 +1,40 @@
+"""批量导入页面测试"""
+
+import json
+from argparse import Namespace
+
+from main import PrototypeGenerator
+
+
+def test_import_dir_skips_pages_without_url(tmp_path):
+    project = tmp_path / 'project'
+    page_file = project / 'pages' / 'role1' / 'moduleA' / 'page1.html'
+    page_file.parent.mkdir(parents=True)
+    page_file.write_text('<div>旧内容</div>\n', encoding='utf-8')
+    # 通过 --add-page 新增的页面在menu.json中没有url
+    menu = [{
+        "name": "用户",
+        "modules": [{
+            "name": "账户",
+            "pages": [
+                {"name": "登录", "url": "pages/role1/moduleA/page1.html", "status": "pending"},
+                {"name": "注册", "description": "注册功能页面"}
+            ]
+        }]
+    }]
+    (project / 'menu.json').write_text(json.dumps(menu, ensure_ascii=False), encoding='utf-8')
+
+    fragments = tmp_path / 'fragments'
+    fragments.mkdir()
+    (fragments / '登录.html').write_text('<div>登录表单</div>\n', encoding='utf-8')
+    (fragments / '注册.html').write_text('<div>注册表单</div>\n', encoding='utf-8')
+
+    args = Namespace(name=str(project), import_dir=str(fragments), import_map=None,
+                     status='completed', platform='mobile', keep_source=True, no_validate=False)
+    assert PrototypeGenerator()._import_pages(args)
+
+    assert '登录表单' in page_file.read_text(encoding='utf-8')
+    saved = json.loads((project / 'menu.json').read_text(encoding='utf-8'))
+    pages = {page['name']: page for page in saved[0]['modules'][0]['pages']}
+    assert pages['登录']['status'] == 'completed'
+    assert 'status' not in pages['注册']
@@ -0,0 +1,122 @@
+"""页面撤销日志测试"""
+
+import json
+import re
+import sys
+
+from utils.asset_pipeline import AssetPipeline
+from utils.file_manager import FileManager
+from utils.page_journal import PageJournal
+
+PAGE_URL = 'pages/role1/moduleA/page1.html'
+
+
+def write_versions(tmp_path, versions):
+    """依次把每个版本作为页面片段写入（shell 布局不包装外壳），返回 (文件管理器, 页面文件)"""
+    project = tmp_path / 'project'
+    page_file = project / PAGE_URL
+    page_file.parent.mkdir(parents=True)
+    page_file.write_text(versions[0], encoding='utf-8')
+    manager = FileManager(str(project))
+    for index, content in enumerate(versions[1:]):
+        fragment = tmp_path / f'fragment{index}.html'
+        fragment.write_text(content, encoding='utf-8')
+        assert manager._write_wrapped_page(page_file, fragment, 'mobile', '', '', layout='shell')
+    return manager, page_file
+
+
+VERSIONS = [
+    '<div>\n  <p>第一版</p>\n</div>\n',
+    '<div>\n  <p>第二版</p>\n  <p>新增段落</p>\n</div>\n',
+    '<section>\n  <p>第三版</p>\n</section>\n',
+]
+
+
+def test_reconstructs_every_version(tmp_path):
+    manager, page_file = write_versions(tmp_path, VERSIONS)
+    journal = manager.page_journal
+
+    history = journal.history(PAGE_URL)
+    assert [version['action'] for version in history] == ['initial', 'update', 'update']
+    assert history[-1]['current']
+    for number, content in enumerate(VERSIONS, start=1):
+        assert journal.reconstruct(PAGE_URL, number) == content.encode('utf-8')
+
+
+def test_undo_restores_previous_version_and_is_recorded(tmp_path):
+    manager, page_file = write_versions(tmp_path, VERSIONS)
+    journal = manager.page_journal
+
+    assert journal.undo(PAGE_URL) == 2
+    assert page_file.read_text(encoding='utf-8') == VERSIONS[1]
+    assert journal.undo(PAGE_URL, 1) == 1
+    assert page_file.read_text(encoding='utf-8') == VERSIONS[0]
+
+    history = journal.history(PAGE_URL)
+    assert [version['action'] for version in history] == ['initial', 'update', 'update', 'undo', 'undo']
+    assert journal.reconstruct(PAGE_URL, 3) == VERSIONS[2].encode('utf-8')
+    assert [path.name for path in page_file.parent.iterdir()] == ['page1.html']
+
+
+def test_external_change_is_kept_as_a_version(tmp_path):
+    manager, page_file = write_versions(tmp_path, VERSIONS[:2])
+    page_file.write_text('<div>重新构建后的内容</div>\n', encoding='utf-8')
+    assert not manager.page_journal.history(PAGE_URL)[-1]['current']
+
+    # 撤销回到最近记录的版本，被外部修改的内容也记为一个版本
+    assert manager.page_journal.undo(PAGE_URL) == 2
+    assert page_file.read_text(encoding='utf-8') == VERSIONS[1]
+    history = manager.page_journal.history(PAGE_URL)
+    assert [version['action'] for version in history] == ['initial', 'update', 'external', 'undo']
+    assert manager.page_journal.reconstruct(PAGE_URL, 3) == '<div>重新构建后的内容</div>\n'.encode('utf-8')
+
+
+def test_large_pages_store_old_versions_outside_the_journal(tmp_path, monkeypatch):
+    monkeypatch.setattr(PageJournal, 'DELTA_MAX_SIZE', 64)
+    large = ['<div>\n' + f'  <p>第{index}版</p>\n' * 20 + '</div>\n' for index in range(3)]
+    manager, page_file = write_versions(tmp_path, large + ['<div>小页面</div>\n'])
+    journal = manager.page_journal
+
+    journal_file = journal._journal_file(PAGE_URL)
+    entries = [json.loads(line) for line in journal_file.read_text(encoding='utf-8').splitlines()]
+    assert all('blob' in entry and 'delta' not in entry for entry in entries)
+    assert '第0版' not in journal_file.read_text(encoding='utf-8')
+    for number, content in enumerate(large, start=1):
+        assert journal.reconstruct(PAGE_URL, number) == content.encode('utf-8')
+
+    assert journal.undo(PAGE_URL, 1) == 1
+    assert page_file.read_text(encoding='utf-8') == large[0]
+    assert journal.reconstruct(PAGE_URL, 4) == '<div>小页面</div>\n'.encode('utf-8')
+
+
+def run_cli(monkeypatch, *argv):
+    """以命令行参数运行主程序"""
+    from main import PrototypeGenerator
+
+    monkeypatch.setattr(sys, 'argv', ['main.py', *argv])
+    PrototypeGenerator().run()
+
+
+def test_undo_after_asset_refresh(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    run_cli(monkeypatch, '-n', 'proj')
+    run_cli(monkeypatch, '-n', 'proj', '--build-assets')
+    page_url = 'pages/role1/moduleA/page2.html'
+    page_file = tmp_path / 'proj' / page_url
+    original = page_file.read_bytes()
+
+    # 新内容使用新的工具类，更新后重新构建会改变 utilities.css 的指纹并改写页面引用
+    (tmp_path / 'v3.html').write_text('<div class="mt-7 tracking-widest">v3</div>\n', encoding='utf-8')
+    run_cli(monkeypatch, '-n', 'proj', '--update-page', '功能页面2', '--page-content', 'v3.html')
+    assert 'v3' in page_file.read_text(encoding='utf-8')
+    assert PageJournal('proj').history(page_url)[-1]['current']
+
+    run_cli(monkeypatch, '-n', 'proj', '--undo-page', '功能页面2')
+    content = page_file.read_text(encoding='utf-8')
+    assert 'v3' not in content
+    assert AssetPipeline.strip_fingerprints(page_file.read_bytes()) == AssetPipeline.strip_fingerprints(original)
+    assert [version['action'] for version in PageJournal('proj').history(page_url)] == ['initial', 'update', 'undo']
+
+    # 恢复后的页面引用的都是当前存在的指纹资源
+    for url in re.findall(r'(?:src|href)="([^"#?:]+)"', content):
+        assert (page_file.parent / url).exists(), url
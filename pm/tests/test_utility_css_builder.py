@@ -0,0 +1,53 @@
+"""工具类CSS构建器测试"""
+
+import re
+
+from utils.utility_css_builder import UtilityCSSBuilder
+
+
+def rule_positions(css, class_names):
+    """返回各类名规则在样式表中的位置（规则总是从行首开始）"""
+    return {
+        name: re.search(r'^\s*' + re.escape(f'.{UtilityCSSBuilder._escape(name)}') + r'[\s:]', css, re.M).start()
+        for name in class_names
+    }
+
+
+def test_shorthand_rules_precede_longhands():
+    css, _ = UtilityCSSBuilder().build_css(
+        ['pl-10', 'px-2', 'ml-2', 'mx-4', 'pt-1', 'py-4', 'rounded-t-lg', 'rounded', 'border-t', 'border'])
+    pos = rule_positions(css, ['pl-10', 'px-2', 'ml-2', 'mx-4', 'pt-1', 'py-4',
+                               'rounded-t-lg', 'rounded', 'border-t', 'border'])
+    assert pos['px-2'] < pos['pl-10']
+    assert pos['mx-4'] < pos['ml-2']
+    assert pos['py-4'] < pos['pt-1']
+    assert pos['rounded'] < pos['rounded-t-lg']
+    assert pos['border'] < pos['border-t']
+
+
+def test_property_groups_follow_tailwind_order():
+    css, _ = UtilityCSSBuilder().build_css(['leading-tight', 'text-sm', 'bg-opacity-50', 'bg-red-500', 'p-2', 'm-2'])
+    pos = rule_positions(css, ['leading-tight', 'text-sm', 'bg-opacity-50', 'bg-red-500', 'p-2', 'm-2'])
+    # leading-* 覆盖 text-* 设置的行高，透明度修饰覆盖颜色类的默认透明度
+    assert pos['text-sm'] < pos['leading-tight']
+    assert pos['bg-red-500'] < pos['bg-opacity-50']
+    assert pos['m-2'] < pos['p-2']
+
+
+def test_variants_and_media_queries_keep_cascade_order():
+    css, _ = UtilityCSSBuilder().build_css(['md:pl-4', 'md:p-2', 'hover:pl-1', 'hover:px-3', 'focus:pl-2', 'pl-6'])
+    pos = rule_positions(css, ['md:pl-4', 'md:p-2', 'hover:pl-1', 'hover:px-3', 'focus:pl-2', 'pl-6'])
+    assert pos['pl-6'] < pos['hover:px-3'] < pos['hover:pl-1'] < pos['focus:pl-2'] < pos['md:p-2'] < pos['md:pl-4']
+
+
+def test_find_unsupported_ignores_project_and_icon_classes(tmp_path):
+    page = tmp_path / 'page.html'
+    page.write_text('<style>.battery { color: red; }</style>'
+                    '<div class="p-4 ring-2 battery status-left fas fa-home group ${cls}">'
+                    '<span class="md:bg-gradient-to-r text-sm"></span></div>', encoding='utf-8')
+    script = tmp_path / 'app.js'
+    script.write_text("el.classList.add('tracking-wide', 'divide-y');", encoding='utf-8')
+
+    builder = UtilityCSSBuilder()
+    _, generated = builder.build_css(builder.collect_classes([page, script]))
+    assert builder.find_unsupported([page, script], generated) == ['divide-y', 'md:bg-gradient-to-r', 'ring-2']
@@ -0,0 +1,436 @@
+"""
+静态资源构建流水线
+对已生成的原型项目进行构建期优化，并在asset-manifest.json中记录构建结果
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 添加父目录到路径以支持导入
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.insert(0, str(parent_dir))
+
+from utils.utility_css_builder import UtilityCSSBuilder
+from utils.icon_subsetter import IconSubsetter
+
+
+class AssetPipeline:
+    """静态资源构建流水线类"""
+
+    MANIFEST_NAME = "asset-manifest.json"
+    UTILITIES_CSS = "utilities.css"
+    ICONS_CSS = "icons.css"
+
+    # 构建时跳过的目录（备份目录中的页面、分析缓存不参与扫描和改写）
+    EXCLUDED_DIRS = {"backups", ".pm-cache"}
+
+    # 需要加指纹的静态资源：项目根目录下的样式/脚本，以及交互、业务逻辑目录下的文件
+    FINGERPRINT_ROOT_ASSETS = ["style.css", "progress.js", UTILITIES_CSS, ICONS_CSS]
+    FINGERPRINT_ASSET_DIRS = ["interactive", "business"]
+    FINGERPRINT_SUFFIXES = (".css", ".js")
+    FINGERPRINT_LENGTH = 8
+    FINGERPRINTED_NAME_PATTERN = re.compile(r'^(?P<stem>.+)\.(?P<hash>[0-9a-f]{8})(?P<suffix>\.[a-z]+)$')
+    ASSET_REFERENCE_PATTERN = re.compile(r'(?P<attr>\b(?:src|href))="(?P<url>[^"#?:]+)"')
+    FINGERPRINTED_REFERENCE_PATTERN = re.compile(
+        rb'(?P<head>\b(?:src|href)="[^"#?:]*?)\.[0-9a-f]{8}(?P<tail>\.[a-z]+")')
+
+    # 预压缩：仅处理超过阈值的文本类文件
+    PRECOMPRESS_SUFFIXES = (".html", ".css", ".js", ".json")
+    PRECOMPRESS_MIN_SIZE = 1024
+    PRECOMPRESS_ENCODINGS = (".gz", ".br")
+
+    TAILWIND_CDN_PATTERN = re.compile(
+        r'[ \t]*<script src="https://cdn\.tailwindcss\.com[^"]*"></script>\n?')
+    TAILWIND_CONFIG_PATTERN = re.compile(
+        r'[ \t]*<script>\s*tailwind\.config\s*=.*?</script>\n?', re.DOTALL)
+    UTILITIES_LINK_PATTERN = re.compile(r'href="[^"]*utilities(?:\.[0-9a-f]+)?\.css"')
+    UTILITIES_LINK_TAG_PATTERN = re.compile(
+        r'(?P<indent>[ \t]*)<link rel="stylesheet" href="[^"]*utilities(?:\.[0-9a-f]+)?\.css">\n?')
+    FONT_AWESOME_CDN_PATTERN = re.compile(
+        r'<link rel="stylesheet" href="https://cdnjs\.cloudflare\.com/ajax/libs/font-awesome/[^"]*">')
+    FONT_AWESOME_CDN_URL = "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css"
+    ICONS_LINK_TAG_PATTERN = re.compile(r'<link rel="stylesheet" href="(?:[^"]*/)?icons(?:\.[0-9a-f]+)?\.css">')
+
+    def __init__(self, project_root: str):
+        self.project_root = Path(project_root)
+        self.manifest_file = self.project_root / self.MANIFEST_NAME
+        self._built_manifest = None
+
+    def is_built(self) -> bool:
+        """
+        检查项目是否已经构建过
+
+        Returns:
+            bool: 是否存在构建清单
+        """
+        return self.manifest_file.exists()
+
+    def run(self, precompress: Optional[bool] = None) -> bool:
+        """
+        执行全部构建阶段
+
+        Args:
+            precompress: 是否生成预压缩文件，None表示沿用上次构建的设置
+
+        Returns:
+            bool: 构建是否成功
+        """
+        try:
+            manifest = self._load_manifest()
+            if precompress is None:
+                precompress = 'precompressed' in manifest
+
+            self._build_utility_css(manifest)
+            self._build_icon_subset(manifest)
+            self._fingerprint_assets(manifest)
+            if precompress:
+                self._precompress(manifest)
+
+            manifest['built_at'] = datetime.now().isoformat()
+            self._save_manifest(manifest)
+            return True
+        except Exception as e:
+            print(f"❌ 构建静态资源失败: {e}")
+            return False
+
+    def render_page(self, content: str, html_file: Path) -> str:
+        """
+        按上次构建的结果改写页面（与构建时对页面的改写一致）
+
+        写入页面前先得到其构建后的内容，写入后无需再被重新构建改写，
+        内容未变化时也能与现有页面直接比较
+
+        Args:
+            content: 页面内容（或页面头部）
+            html_file: 页面文件路径
+
+        Returns:
+            str: 改写后的内容
+        """
+        if self._built_manifest is None:
+            self._built_manifest = self._load_manifest()
+        manifest = self._built_manifest
+
+        utilities = manifest.get('utilities')
+        if utilities is not None and not utilities.get('unsupported'):
+            content = self._link_utilities_css(
+                content, self._relative_href(html_file, self.project_root / self.UTILITIES_CSS))
+        icons = manifest.get('icons')
+        if icons is not None and not icons.get('missing'):
+            content = self._link_icons_css(
+                content, self._relative_href(html_file, self.project_root / self.ICONS_CSS))
+        return self._rewrite_asset_references(content, html_file, manifest.get('assets', {}))
+
+    @classmethod
+    def strip_fingerprints(cls, content: bytes) -> bytes:
+        """
+        将页面中带指纹的资源引用还原为原始文件名（style.1a2b3c4d.css -> style.css）
+
+        重新构建只会改变指纹，去掉指纹后的内容可用于判断页面本身是否被修改
+
+        Args:
+            content: 页面内容（或其中的一段完整的行）
+
+        Returns:
+            bytes: 去掉指纹后的内容
+        """
+        return cls.FINGERPRINTED_REFERENCE_PATTERN.sub(rb'\g<head>\g<tail>', content)
+
+    def _build_utility_css(self, manifest: Dict[str, Any]) -> None:
+        """扫描页面使用的类名，生成utilities.css并改写页面头部"""
+        builder = UtilityCSSBuilder()
+        html_files = self._iter_files('.html')
+        js_files = self._iter_files('.js')
+        classes = builder.collect_classes(html_files + js_files)
+        css, generated = builder.build_css(classes)
+        unsupported = builder.find_unsupported(html_files + js_files + self._iter_files('.css'), generated)
+
+        css_file = self.project_root / self.UTILITIES_CSS
+        css_file.write_text(css, encoding='utf-8')
+
+        manifest['utilities'] = {
+            "file": self.UTILITIES_CSS,
+            "class_count": len(generated),
+            "unsupported": unsupported,
+            "size": css_file.stat().st_size
+        }
+        print(f"✅ 已生成 {self.UTILITIES_CSS}: {len(generated)} 个工具类，{css_file.stat().st_size} 字节")
+
+        # 存在无法生成的工具类时保留（或恢复）TailwindCSS CDN，避免页面样式丢失
+        if unsupported:
+            print(f"⚠️  以下类名无法静态生成，保留TailwindCSS CDN: {', '.join(unsupported)}")
+            restored = 0
+            for html_file in html_files:
+                content = html_file.read_text(encoding='utf-8')
+                updated = self._restore_tailwind_cdn(content)
+                if updated != content:
+                    html_file.write_text(updated, encoding='utf-8')
+                    restored += 1
+            if restored:
+                print(f"📝 已恢复TailwindCSS CDN引用: {restored} 个文件")
+            return
+
+        rewritten = 0
+        for html_file in html_files:
+            content = html_file.read_text(encoding='utf-8')
+            updated = self._link_utilities_css(content, self._relative_href(html_file, css_file))
+            if updated != content:
+                html_file.write_text(updated, encoding='utf-8')
+                rewritten += 1
+        print(f"📝 已改写页面头部: {rewritten} 个文件")
+
+    def _build_icon_subset(self, manifest: Dict[str, Any]) -> None:
+        """收集页面使用的图标，生成icons.css并替换Font Awesome CDN引用"""
+        subsetter = IconSubsetter()
+        html_files = self._iter_files('.html')
+        icon_classes, missing = subsetter.collect_icons(html_files + self._iter_files('.js'))
+        css, generated = subsetter.build_css(icon_classes)
+        css_file = self.project_root / self.ICONS_CSS
+
+        # 存在内置图标集未覆盖的图标时保留（或恢复）CDN引用，避免页面图标丢失；
+        # 不生成icons.css，指纹阶段随之清理上次构建的指纹文件和清单记录
+        if missing:
+            if css_file.exists():
+                css_file.unlink()
+            manifest['icons'] = {
+                "file": None,
+                "icon_count": 0,
+                "missing": sorted(missing),
+                "size": 0
+            }
+            print(f"⚠️  内置图标集缺少以下图标，保留Font Awesome CDN引用: {', '.join(sorted(missing))}")
+            restored = 0
+            for html_file in html_files:
+                content = html_file.read_text(encoding='utf-8')
+                updated = self._restore_font_awesome_cdn(content)
+                if updated != content:
+                    html_file.write_text(updated, encoding='utf-8')
+                    restored += 1
+            if restored:
+                print(f"📝 已恢复Font Awesome CDN引用: {restored} 个文件")
+            return
+
+        css_file.write_text(css, encoding='utf-8')
+        manifest['icons'] = {
+            "file": self.ICONS_CSS,
+            "icon_count": len(generated),
+            "missing": [],
+            "size": css_file.stat().st_size
+        }
+        print(f"✅ 已生成 {self.ICONS_CSS}: {len(generated)} 个图标，{css_file.stat().st_size} 字节")
+
+        rewritten = 0
+        for html_file in html_files:
+            content = html_file.read_text(encoding='utf-8')
+            updated = self._link_icons_css(content, self._relative_href(html_file, css_file))
+            if updated != content:
+                html_file.write_text(updated, encoding='utf-8')
+                rewritten += 1
+        print(f"📝 已替换Font Awesome CDN引用: {rewritten} 个文件")
+
+    def _fingerprint_assets(self, manifest: Dict[str, Any]) -> None:
+        """为静态资源生成带内容哈希的文件名，并改写页面中的引用"""
+        previous = manifest.get('assets', {})
+        assets = {}
+
+        for asset in self._iter_fingerprint_sources():
+            logical = asset.relative_to(self.project_root).as_posix()
+            digest = hashlib.sha256(asset.read_bytes()).hexdigest()[:self.FINGERPRINT_LENGTH]
+            hashed = asset.with_name(f"{asset.stem}.{digest}{asset.suffix}")
+            if not hashed.exists():
+                hashed.write_bytes(asset.read_bytes())
+            assets[logical] = hashed.relative_to(self.project_root).as_posix()
+
+        rewritten = 0
+        for html_file in self._iter_files('.html'):
+            content = html_file.read_text(encoding='utf-8')
+            updated = self._rewrite_asset_references(content, html_file, assets)
+            if updated != content:
+                html_file.write_text(updated, encoding='utf-8')
+                rewritten += 1
+
+        # 清理已不再被引用的旧指纹文件（原始文件名保留，供脚本动态加载使用）
+        for logical, hashed in previous.items():
+            if assets.get(logical) != hashed:
+                stale = self.project_root / hashed
+                if stale.exists():
+                    stale.unlink()
+
+        manifest['assets'] = assets
+        print(f"✅ 已生成指纹资源: {len(assets)} 个文件")
+        print(f"📝 已改写资源引用: {rewritten} 个文件")
+
+    def _iter_fingerprint_sources(self) -> List[Path]:
+        """列出需要加指纹的原始资源文件（跳过已带指纹的文件）"""
+        sources = [self.project_root / name for name in self.FINGERPRINT_ROOT_ASSETS]
+        for dir_name in self.FINGERPRINT_ASSET_DIRS:
+            asset_dir = self.project_root / dir_name
+            if asset_dir.is_dir():
+                sources.extend(sorted(asset_dir.rglob('*')))
+
+        return [
+            path for path in sources
+            if path.is_file()
+            and path.suffix in self.FINGERPRINT_SUFFIXES
+            and not self.FINGERPRINTED_NAME_PATTERN.match(path.name)
+        ]
+
+    def _rewrite_asset_references(self, content: str, html_file: Path, assets: Dict[str, str]) -> str:
+        """将页面中的静态资源引用替换为带指纹的文件名"""
+        def replace(match):
+            url = match.group('url')
+            target = os.path.normpath(os.path.join(
+                os.path.relpath(html_file.parent, self.project_root), url))
+            logical = Path(target).as_posix()
+
+            fingerprinted = self.FINGERPRINTED_NAME_PATTERN.match(Path(logical).name)
+            if fingerprinted:
+                logical = Path(logical).with_name(
+                    fingerprinted.group('stem') + fingerprinted.group('suffix')).as_posix()
+
+            if logical not in assets:
+                return match.group(0)
+            href = self._relative_href(html_file, self.project_root / assets[logical])
+            return f'{match.group("attr")}="{href}"'
+
+        return self.ASSET_REFERENCE_PATTERN.sub(replace, content)
+
+    def _precompress(self, manifest: Dict[str, Any]) -> None:
+        """并行生成 .gz（及可用时的 .br）预压缩文件，源文件哈希未变化时跳过"""
+        previous = manifest.get('precompressed', {})
+        encodings = ['.gz'] + (['.br'] if brotli is not None else [])
+
+        sources = []
+        for suffix in self.PRECOMPRESS_SUFFIXES:
+            sources.extend(
+                path for path in self._iter_files(suffix)
+                if path.stat().st_size >= self.PRECOMPRESS_MIN_SIZE
+                and path.name != self.MANIFEST_NAME
+            )
+
+        def compress(path: Path):
+            stat = path.stat()
+            data = path.read_bytes()
+            relative = path.relative_to(self.project_root).as_posix()
+            digest = hashlib.sha256(data).hexdigest()
+            sidecars = [path.with_name(path.name + encoding) for encoding in encodings]
+            changed = previous.get(relative) != digest or not all(sidecar.exists() for sidecar in sidecars)
+
+            for sidecar in sidecars:
+                if changed:
+                    if sidecar.suffix == '.gz':
+                        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+                    else:
+                        compressed = brotli.compress(data)
+                    temp_file = sidecar.with_name(sidecar.name + '.tmp')
+                    temp_file.write_bytes(compressed)
+                    os.replace(temp_file, sidecar)
+                # 预压缩文件的修改时间与源文件一致，预览服务据此判断是否过期
+                # （源文件被修改或从备份恢复后修改时间都会不同）
+                if sidecar.stat().st_mtime_ns != stat.st_mtime_ns:
+                    os.utime(sidecar, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            return relative, digest, changed
+
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as executor:
+            results = list(executor.map(compress, sources))
+
+        precompressed = {relative: digest for relative, digest, _ in results}
+
+        # 清理源文件已删除或已低于阈值的预压缩文件
+        for relative in set(previous) - set(precompressed):
+            for encoding in self.PRECOMPRESS_ENCODINGS:
+                sidecar = self.project_root / (relative + encoding)
+                if sidecar.exists():
+                    sidecar.unlink()
+
+        manifest['precompressed'] = precompressed
+        compressed_count = sum(1 for _, _, changed in results if changed)
+        print(f"✅ 预压缩完成: {compressed_count} 个文件已压缩，"
+              f"{len(results) - compressed_count} 个未变化已跳过（{'/'.join(encodings)}）")
+
+    def _link_utilities_css(self, content: str, href: str) -> str:
+        """移除TailwindCSS CDN脚本及内联配置，改为引用静态utilities.css"""
+        match = self.TAILWIND_CDN_PATTERN.search(content)
+        if not match:
+            return content
+
+        if self.UTILITIES_LINK_PATTERN.search(content):
+            link = ''
+        else:
+            indent = match.group(0)[:len(match.group(0)) - len(match.group(0).lstrip())]
+            link = f'{indent}<link rel="stylesheet" href="{href}">\n'
+
+        content = content[:match.start()] + link + content[match.end():]
+        return self.TAILWIND_CONFIG_PATTERN.sub('', content, count=1)
+
+    def _restore_tailwind_cdn(self, content: str) -> str:
+        """将之前构建时替换的utilities.css引用恢复为TailwindCSS CDN脚本及项目颜色配置"""
+        match = self.UTILITIES_LINK_TAG_PATTERN.search(content)
+        if not match:
+            return content
+
+        indent = match.group('indent')
+        colors = ',\n'.join(f"{indent}          '{name}': '{value}'"
+                            for name, value in UtilityCSSBuilder.CUSTOM_COLORS.items())
+        cdn = (f'{indent}<script src="https://cdn.tailwindcss.com"></script>\n'
+               f'{indent}<script>\n'
+               f'{indent}  tailwind.config = {{\n'
+               f'{indent}    theme: {{\n'
+               f'{indent}      extend: {{\n'
+               f'{indent}        colors: {{\n'
+               f'{colors}\n'
+               f'{indent}        }}\n'
+               f'{indent}      }}\n'
+               f'{indent}    }}\n'
+               f'{indent}  }}\n'
+               f'{indent}</script>\n')
+        return content[:match.start()] + cdn + content[match.end():]
+
+    def _link_icons_css(self, content: str, href: str) -> str:
+        """将Font Awesome CDN样式表引用替换为静态icons.css"""
+        return self.FONT_AWESOME_CDN_PATTERN.sub(f'<link rel="stylesheet" href="{href}">', content, count=1)
+
+    def _restore_font_awesome_cdn(self, content: str) -> str:
+        """将之前构建时替换的icons.css引用恢复为Font Awesome CDN样式表"""
+        return self.ICONS_LINK_TAG_PATTERN.sub(
+            f'<link rel="stylesheet" href="{self.FONT_AWESOME_CDN_URL}">', content, count=1)
+
+    def _iter_files(self, suffix: str) -> List[Path]:
+        """遍历项目中指定后缀的文件（跳过备份等目录）"""
+        result = []
+        for root, dirs, files in os.walk(self.project_root):
+            dirs[:] = sorted(d for d in dirs if d not in self.EXCLUDED_DIRS)
+            for name in sorted(files):
+                if name.endswith(suffix):
+                    result.append(Path(root) / name)
+        return result
+
+    def _relative_href(self, html_file: Path, target: Path) -> str:
+        """计算页面引用目标资源的相对路径"""
+        return Path(os.path.relpath(target, html_file.parent)).as_posix()
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        """加载构建清单"""
+        if not self.manifest_file.exists():
+            return {}
+        with open(self.manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        """保存构建清单"""
+        with open(self.manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
@@ -4,107 +4,445 @@ UX工程师备份管理工具
 负责原型文件的安全备份和版本管理
 """
 
+import difflib
+import html
 import os
+import random
 import shutil
 import json
-from datetime import datetime
+import gzip
+import hashlib
+import lzma
+import sqlite3
+import sys
+import tarfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, BinaryIO, Iterable, Iterator, List, Dict, Optional, Set, Tuple, Union
+
+# 添加父目录到路径以支持导入
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.insert(0, str(parent_dir))
+
+from generators.template_generator import TemplateGenerator
+from utils.asset_pipeline import AssetPipeline
+from utils.copy_engine import CopyEngine
+
+
+class ParallelCompressWriter:
+    """并行压缩写入器
+    
+    参照pigz的做法，将写入的数据按固定大小分块，在线程池中并行压缩为相互独立的
+    gzip/xz成员，再按原顺序写入目标文件。多个成员首尾相接仍是合法的 .gz/.xz 文件，
+    并且可以从任一成员的起始位置开始解压
+    """
+    
+    def __init__(self, fileobj: BinaryIO, compression: str = "gz",
+                 chunk_size: int = 1024 * 1024, workers: Optional[int] = None):
+        self.fileobj = fileobj
+        self.compression = compression
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+        # 每个成员的 [未压缩数据起始偏移, 压缩文件中的起始偏移]
+        self.members: List[List[int]] = []
+        self._buffer = bytearray()
+        self._uncompressed_offset = 0
+        self._compressed_offset = 0
+        self._pending = deque()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+    
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self.chunk_size:
+            self._submit(bytes(self._buffer[:self.chunk_size]))
+            del self._buffer[:self.chunk_size]
+        return len(data)
+    
+    def close(self) -> None:
+        """压缩剩余数据并按顺序写出所有成员"""
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        while self._pending:
+            self._write_next()
+        self._executor.shutdown()
+    
+    def _submit(self, chunk: bytes) -> None:
+        # zlib/lzma压缩时会释放GIL，线程池即可并行利用多个CPU核心
+        self._pending.append((self._uncompressed_offset, self._executor.submit(self._compress, chunk)))
+        self._uncompressed_offset += len(chunk)
+        # 限制在途分块数量，避免大项目的压缩结果积压在内存中
+        while len(self._pending) > self.workers * 2:
+            self._write_next()
+    
+    def _write_next(self) -> None:
+        uncompressed_offset, future = self._pending.popleft()
+        data = future.result()
+        self.members.append([uncompressed_offset, self._compressed_offset])
+        self.fileobj.write(data)
+        self._compressed_offset += len(data)
+    
+    def _compress(self, chunk: bytes) -> bytes:
+        if self.compression == 'xz':
+            return lzma.compress(chunk, format=lzma.FORMAT_XZ, preset=BackupManager.XZ_PRESET)
+        return gzip.compress(chunk, compresslevel=BackupManager.GZIP_LEVEL, mtime=0)
+
+
+class _HashingReader:
+    """读取文件时同步计算SHA-256（归档时无需为计算哈希再读一遍文件）"""
+    
+    def __init__(self, fileobj: BinaryIO):
+        self.fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileobj.read(size)
+        self.sha256.update(data)
+        return data
+
 
 class BackupManager:
-    """原型文件备份管理器"""
+    """原型文件备份管理器
     
-    def __init__(self, project_root: str):
+    支持两种存储方式：
+        objects   文件内容按SHA-256保存在 backups/objects/ 中（相同内容只保存一份），
+                  每个备份只记录 路径 -> 内容哈希 的清单
+        snapshot  每个备份都是可直接浏览的完整目录树，未变化的文件硬链接到上一个
+                  快照中的副本（类似 rsync --link-dest），只有变化的文件才真正复制
+        archive   每个备份是一个独立的 tar.gz/tar.xz 文件，便于转存到其他机器；
+                  直接从项目目录流式写入，分块并行压缩，可单独解压其中任一文件
+    """
+    
+    # 需要备份的关键文件和目录
+    BACKUP_ITEMS = [
+        "pages",
+        "index.html", 
+        "style.css",
+        "progress.js",
+        "menu.json",
+        "design-standards.md"
+    ]
+    # 构建静态资源后页面引用的文件（带指纹的资源文件名不固定，从构建清单中读取）
+    BUILT_ASSET_ITEMS = [
+        AssetPipeline.UTILITIES_CSS,
+        AssetPipeline.ICONS_CSS,
+        AssetPipeline.MANIFEST_NAME
+    ]
+    STORAGE_TYPES = ['objects', 'snapshot', 'archive']
+    COMPRESSION_TYPES = ['gz', 'xz']
+    HASH_CHUNK_SIZE = 1024 * 1024
+    # 归档压缩分块大小：每块压缩为一个独立成员，单文件解压最多多解压一个分块
+    ARCHIVE_CHUNK_SIZE = 1024 * 1024
+    GZIP_LEVEL = 6
+    XZ_PRESET = 6
+    
+    # 备份索引：每个备份一行，清单中的每个文件一行
+    INDEX_SCHEMA = """
+        CREATE TABLE IF NOT EXISTS backups (
+            backup_id TEXT PRIMARY KEY,
+            timestamp TEXT NOT NULL,
+            description TEXT NOT NULL DEFAULT '',
+            storage TEXT NOT NULL,
+            items TEXT NOT NULL,
+            full INTEGER NOT NULL DEFAULT 1,
+            file_count INTEGER NOT NULL DEFAULT 0,
+            total_size INTEGER NOT NULL DEFAULT 0,
+            new_objects INTEGER NOT NULL DEFAULT 0,
+            new_bytes INTEGER NOT NULL DEFAULT 0,
+            project_root TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_backups_timestamp ON backups (timestamp);
+        CREATE INDEX IF NOT EXISTS idx_backups_description ON backups (description);
+        CREATE INDEX IF NOT EXISTS idx_backups_storage ON backups (storage, timestamp);
+        CREATE TABLE IF NOT EXISTS backup_files (
+            backup_id TEXT NOT NULL,
+            path TEXT NOT NULL,
+            sha256 TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            inode INTEGER,
+            mode INTEGER NOT NULL,
+            offset INTEGER,
+            PRIMARY KEY (backup_id, path)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS backups_in_progress (
+            backup_id TEXT PRIMARY KEY,
+            storage TEXT NOT NULL,
+            base_backup TEXT,
+            started_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS gc_state (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+    BACKUP_COLUMNS = ['backup_id', 'timestamp', 'description', 'storage', 'items', 'full',
+                      'file_count', 'total_size', 'new_objects', 'new_bytes', 'project_root']
+    FILE_COLUMNS = ['sha256', 'size', 'mtime_ns', 'inode', 'mode', 'offset']
+    
+    # 默认保留策略（GFS）：最近24小时每小时保留一个，最近30天每天保留一个，最近52周每周保留一个
+    RETENTION_POLICY = {"hourly": 24, "daily": 30, "weekly": 52}
+    RETENTION_TIERS = [
+        ("hourly", timedelta(hours=1), lambda t: t.strftime('%Y-%m-%d %H')),
+        ("daily", timedelta(days=1), lambda t: t.strftime('%Y-%m-%d')),
+        ("weekly", timedelta(weeks=1), lambda t: '%d-W%02d' % t.isocalendar()[:2]),
+    ]
+    # 垃圾回收不删除最近写入的对象（可能属于尚未写入索引的备份）
+    GC_GRACE_SECONDS = 3600
+    # 超过该时长仍未完成的备份视为已中断，不再保护其基准备份和新写入的对象
+    STALE_BACKUP_SECONDS = 24 * 3600
+    
+    def __init__(self, project_root: str, workers: Optional[int] = None):
         self.project_root = Path(project_root)
+        self.copy_engine = CopyEngine(workers)
         self.backup_root = self.project_root / "backups"
         self.backup_root.mkdir(exist_ok=True)
+        self.backup_index_db = self.backup_root / "backup_index.sqlite"
+        # 旧版本的JSON索引，首次打开SQLite索引时自动导入
         self.backup_index_file = self.backup_root / "backup_index.json"
+        self.objects_root = self.backup_root / "objects"
     
-    def create_backup(self, description: str = "") -> str:
+    def create_backup(self, description: str = "", full: bool = False,
+                      storage: str = "objects", compression: str = "gz") -> str:
         """
         创建项目备份
         
+        默认为增量备份：大小、修改时间和inode与同一存储方式的上一个备份清单一致的文件
+        直接沿用原哈希（快照方式下硬链接原副本），只有发生变化的文件才重新计算哈希并存储
+        
         Args:
             description: 备份描述
+            full: 是否重新计算所有文件的哈希（完整备份）
+            storage: 存储方式（objects/snapshot/archive）
+            compression: 归档压缩格式（gz/xz），仅用于archive存储方式
             
         Returns:
             str: 备份目录路径
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_id = f"backup_{timestamp}"
+        backup_id = self._allocate_backup_id()
         backup_dir = self.backup_root / backup_id
-        backup_dir.mkdir(exist_ok=True)
-        
-        # 备份关键文件和目录
-        backup_items = [
-            "pages",
-            "index.html", 
-            "style.css",
-            "progress.js",
-            "menu.json",
-            "design-standards.md"
-        ]
         
+        # 登记为进行中的备份：清理时不会删除它的比较基准，垃圾回收也不会删除它新写入的对象。
+        # 归档每次都会完整读取所有文件，读取时即可计算哈希，无需比较基准
+        previous_id = self._begin_backup(backup_id, storage, use_baseline=not full and storage != 'archive')
+        try:
+            return self._write_backup(backup_id, backup_dir, description, previous_id,
+                                      full, storage, compression)
+        finally:
+            self._end_backup(backup_id)
+    
+    def _allocate_backup_id(self) -> str:
+        """
+        分配新的备份ID并独占创建备份目录
+        
+        ID精确到秒，同一秒内已有备份（目录已存在或索引中已登记）时追加序号 _2、_3…
+        
+        Returns:
+            str: 备份ID
+        """
+        base_id = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        with self._index() as conn:
+            taken = {row[0] for row in conn.execute(
+                "SELECT backup_id FROM backups WHERE backup_id LIKE ?", (f"{base_id}%",))}
+        sequence = 1
+        while True:
+            backup_id = base_id if sequence == 1 else f"{base_id}_{sequence}"
+            sequence += 1
+            if backup_id in taken:
+                continue
+            try:
+                (self.backup_root / backup_id).mkdir()
+                return backup_id
+            except FileExistsError:
+                continue
+    
+    def _write_backup(self, backup_id: str, backup_dir: Path, description: str, previous_id: Optional[str],
+                      full: bool, storage: str, compression: str) -> str:
+        """扫描项目文件并写入备份（由 create_backup 调用）"""
+        previous_manifest = self._load_manifest(previous_id) if previous_id else {}
+        
+        if storage == 'archive':
+            archive_name = f"{backup_id}.tar.{compression}"
+            archive_file = open(backup_dir / archive_name, 'wb')
+            archive_writer = ParallelCompressWriter(archive_file, compression, self.ARCHIVE_CHUNK_SIZE)
+            tar = tarfile.open(fileobj=archive_writer, mode='w|')
+        
+        # 只对发生变化的文件计算内容哈希，对象库中不存在的内容才需要复制；
+        # 变化的文件先收集起来，遍历结束后并行计算哈希和复制
+        manifest = {}
         backed_up_files = []
-        for item in backup_items:
+        changed_files: List[Tuple[str, str]] = []
+        linked_files = 0
+        snapshot_dirs: Set[Path] = set()
+        new_objects = 0
+        new_bytes = 0
+        for item in self._backup_items():
             item_path = self.project_root / item
-            if item_path.exists():
-                backup_target = backup_dir / item
-                if item_path.is_dir():
-                    shutil.copytree(item_path, backup_target)
+            if not item_path.exists():
+                continue
+            for relative, stat in self._scan_item(item):
+                file_path = os.path.join(self.project_root, relative)
+                previous = previous_manifest.get(relative)
+                unchanged = (previous and previous['size'] == stat.st_size
+                             and previous['mtime_ns'] == stat.st_mtime_ns
+                             and previous.get('inode') == stat.st_ino)
+                if storage == 'snapshot':
+                    snapshot_path = backup_dir / relative
+                    if snapshot_path.parent not in snapshot_dirs:
+                        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+                        snapshot_dirs.add(snapshot_path.parent)
+                    if unchanged and self._link_file(self.backup_root / previous_id / relative, snapshot_path):
+                        digest = previous['sha256']
+                        linked_files += 1
+                    else:
+                        digest = None
+                        changed_files.append((relative, file_path))
+                elif storage == 'archive':
+                    digest, offset = self._add_to_archive(tar, file_path, relative)
+                    changed_files.append((relative, file_path))
+                    new_objects += 1
+                    new_bytes += stat.st_size
+                elif unchanged:
+                    digest = previous['sha256']
                 else:
-                    shutil.copy2(item_path, backup_target)
-                backed_up_files.append(str(item))
+                    digest = None
+                    changed_files.append((relative, file_path))
+                manifest[relative] = {
+                    "sha256": digest,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "inode": stat.st_ino,
+                    "mode": stat.st_mode & 0o777
+                }
+                if storage == 'archive':
+                    manifest[relative]['offset'] = offset
+            backed_up_files.append(str(item))
+        
+        copy_stats = None
+        if storage == 'snapshot' and changed_files:
+            copy_stats = self.copy_engine.copy_files(
+                (file_path, backup_dir / relative) for relative, file_path in changed_files)
+            new_objects, new_bytes = copy_stats['files'], copy_stats['bytes']
+        if storage != 'archive':
+            digests = self._hash_files([file_path for _, file_path in changed_files])
+            for (relative, _), digest in zip(changed_files, digests):
+                manifest[relative]['sha256'] = digest
+        if storage == 'objects' and changed_files:
+            copy_stats = self._store_objects(changed_files, manifest)
+            new_objects, new_bytes = copy_stats['files'], copy_stats['bytes']
+        if copy_stats and copy_stats['errors']:
+            source, error = copy_stats['errors'][0]
+            raise OSError(f"{len(copy_stats['errors'])} 个文件复制失败，如 {source}: {error}")
+        
+        archive_info = {}
+        if storage == 'archive':
+            tar.close()
+            archive_writer.close()
+            archive_file.close()
+            archive_info = {
+                "archive": archive_name,
+                "compression": compression,
+                "archive_size": (backup_dir / archive_name).stat().st_size,
+                "chunk_size": self.ARCHIVE_CHUNK_SIZE,
+                "archive_members": archive_writer.members
+            }
         
         # 记录备份信息
         backup_info = {
             "backup_id": backup_id,
             "timestamp": datetime.now().isoformat(),
             "description": description,
+            "storage": storage,
             "files": backed_up_files,
+            "full": full or not previous_manifest,
+            "file_count": len(manifest),
+            "total_size": sum(entry['size'] for entry in manifest.values()),
+            "new_objects": new_objects,
+            "new_bytes": new_bytes,
             "project_root": str(self.project_root)
         }
         
         # 更新备份索引
-        self._update_backup_index(backup_info)
+        self._update_backup_index(backup_info, manifest)
         
-        # 保存备份信息到备份目录
+        # 保存备份信息（含文件清单）到备份目录；清单可能有数万项，使用紧凑格式一次性序列化
         with open(backup_dir / "backup_info.json", 'w', encoding='utf-8') as f:
-            json.dump(backup_info, f, ensure_ascii=False, indent=2)
+            f.write(json.dumps(dict(backup_info, manifest=manifest, **archive_info), ensure_ascii=False))
         
         print(f"✅ 备份完成: {backup_dir}")
         print(f"📝 备份描述: {description}")
-        print(f"📂 备份文件数: {len(backed_up_files)}")
+        print(f"📂 备份文件数: {len(manifest)}（{len(backed_up_files)} 项）")
+        print(f"🔍 重新计算哈希: {len(changed_files)} 个文件，{len(manifest) - len(changed_files)} 个未变化")
+        if storage == 'snapshot':
+            print(f"🔗 硬链接: {linked_files} 个未变化文件，复制: {new_objects} 个文件，{new_bytes} 字节")
+        elif storage == 'archive':
+            print(f"🗜️  归档: {archive_name}，{new_bytes} 字节压缩为 {archive_info['archive_size']} 字节"
+                  f"（{len(archive_writer.members)} 个压缩分块）")
+        else:
+            print(f"💾 新增存储: {new_objects} 个对象，{new_bytes} 字节（其余内容已存在，未重复保存）")
+        if copy_stats and copy_stats['files']:
+            print(CopyEngine.format_stats(copy_stats))
         
         return str(backup_dir)
     
-    def list_backups(self) -> List[Dict]:
+    def list_backups(self, limit: Optional[int] = None, keyword: Optional[str] = None) -> List[Dict]:
         """
-        列出所有备份
+        列出备份（按时间从旧到新）
         
+        Args:
+            limit: 只返回最新的若干个备份
+            keyword: 只返回描述中包含该关键字的备份
+            
         Returns:
             List[Dict]: 备份信息列表
         """
-        if not self.backup_index_file.exists():
-            return []
+        where, params = self._description_filter(keyword)
+        query = f"SELECT {', '.join(self.BACKUP_COLUMNS)} FROM backups{where} ORDER BY timestamp DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
         
-        with open(self.backup_index_file, 'r', encoding='utf-8') as f:
-            backup_index = json.load(f)
-        
-        return backup_index.get('backups', [])
+        with self._index() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._row_to_backup(row) for row in reversed(rows)]
+    
+    def count_backups(self, keyword: Optional[str] = None) -> int:
+        """备份数量（可按描述关键字过滤）"""
+        where, params = self._description_filter(keyword)
+        with self._index() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM backups{where}", params).fetchone()[0]
+    
+    def _description_filter(self, keyword: Optional[str]) -> Tuple[str, List[Any]]:
+        """按描述关键字过滤的WHERE子句和参数"""
+        if not keyword:
+            return "", []
+        escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return " WHERE description LIKE ? ESCAPE '\\'", [f"%{escaped}%"]
     
-    def restore_backup(self, backup_id: str, confirm: bool = False) -> bool:
+    def restore_backup(self, backup_id: str, confirm: bool = False,
+                       paths: Optional[List[str]] = None, dry_run: bool = False) -> bool:
         """
         恢复指定备份
         
+        先比较备份清单与当前文件，只重写内容不同的文件、补回缺失的文件、删除备份后新增的文件，
+        不会整体删除再复制 pages 目录
+        
         Args:
             backup_id: 备份ID
             confirm: 是否确认恢复
+            paths: 只恢复这些路径（文件或角色/模块目录前缀，相对于项目根目录），默认恢复全部
+            dry_run: 只显示将会修改、新增和删除的文件，不做任何修改
             
         Returns:
             bool: 恢复是否成功
         """
-        if not confirm:
+        if not confirm and not dry_run:
             print("⚠️  恢复操作将覆盖当前文件，请使用 confirm=True 确认操作")
             return False
         
@@ -122,7 +460,297 @@ class BackupManager:
         with open(backup_info_file, 'r', encoding='utf-8') as f:
             backup_info = json.load(f)
         
-        # 恢复文件
+        # 旧版本备份保存的是完整副本，直接复制恢复
+        if 'manifest' not in backup_info:
+            if paths or dry_run:
+                print("❌ 旧版本备份没有文件清单，不支持按路径恢复和预览")
+                return False
+            return self._restore_legacy_backup(backup_dir, backup_info)
+        
+        prefixes = [path.strip('/') for path in paths] if paths else []
+        manifest = {relative: entry for relative, entry in backup_info['manifest'].items()
+                    if self._match_prefixes(relative, prefixes)}
+        if prefixes and not manifest:
+            print(f"⚠️  备份 {backup_id} 中没有匹配 {', '.join(prefixes)} 的文件")
+        
+        diff = self._diff_for_restore(backup_info, manifest, prefixes)
+        if dry_run:
+            self._print_restore_diff(backup_id, diff)
+            return True
+        
+        to_write = diff['changed'] + diff['added']
+        if backup_info.get('storage') == 'archive':
+            sources = {}
+            missing = [] if (backup_dir / backup_info['archive']).exists() else [backup_info['archive']]
+        else:
+            sources = {relative: self._entry_source(backup_dir, backup_info, relative, manifest[relative])
+                       for relative in to_write}
+            missing = [relative for relative, source in sources.items() if not source.exists()]
+        if missing:
+            print(f"❌ 备份对象缺失，无法恢复: {', '.join(missing[:5])}{' 等' if len(missing) > 5 else ''}")
+            return False
+        
+        if backup_info.get('storage') == 'archive':
+            try:
+                self._restore_archive(backup_dir, backup_info, to_write)
+            except (ValueError, EOFError, OSError, tarfile.TarError, lzma.LZMAError, zlib.error) as e:
+                print(f"❌ 恢复失败，归档可能已损坏或不完整: {e}")
+                return False
+        elif to_write:
+            copy_stats = self._materialize_files({relative: sources[relative] for relative in to_write}, manifest)
+            print(CopyEngine.format_stats(copy_stats))
+            if copy_stats['errors']:
+                for source, error in copy_stats['errors'][:5]:
+                    print(f"❌ 恢复失败: {source}: {error}")
+                return False
+        
+        # 清单中没有的文件视为备份后新增，予以删除（写回成功后再删除，恢复失败时不改动项目）
+        for relative in diff['removed']:
+            (self.project_root / relative).unlink()
+        
+        print(f"✅ 恢复完成: {backup_id}")
+        print(f"📂 恢复文件数: {len(to_write)}（修改 {len(diff['changed'])}，新增 {len(diff['added'])}），"
+              f"删除 {len(diff['removed'])}，未变化 {len(diff['unchanged'])}")
+        
+        return True
+    
+    def _match_prefixes(self, relative: str, prefixes: List[str]) -> bool:
+        """路径是否为指定文件或位于指定目录下（未指定前缀时全部匹配）"""
+        if not prefixes:
+            return True
+        return any(relative == prefix or relative.startswith(prefix + '/') for prefix in prefixes)
+    
+    def _diff_for_restore(self, backup_info: Dict, manifest: Dict[str, Dict[str, Any]],
+                          prefixes: List[str]) -> Dict[str, List[str]]:
+        """
+        比较备份清单与当前项目文件
+        
+        大小不同即视为已修改；大小和修改时间都相同视为未变化（恢复时会还原修改时间）；
+        其余情况比较内容哈希
+        
+        Returns:
+            Dict[str, List[str]]: changed（内容不同）、added（当前缺失，将补回）、
+                                  removed（备份中没有，将删除）、unchanged 四组路径
+        """
+        current = {}
+        for item in backup_info['files']:
+            if not (self.project_root / item).exists():
+                continue
+            for relative, stat in self._scan_item(item):
+                if self._match_prefixes(relative, prefixes):
+                    current[relative] = stat
+        
+        diff = {"changed": [], "added": [], "removed": [], "unchanged": []}
+        for relative, entry in sorted(manifest.items()):
+            stat = current.get(relative)
+            if stat is None:
+                diff['added'].append(relative)
+            elif stat.st_size != entry['size']:
+                diff['changed'].append(relative)
+            elif stat.st_mtime_ns == entry['mtime_ns'] or self._hash_file(self.project_root / relative) == entry['sha256']:
+                diff['unchanged'].append(relative)
+            else:
+                diff['changed'].append(relative)
+        # 只删除备份所含目录中的多余文件；备份时不存在的顶层文件保持不动
+        diff['removed'] = sorted(relative for relative in current
+                                 if relative not in manifest and '/' in relative)
+        return diff
+    
+    def _print_restore_diff(self, backup_id: str, diff: Dict[str, List[str]], limit: int = 20) -> None:
+        """输出恢复预览"""
+        print(f"📋 恢复预览: {backup_id}（未修改任何文件）")
+        for key, icon, label in (('changed', '✏️ ', '修改'), ('added', '➕', '新增'), ('removed', '➖', '删除')):
+            paths = diff[key]
+            print(f"  {icon} {label}: {len(paths)} 个文件")
+            for relative in paths[:limit]:
+                print(f"      {relative}")
+            if len(paths) > limit:
+                print(f"      ... 等 {len(paths)} 个")
+        print(f"  ✅ 未变化: {len(diff['unchanged'])} 个文件")
+    
+    def extract_file(self, backup_id: str, relative: str, output_path: Optional[str] = None) -> bool:
+        """
+        从备份中提取单个文件；归档备份只解压该文件所在的压缩分块，无需解压整个归档
+        
+        Args:
+            backup_id: 备份ID
+            relative: 文件路径（相对于项目根目录）
+            output_path: 输出文件路径，默认恢复到项目中的原位置
+            
+        Returns:
+            bool: 提取是否成功
+        """
+        try:
+            backup_dir = self.backup_root / backup_id
+            backup_info_file = backup_dir / "backup_info.json"
+            if not backup_info_file.exists():
+                print(f"❌ 备份不存在: {backup_id}")
+                return False
+            with open(backup_info_file, 'r', encoding='utf-8') as f:
+                backup_info = json.load(f)
+            
+            entry = backup_info.get('manifest', {}).get(relative)
+            if entry is None:
+                print(f"❌ 备份 {backup_id} 中没有文件: {relative}")
+                return False
+            
+            target_path = Path(output_path) if output_path else self.project_root / relative
+            if backup_info.get('storage') == 'archive':
+                source = self._read_archive_range(backup_dir / backup_info['archive'], backup_info,
+                                                  entry['offset'], entry['size'])
+            else:
+                source = self._entry_source(backup_dir, backup_info, relative, entry)
+            self._materialize(source, entry, target_path)
+            
+            print(f"✅ 已提取: {relative} -> {target_path}")
+            return True
+        except Exception as e:
+            print(f"❌ 提取文件失败: {e}")
+            return False
+    
+    def diff_backups(self, from_id: str, to_id: Optional[str] = None, show_content: bool = False,
+                     output_path: Optional[str] = None, limit: int = 50) -> Optional[Dict[str, List[str]]]:
+        """
+        比较两个备份之间新增、删除和修改的文件
+        
+        只比较两个备份的文件清单（按内容哈希判断是否修改），不读取文件内容；
+        页面文件按 menu.json 中的页面地址显示为 角色/模块/页面 名称
+        
+        Args:
+            from_id: 较早的备份ID
+            to_id: 较新的备份ID，默认最新的备份
+            show_content: 是否输出修改文件的逐行差异（unified diff）
+            output_path: 将修改文件的差异写入该文件；以 .html 结尾时生成并排对比的HTML页面
+            limit: 每组最多列出的文件数
+            
+        Returns:
+            Optional[Dict[str, List[str]]]: added、removed、modified 三组路径，备份不存在或没有清单时返回None
+        """
+        try:
+            if to_id is None:
+                latest = self.list_backups(limit=1)
+                if not latest:
+                    print("📦 暂无备份")
+                    return None
+                to_id = latest[0]['backup_id']
+            
+            backup_infos = {}
+            for backup_id in (from_id, to_id):
+                backup_info = self._load_backup_info(backup_id)
+                if backup_info is None:
+                    print(f"❌ 备份不存在: {backup_id}")
+                    return None
+                if 'manifest' not in backup_info:
+                    print(f"❌ 旧版本备份没有文件清单，不支持比较: {backup_id}")
+                    return None
+                backup_infos[backup_id] = backup_info
+            
+            old_manifest = self._load_manifest(from_id)
+            new_manifest = self._load_manifest(to_id)
+            diff = {
+                "added": sorted(relative for relative in new_manifest if relative not in old_manifest),
+                "removed": sorted(relative for relative in old_manifest if relative not in new_manifest),
+                "modified": sorted(relative for relative, entry in new_manifest.items()
+                                   if relative in old_manifest and old_manifest[relative]['sha256'] != entry['sha256']),
+            }
+            
+            # 删除的页面只出现在旧备份的菜单中，新备份的菜单优先
+            page_names = {}
+            for backup_id, manifest in ((from_id, old_manifest), (to_id, new_manifest)):
+                page_names.update(self._page_names_from_backup(backup_infos[backup_id], manifest))
+            
+            print(f"🔍 备份差异: {from_id} → {to_id}")
+            for key, icon, label in (('added', '➕', '新增'), ('removed', '➖', '删除'), ('modified', '✏️ ', '修改')):
+                paths = diff[key]
+                print(f"  {icon} {label}: {len(paths)} 个文件")
+                for relative in paths[:limit]:
+                    name = page_names.get(relative)
+                    print(f"      {relative}{f'  ({name})' if name else ''}")
+                if len(paths) > limit:
+                    print(f"      ... 等 {len(paths)} 个")
+            if not any(diff.values()):
+                print("✅ 两个备份的内容相同")
+            
+            if (show_content or output_path) and diff['modified']:
+                self._write_content_diff(from_id, to_id, backup_infos, old_manifest, new_manifest,
+                                         diff['modified'], page_names, show_content, output_path)
+            return diff
+        except Exception as e:
+            print(f"❌ 比较备份失败: {e}")
+            return None
+    
+    def _page_names_from_backup(self, backup_info: Dict, manifest: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """读取备份中的 menu.json，返回 页面地址 -> 角色/模块/页面 名称"""
+        entry = manifest.get('menu.json')
+        if entry is None:
+            return {}
+        try:
+            menu_data = json.loads(self._read_backup_file(backup_info, 'menu.json', entry))
+        except (OSError, ValueError):
+            return {}
+        
+        page_names = {}
+        for role in menu_data:
+            for module in role.get('modules', []):
+                for page in module.get('pages', []):
+                    if page.get('url'):
+                        page_names[page['url']] = f"{role.get('name')}/{module.get('name')}/{page.get('name')}"
+        return page_names
+    
+    def _read_backup_file(self, backup_info: Dict, relative: str, entry: Dict[str, Any]) -> bytes:
+        """读取备份中单个文件的内容"""
+        backup_dir = self.backup_root / backup_info['backup_id']
+        if backup_info.get('storage') == 'archive':
+            return b''.join(self._read_archive_range(backup_dir / backup_info['archive'], backup_info,
+                                                     entry['offset'], entry['size']))
+        return self._entry_source(backup_dir, backup_info, relative, entry).read_bytes()
+    
+    def _write_content_diff(self, from_id: str, to_id: str, backup_infos: Dict[str, Dict],
+                            old_manifest: Dict[str, Dict[str, Any]], new_manifest: Dict[str, Dict[str, Any]],
+                            modified: List[str], page_names: Dict[str, str],
+                            show_content: bool, output_path: Optional[str]) -> None:
+        """输出修改文件的逐行差异：终端中为 unified diff，输出为 .html 文件时为并排对比表格"""
+        as_html = output_path is not None and output_path.lower().endswith(('.html', '.htm'))
+        html_diff = difflib.HtmlDiff(wrapcolumn=100) if as_html else None
+        text_parts = []
+        html_parts = []
+        for relative in modified:
+            old_bytes = self._read_backup_file(backup_infos[from_id], relative, old_manifest[relative])
+            new_bytes = self._read_backup_file(backup_infos[to_id], relative, new_manifest[relative])
+            title = f"{relative}（{page_names[relative]}）" if relative in page_names else relative
+            try:
+                old_lines = old_bytes.decode('utf-8').splitlines(keepends=True)
+                new_lines = new_bytes.decode('utf-8').splitlines(keepends=True)
+            except UnicodeDecodeError:
+                text_parts.append(f"Binary files a/{relative} and b/{relative} differ\n")
+                html_parts.append(f"<h2>{html.escape(title)}</h2><p>二进制文件，内容不同</p>")
+                continue
+            
+            text_parts.append(''.join(
+                line if line.endswith('\n') else line + '\n'
+                for line in difflib.unified_diff(old_lines, new_lines, f"a/{relative}", f"b/{relative}",
+                                                 f"{from_id}", f"{to_id}")))
+            if html_diff:
+                html_parts.append(f"<h2>{html.escape(title)}</h2>" + html_diff.make_table(
+                    old_lines, new_lines, from_id, to_id, context=True, numlines=3))
+        
+        if show_content:
+            print()
+            print(''.join(text_parts), end='')
+        if output_path:
+            if as_html:
+                # 借用 make_file 生成的完整页面（含样式和图例），把表格部分替换为所有文件的对比
+                page = difflib.HtmlDiff().make_file([], [], from_id, to_id)
+                start = page.index('<table class="diff"')
+                end = page.index('</table>', start) + len('</table>')
+                content = page[:start] + '\n'.join(html_parts) + page[end:]
+            else:
+                content = ''.join(text_parts)
+            Path(output_path).write_text(content, encoding='utf-8')
+            print(f"📝 差异已写入: {output_path}")
+    
+    def _restore_legacy_backup(self, backup_dir: Path, backup_info: Dict) -> bool:
+        """恢复完整副本形式的旧版本备份"""
         restored_files = []
         for file_name in backup_info['files']:
             source_path = backup_dir / file_name
@@ -132,16 +760,186 @@ class BackupManager:
                 if source_path.is_dir():
                     if target_path.exists():
                         shutil.rmtree(target_path)
-                    shutil.copytree(source_path, target_path)
+                    print(CopyEngine.format_stats(self.copy_engine.copy_tree(source_path, target_path)))
                 else:
                     shutil.copy2(source_path, target_path)
                 restored_files.append(file_name)
         
-        print(f"✅ 恢复完成: {backup_id}")
+        print(f"✅ 恢复完成: {backup_info['backup_id']}")
         print(f"📂 恢复文件数: {len(restored_files)}")
         
         return True
     
+    def verify_backups(self, backup_id: Optional[str] = None, sample: Optional[float] = None) -> bool:
+        """
+        校验备份能否完整恢复：并行重新计算备份内容的哈希并与清单比较
+        
+        对象库中的对象只校验一次（无论被多少个备份引用），快照中硬链接的同一文件也只校验一次；
+        归档完整校验时顺序解压整个归档，抽样校验时只解压抽中文件所在的压缩分块
+        
+        Args:
+            backup_id: 只校验指定备份，默认校验全部备份
+            sample: 抽样百分比（如 5 表示随机校验5%的内容），默认全部校验
+            
+        Returns:
+            bool: 是否所有被校验的内容都完好
+        """
+        if backup_id:
+            backups = [backup for backup in self.list_backups() if backup['backup_id'] == backup_id]
+            if not backups:
+                print(f"❌ 备份不存在: {backup_id}")
+                return False
+        else:
+            backups = self.list_backups()
+        
+        # 每个任务校验一项或一个完整归档：(类型, 显示名称, 参数)
+        tasks: List[Tuple[str, str, Tuple]] = []
+        archives: List[Tuple[str, str, Tuple]] = []
+        objects: Dict[str, Tuple[str, int]] = {}
+        snapshot_inodes: Set[Tuple[int, int]] = set()
+        missing: List[str] = []
+        skipped = 0
+        for backup in backups:
+            current_id = backup['backup_id']
+            backup_dir = self.backup_root / current_id
+            if backup['storage'] == 'legacy':
+                skipped += 1
+                continue
+            manifest = self._load_manifest(current_id)
+            if backup['storage'] == 'objects':
+                for relative, entry in manifest.items():
+                    objects.setdefault(entry['sha256'], (f"{current_id}:{relative}", entry['size']))
+            elif backup['storage'] == 'snapshot':
+                for relative, entry in manifest.items():
+                    try:
+                        stat = os.stat(backup_dir / relative)
+                    except FileNotFoundError:
+                        missing.append(f"{current_id}:{relative}")
+                        continue
+                    if (stat.st_dev, stat.st_ino) not in snapshot_inodes:
+                        snapshot_inodes.add((stat.st_dev, stat.st_ino))
+                        tasks.append(('file', f"{current_id}:{relative}",
+                                      (backup_dir / relative, entry['sha256'])))
+            else:
+                backup_info = self._load_backup_info(current_id)
+                archive_path = backup_dir / backup_info['archive'] if backup_info else None
+                if archive_path is None or not archive_path.exists():
+                    missing.append(f"{current_id}:{backup_info['archive'] if backup_info else 'backup_info.json'}")
+                elif sample is None:
+                    archives.append(('archive', current_id, (archive_path, backup_info)))
+                else:
+                    # 归档单独抽样：抽中的文件多于压缩分块数时，顺序解压整个归档反而更快
+                    entries = list(backup_info['manifest'].items())
+                    count = min(len(entries), max(1, round(len(entries) * sample / 100)))
+                    if count >= len(backup_info['archive_members']):
+                        archives.append(('archive', current_id, (archive_path, backup_info)))
+                    else:
+                        archives.extend(('range', f"{current_id}:{relative}", (archive_path, backup_info, entry))
+                                        for relative, entry in random.sample(entries, count))
+        
+        for digest, (label, _) in objects.items():
+            object_path = self._object_path(digest)
+            if object_path.exists():
+                tasks.append(('file', label, (object_path, digest)))
+            else:
+                missing.append(f"{label}（对象 {digest[:12]}）")
+        
+        total = len(tasks)
+        if sample is not None and tasks:
+            count = min(total, max(1, round(total * sample / 100)))
+            tasks = random.sample(tasks, count)
+            print(f"🎲 抽样校验 {sample:g}%: {count}/{total} 项")
+        tasks.extend(archives)
+        
+        stats = {"checked": 0, "bytes": 0}
+        corrupt: List[str] = []
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.copy_engine.workers) as executor:
+            for results in executor.map(self._verify_task, tasks):
+                for label, status, size in results:
+                    stats['checked'] += 1
+                    stats['bytes'] += size
+                    if status == 'corrupt':
+                        corrupt.append(label)
+                    elif status == 'missing':
+                        missing.append(label)
+        seconds = max(time.perf_counter() - start, 1e-9)
+        
+        print(f"🔎 校验 {len(backups) - skipped} 个备份: 检查 {stats['checked']} 项，"
+              f"{stats['bytes'] / 1024 / 1024:.1f} MB，用时 {seconds:.2f}s"
+              f"（{stats['bytes'] / 1024 / 1024 / seconds:.1f} MB/s，{stats['checked'] / seconds:.0f} 项/s）")
+        if skipped:
+            print(f"⏭️  跳过 {skipped} 个没有文件清单的旧版本备份")
+        for label in corrupt[:20]:
+            print(f"❌ 内容损坏: {label}")
+        for label in missing[:20]:
+            print(f"❌ 内容缺失: {label}")
+        if len(corrupt) + len(missing) > 40:
+            print(f"   ... 共 {len(corrupt)} 项损坏，{len(missing)} 项缺失")
+        if corrupt or missing:
+            return False
+        print("✅ 校验通过，备份内容完好")
+        return True
+    
+    def _verify_task(self, task: Tuple[str, str, Tuple]) -> List[Tuple[str, str, int]]:
+        """
+        执行一个校验任务（工作线程）
+        
+        Returns:
+            List[Tuple[str, str, int]]: (显示名称, 状态 ok/corrupt/missing, 校验字节数) 列表
+        """
+        kind, label, args = task
+        try:
+            if kind == 'file':
+                path, expected = args
+                digest = self._hash_file(path)
+                return [(label, 'ok' if digest == expected else 'corrupt', os.path.getsize(path))]
+            if kind == 'range':
+                archive_path, backup_info, entry = args
+                sha256 = hashlib.sha256()
+                for chunk in self._read_archive_range(archive_path, backup_info, entry['offset'], entry['size']):
+                    sha256.update(chunk)
+                return [(label, 'ok' if sha256.hexdigest() == entry['sha256'] else 'corrupt', entry['size'])]
+            return self._verify_archive(label, *args)
+        except FileNotFoundError:
+            return [(label, 'missing', 0)]
+        except (OSError, ValueError, EOFError, zlib.error, lzma.LZMAError, tarfile.TarError):
+            return [(label, 'corrupt', 0)]
+    
+    def _verify_archive(self, backup_id: str, archive_path: Path, backup_info: Dict) -> List[Tuple[str, str, int]]:
+        """顺序解压整个归档，校验清单中的每个文件"""
+        manifest = backup_info['manifest']
+        results = []
+        seen = set()
+        try:
+            with tarfile.open(archive_path, f"r:{backup_info['compression']}") as tar:
+                for member in tar:
+                    entry = manifest.get(member.name)
+                    if entry is None or not member.isfile():
+                        continue
+                    seen.add(member.name)
+                    sha256 = hashlib.sha256()
+                    src = tar.extractfile(member)
+                    for chunk in iter(lambda: src.read(self.HASH_CHUNK_SIZE), b''):
+                        sha256.update(chunk)
+                    status = 'ok' if sha256.hexdigest() == entry['sha256'] else 'corrupt'
+                    results.append((f"{backup_id}:{member.name}", status, member.size))
+        except (OSError, EOFError, zlib.error, lzma.LZMAError, tarfile.TarError):
+            pass
+        # 归档在某处损坏后无法继续解压（tarfile 遇到损坏的文件头也会提前结束），之后的文件都无法恢复
+        unreadable = len(manifest) - len(seen)
+        if unreadable:
+            results.append((f"{backup_id}:{archive_path.name}（{unreadable} 个文件无法读出）", 'corrupt', 0))
+        return results
+    
+    def _load_backup_info(self, backup_id: str) -> Optional[Dict]:
+        """读取备份目录中的备份信息文件（含清单），不存在时返回None"""
+        backup_info_file = self.backup_root / backup_id / "backup_info.json"
+        if not backup_info_file.exists():
+            return None
+        with open(backup_info_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
     def cleanup_old_backups(self, keep_count: int = 10) -> None:
         """
         清理旧备份，保留指定数量的最新备份
@@ -149,47 +947,570 @@ class BackupManager:
         Args:
             keep_count: 保留的备份数量
         """
-        backups = self.list_backups()
-        if len(backups) <= keep_count:
-            print(f"📦 当前备份数量: {len(backups)}，无需清理")
+        def select(backups):
+            return {backup['backup_id'] for backup in backups[-keep_count:]} if keep_count > 0 else set()
+        
+        deleted = self._delete_backups(select)
+        if not deleted:
+            print(f"📦 当前备份数量: {self.count_backups()}，无需清理")
             return
         
-        # 按时间排序，删除旧备份
-        backups.sort(key=lambda x: x['timestamp'], reverse=True)
-        to_delete = backups[keep_count:]
+        print(f"🗑️  清理完成，删除了 {len(deleted)} 个旧备份")
+        # 删除不再被任何备份引用的内容对象
+        self.collect_garbage()
+    
+    def prune_backups(self, policy: Optional[Dict[str, int]] = None, dry_run: bool = False) -> List[str]:
+        """
+        按分级保留策略清理备份（GFS）：在每个时间段内只保留最新的一个备份
+        
+        Args:
+            policy: 各级保留数量，如 {"hourly": 24, "daily": 30, "weekly": 52}，缺省项使用默认值
+            dry_run: 只显示将删除的备份，不做任何修改
+            
+        Returns:
+            List[str]: 删除（或预览模式下将删除）的备份ID列表
+        """
+        policy = dict(self.RETENTION_POLICY, **(policy or {}))
+        kept_by_tier: Dict[str, int] = {}
+        
+        def select(backups):
+            retained, counts = self._select_retained(backups, datetime.now(), policy)
+            kept_by_tier.update(counts)
+            return retained
+        
+        deleted = self._delete_backups(select, dry_run=dry_run)
+        tiers = '，'.join(f"{name} {kept_by_tier.get(name, 0)}/{policy[name]}" for name, _, _ in self.RETENTION_TIERS)
+        if dry_run:
+            print(f"📋 保留策略预览（{tiers}）：将删除 {len(deleted)} 个备份")
+            for backup_id in deleted[:20]:
+                print(f"      {backup_id}")
+            if len(deleted) > 20:
+                print(f"      ... 等 {len(deleted)} 个")
+            return deleted
+        
+        print(f"🗑️  按保留策略（{tiers}）删除了 {len(deleted)} 个备份")
+        self.collect_garbage()
+        return deleted
+    
+    def collect_garbage(self, max_seconds: Optional[float] = None) -> Dict[str, int]:
+        """
+        回收不再被任何备份引用的内容对象（标记-清除）
+        
+        先从索引中标记所有备份清单引用的对象，再按哈希前缀目录逐个清除其余对象。
+        清除过程不加锁，不影响同时进行的备份：最近写入或被重新引用（修改时间已刷新）的对象，
+        以及进行中的备份开始之后写入的对象都会保留。指定 max_seconds 时到时即停止，
+        下次调用从停止的前缀目录继续
+        
+        Args:
+            max_seconds: 本次最多执行的秒数，None表示清除全部前缀目录
+            
+        Returns:
+            Dict[str, int]: 统计，包含 checked、removed、removed_bytes、recent
+        """
+        stats = {"checked": 0, "removed": 0, "removed_bytes": 0, "recent": 0}
+        if not self.objects_root.exists():
+            return stats
+        
+        start = time.time()
+        with self._index() as conn:
+            referenced: Set[str] = {row[0] for row in conn.execute(
+                "SELECT DISTINCT f.sha256 FROM backup_files f JOIN backups b USING (backup_id) "
+                "WHERE b.storage = 'objects'")}
+            oldest_running = conn.execute(
+                "SELECT MIN(started_at) FROM backups_in_progress WHERE started_at > ?",
+                (start - self.STALE_BACKUP_SECONDS,)).fetchone()[0]
+            row = conn.execute("SELECT value FROM gc_state WHERE key = 'sweep_cursor'").fetchone()
+            cursor = row[0] if row else ""
+        cutoff = start - self.GC_GRACE_SECONDS
+        if oldest_running is not None:
+            cutoff = min(cutoff, oldest_running)
+        
+        prefixes = sorted(entry.name for entry in os.scandir(self.objects_root) if entry.is_dir())
+        remaining = [prefix for prefix in prefixes if prefix > cursor]
+        for prefix in remaining:
+            with os.scandir(self.objects_root / prefix) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.tmp'):
+                        continue
+                    stats['checked'] += 1
+                    if prefix + entry.name in referenced:
+                        continue
+                    stat = entry.stat()
+                    if stat.st_mtime >= cutoff:
+                        stats['recent'] += 1
+                        continue
+                    os.unlink(entry.path)
+                    stats['removed'] += 1
+                    stats['removed_bytes'] += stat.st_size
+            cursor = prefix
+            if max_seconds is not None and time.time() - start >= max_seconds and prefix != remaining[-1]:
+                break
+        else:
+            cursor = ""
+        
+        with self._index() as conn:
+            conn.execute("INSERT OR REPLACE INTO gc_state (key, value) VALUES ('sweep_cursor', ?)", (cursor,))
+        
+        print(f"🧹 垃圾回收: 检查 {stats['checked']} 个对象，删除 {stats['removed']} 个"
+              f"（{stats['removed_bytes']} 字节），保留 {stats['recent']} 个近期写入的未引用对象")
+        if cursor:
+            print(f"⏸️  已清除到前缀 {cursor}，下次回收将从这里继续")
+        return stats
+    
+    def _select_retained(self, backups: List[Dict], now: datetime,
+                         policy: Dict[str, int]) -> Tuple[Set[str], Dict[str, int]]:
+        """
+        计算保留策略下需要保留的备份（最新的备份总是保留）
+        
+        Args:
+            backups: 备份列表（按时间从旧到新）
+            now: 当前时间
+            policy: 各级保留数量
+            
+        Returns:
+            Tuple[Set[str], Dict[str, int]]: (保留的备份ID, 各级保留数量)
+        """
+        retained = {backups[-1]['backup_id']} if backups else set()
+        counts = {name: 0 for name, _, _ in self.RETENTION_TIERS}
+        seen_buckets = set()
+        # 从新到旧遍历，每个时间段内第一个遇到的即为该时间段最新的备份
+        for backup in reversed(backups):
+            created_at = datetime.fromisoformat(backup['timestamp'])
+            for name, unit, bucket_of in self.RETENTION_TIERS:
+                # 每级只在对应时间窗口内（如最近24小时）保留，且最多保留指定数量
+                if counts[name] >= policy[name] or now - created_at >= unit * policy[name]:
+                    continue
+                bucket = (name, bucket_of(created_at))
+                if bucket not in seen_buckets:
+                    seen_buckets.add(bucket)
+                    retained.add(backup['backup_id'])
+                    counts[name] += 1
+        return retained, counts
+    
+    def _delete_backups(self, select_retained, dry_run: bool = False) -> List[str]:
+        """
+        删除保留集合之外的备份（进行中备份的比较基准始终保留）
+        
+        在同一个写事务中选出并删除索引记录，避免与同时开始的备份竞争基准，之后再删除备份目录
+        
+        Args:
+            select_retained: 根据备份列表（从旧到新）返回保留的备份ID集合的函数
+            dry_run: 只返回将删除的备份，不做任何修改
+            
+        Returns:
+            List[str]: 删除的备份ID列表
+        """
+        with self._index() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            backups = [self._row_to_backup(row) for row in conn.execute(
+                f"SELECT {', '.join(self.BACKUP_COLUMNS)} FROM backups ORDER BY timestamp")]
+            retained = select_retained(backups)
+            retained.update(row[0] for row in conn.execute(
+                "SELECT base_backup FROM backups_in_progress WHERE base_backup IS NOT NULL AND started_at > ?",
+                (time.time() - self.STALE_BACKUP_SECONDS,)))
+            to_delete = [backup['backup_id'] for backup in backups if backup['backup_id'] not in retained]
+            if dry_run or not to_delete:
+                conn.rollback()
+                return to_delete
+            conn.executemany("DELETE FROM backup_files WHERE backup_id = ?", ((b,) for b in to_delete))
+            conn.executemany("DELETE FROM backups WHERE backup_id = ?", ((b,) for b in to_delete))
+            conn.commit()
+            conn.execute("PRAGMA incremental_vacuum")
         
-        deleted_count = 0
-        for backup_info in to_delete:
-            backup_dir = self.backup_root / backup_info['backup_id']
+        for backup_id in to_delete:
+            backup_dir = self.backup_root / backup_id
             if backup_dir.exists():
                 shutil.rmtree(backup_dir)
-                deleted_count += 1
+        return to_delete
+    
+    def _backup_items(self) -> List[str]:
+        """
+        本次需要备份的项：关键文件和目录、shell布局的页面外壳，以及已构建的静态资源
         
-        # 更新备份索引
-        remaining_backups = backups[:keep_count]
-        self._update_backup_index_list(remaining_backups)
+        shell布局下页面只是片段，缺少页面外壳时无法打开，因此一并备份项目中存在的外壳文件；
+        恢复的页面引用的是备份时的带指纹资源（如 style.1a2b3c4d.css），重新构建时旧指纹文件会被删除，
+        因此一并备份构建清单中记录的带指纹文件
+        """
+        shell_items = [name for name in TemplateGenerator.SHELL_FILES.values()
+                       if (self.project_root / name).exists()]
+        items = self.BACKUP_ITEMS + shell_items + self.BUILT_ASSET_ITEMS
+        manifest_file = self.project_root / AssetPipeline.MANIFEST_NAME
+        if manifest_file.exists():
+            try:
+                with open(manifest_file, 'r', encoding='utf-8') as f:
+                    assets = json.load(f).get('assets', {})
+            except (OSError, ValueError) as e:
+                print(f"⚠️  读取构建清单失败，不备份带指纹的资源: {e}")
+                assets = {}
+            items = items + sorted(set(assets.values()) - set(items))
+        return items
+    
+    def _scan_item(self, item: str) -> List[Tuple[str, os.stat_result]]:
+        """
+        使用os.scandir遍历备份项，返回其中所有文件的相对路径和stat信息
+        
+        Args:
+            item: 备份项（相对于项目根目录的文件或目录）
+            
+        Returns:
+            List[Tuple[str, os.stat_result]]: (相对路径, stat) 列表，按路径排序
+        """
+        item_path = self.project_root / item
+        if not item_path.is_dir():
+            return [(item, item_path.stat())]
         
-        print(f"🗑️  清理完成，删除了 {deleted_count} 个旧备份")
+        files = []
+        pending = [item]
+        while pending:
+            relative_dir = pending.pop()
+            with os.scandir(self.project_root / relative_dir) as entries:
+                entries = list(entries)
+            names = {entry.name for entry in entries}
+            for entry in entries:
+                relative = f"{relative_dir}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(relative)
+                elif entry.is_file() and not self._is_precompressed_sidecar(entry.name, names):
+                    files.append((relative, entry.stat()))
+        files.sort(key=lambda pair: pair[0])
+        return files
     
-    def _update_backup_index(self, backup_info: Dict) -> None:
-        """更新备份索引"""
-        backup_index = {"backups": []}
+    def _is_precompressed_sidecar(self, name: str, names: Set[str]) -> bool:
+        """是否为构建时生成的预压缩文件（同目录下存在对应的源文件），可随时重新生成，无需备份"""
+        return any(name.endswith(suffix) and name[:-len(suffix)] in names
+                   for suffix in AssetPipeline.PRECOMPRESS_ENCODINGS)
+    
+    def _begin_backup(self, backup_id: str, storage: str, use_baseline: bool) -> Optional[str]:
+        """
+        登记进行中的备份，并选出同一存储方式的最近一个备份作为增量备份的比较基准
+        
+        选择基准和登记在同一个写事务中完成，清理旧备份时不会删除该基准
+        
+        Returns:
+            Optional[str]: 基准备份ID，没有可用备份或不使用基准时为None
+        """
+        with self._index() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = None
+            if use_baseline:
+                row = conn.execute(
+                    "SELECT backup_id FROM backups WHERE storage = ? AND file_count > 0 "
+                    "ORDER BY timestamp DESC LIMIT 1", (storage,)).fetchone()
+            base_backup = row[0] if row else None
+            conn.execute(
+                "INSERT OR REPLACE INTO backups_in_progress (backup_id, storage, base_backup, started_at) "
+                "VALUES (?, ?, ?, ?)", (backup_id, storage, base_backup, time.time()))
+        return base_backup
+    
+    def _end_backup(self, backup_id: str) -> None:
+        """取消进行中备份的登记（备份完成或失败时）"""
+        with self._index() as conn:
+            conn.execute("DELETE FROM backups_in_progress WHERE backup_id = ?", (backup_id,))
+    
+    def _hash_file(self, file_path: Union[str, Path]) -> str:
+        """分块计算文件的SHA-256"""
+        sha256 = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+    
+    def _object_path(self, digest: str) -> Path:
+        """内容对象路径（按哈希前两位分目录）"""
+        return self.objects_root / digest[:2] / digest[2:]
+    
+    def _hash_files(self, file_paths: List[str]) -> List[str]:
+        """并行计算多个文件的SHA-256（按输入顺序返回）"""
+        if len(file_paths) <= 1:
+            return [self._hash_file(file_path) for file_path in file_paths]
+        with ThreadPoolExecutor(max_workers=self.copy_engine.workers) as executor:
+            return list(executor.map(self._hash_file, file_paths))
+    
+    def _store_objects(self, changed_files: List[Tuple[str, str]],
+                       manifest: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        将对象库中尚不存在的文件内容并行复制到对象库（先写临时文件，复制完成后原子重命名）
+        
+        Returns:
+            Dict[str, Any]: 复制统计
+        """
+        # 临时文件 -> 对象路径；同一批中内容相同的文件只复制一次
+        object_paths: Dict[str, Path] = {}
+        pairs = []
+        for relative, file_path in changed_files:
+            object_path = self._object_path(manifest[relative]['sha256'])
+            temp_path = self._temp_path(object_path)
+            if str(temp_path) in object_paths:
+                continue
+            if object_path.exists():
+                # 刷新修改时间，避免同时进行的垃圾回收删除这个即将被新备份引用的对象
+                try:
+                    os.utime(object_path)
+                    continue
+                except FileNotFoundError:
+                    pass
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            object_paths[str(temp_path)] = object_path
+            pairs.append((file_path, temp_path))
+        
+        def finish(source, temp_path):
+            os.replace(temp_path, object_paths[str(temp_path)])
+        
+        return self.copy_engine.copy_files(pairs, preserve_metadata=False, on_copied=finish)
+    
+    def _link_file(self, source_path: Path, target_path: Path) -> bool:
+        """
+        创建指向上一个快照副本的硬链接
+        
+        Returns:
+            bool: 是否成功（文件系统不支持硬链接或副本已丢失时返回False，由调用方改为复制）
+        """
+        try:
+            os.link(source_path, target_path)
+            return True
+        except OSError:
+            return False
+    
+    def _add_to_archive(self, tar: tarfile.TarFile, file_path: Union[str, Path], relative: str) -> Tuple[str, int]:
+        """
+        将文件流式写入归档
+        
+        Returns:
+            Tuple[str, int]: (文件SHA-256, 文件数据在未压缩tar流中的偏移)
+        """
+        tarinfo = tar.gettarinfo(str(file_path), arcname=relative)
+        # 浮点修改时间会使每个文件额外生成一个PAX扩展头；恢复时以清单中的mtime_ns为准
+        tarinfo.mtime = int(tarinfo.mtime)
+        with open(file_path, 'rb') as f:
+            reader = _HashingReader(f)
+            tar.addfile(tarinfo, reader)
+        # addfile之后tar.offset位于补齐到512字节的文件数据末尾
+        padded_size = -(-tarinfo.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+        return reader.sha256.hexdigest(), tar.offset - padded_size
+    
+    def _read_archive_range(self, archive_path: Path, backup_info: Dict, offset: int,
+                            size: int) -> Iterator[bytes]:
+        """
+        从归档中读取未压缩tar流的指定区间：定位到包含起始偏移的压缩分块，
+        从该分块开始解压，不读取之前的内容
+        """
+        members = backup_info['archive_members']
+        index = min(offset // backup_info['chunk_size'], len(members) - 1)
+        skip = offset - members[index][0]
+        remaining = size
+        
+        def new_decompressor():
+            if backup_info['compression'] == 'xz':
+                return lzma.LZMADecompressor(format=lzma.FORMAT_XZ)
+            return zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        
+        with open(archive_path, 'rb') as f:
+            f.seek(members[index][1])
+            decompressor = new_decompressor()
+            while remaining > 0:
+                data = f.read(self.HASH_CHUNK_SIZE)
+                if not data:
+                    raise ValueError(f"归档文件不完整: {archive_path}")
+                while data and remaining > 0:
+                    output = decompressor.decompress(data)
+                    # 一个成员解压结束后，剩余数据属于下一个独立成员
+                    if decompressor.eof:
+                        data = decompressor.unused_data
+                        decompressor = new_decompressor()
+                    else:
+                        data = b''
+                    if skip:
+                        dropped = min(skip, len(output))
+                        output = output[dropped:]
+                        skip -= dropped
+                    output = output[:remaining]
+                    remaining -= len(output)
+                    if output:
+                        yield output
+    
+    def _restore_archive(self, backup_dir: Path, backup_info: Dict, relatives: List[str]) -> None:
+        """
+        从归档恢复指定文件
+        
+        文件数少于压缩分块数时逐个定位解压，否则顺序读取整个归档一次
+        """
+        manifest = backup_info['manifest']
+        archive_path = backup_dir / backup_info['archive']
+        if len(relatives) < len(backup_info['archive_members']):
+            for relative in relatives:
+                entry = manifest[relative]
+                self._materialize(self._read_archive_range(archive_path, backup_info, entry['offset'], entry['size']),
+                                  entry, self.project_root / relative)
+            return
+        
+        wanted = set(relatives)
+        with tarfile.open(archive_path, f"r:{backup_info['compression']}") as tar:
+            for member in tar:
+                entry = manifest.get(member.name)
+                if entry is None or member.name not in wanted or not member.isfile():
+                    continue
+                src = tar.extractfile(member)
+                self._materialize(iter(lambda: src.read(self.HASH_CHUNK_SIZE), b''),
+                                  entry, self.project_root / member.name)
+    
+    def _entry_source(self, backup_dir: Path, backup_info: Dict, relative: str,
+                      entry: Dict[str, Any]) -> Path:
+        """清单项对应的备份内容位置"""
+        if backup_info.get('storage') == 'snapshot':
+            return backup_dir / relative
+        return self._object_path(entry['sha256'])
+    
+    def _materialize_files(self, sources: Dict[str, Path], manifest: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        并行将备份内容写回项目文件
         
-        if self.backup_index_file.exists():
-            with open(self.backup_index_file, 'r', encoding='utf-8') as f:
-                backup_index = json.load(f)
+        Args:
+            sources: 相对路径 -> 备份内容文件
+            manifest: 文件清单
+            
+        Returns:
+            Dict[str, Any]: 复制统计
+        """
+        targets: Dict[str, Tuple[Path, Dict[str, Any]]] = {}
+        pairs = []
+        parents: Set[Path] = set()
+        for relative, source in sources.items():
+            target_path = self.project_root / relative
+            if target_path.parent not in parents:
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                parents.add(target_path.parent)
+            temp_path = self._temp_path(target_path)
+            targets[str(temp_path)] = (target_path, manifest[relative])
+            pairs.append((source, temp_path))
         
-        backup_index['backups'].append(backup_info)
+        def finish(source, temp_path):
+            target_path, entry = targets[str(temp_path)]
+            self._finish_restored_file(temp_path, entry, target_path)
         
-        with open(self.backup_index_file, 'w', encoding='utf-8') as f:
-            json.dump(backup_index, f, ensure_ascii=False, indent=2)
+        return self.copy_engine.copy_files(pairs, preserve_metadata=False, on_copied=finish)
+    
+    def _temp_path(self, path: Path) -> Path:
+        """写入完成前使用的临时文件路径（与目标文件同目录，便于原子重命名）"""
+        return path.with_name(f"{path.name}.{os.getpid()}.tmp")
     
-    def _update_backup_index_list(self, backups: List[Dict]) -> None:
-        """更新备份索引列表"""
-        backup_index = {"backups": backups}
+    def _finish_restored_file(self, temp_path: Path, entry: Dict[str, Any], target_path: Path) -> None:
+        """还原权限和修改时间，并原子替换目标文件"""
+        os.chmod(temp_path, entry['mode'])
+        os.utime(temp_path, ns=(entry['mtime_ns'], entry['mtime_ns']))
+        os.replace(temp_path, target_path)
+    
+    def _materialize(self, source: Union[Path, Iterable[bytes]], entry: Dict[str, Any],
+                     target_path: Path) -> None:
+        """
+        将备份内容写回项目文件，并还原权限和修改时间
+        
+        Args:
+            source: 备份内容文件路径，或归档中解压出的数据块
+            entry: 清单项
+            target_path: 目标文件路径
+        """
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._temp_path(target_path)
+        if isinstance(source, Path):
+            CopyEngine.copy_file(source, temp_path, preserve_metadata=False)
+        else:
+            sha256 = hashlib.sha256()
+            try:
+                with open(temp_path, 'wb') as f:
+                    for chunk in source:
+                        sha256.update(chunk)
+                        f.write(chunk)
+            except BaseException:
+                temp_path.unlink(missing_ok=True)
+                raise
+            if sha256.hexdigest() != entry['sha256']:
+                temp_path.unlink()
+                raise ValueError(f"{target_path.name} 校验失败，归档内容可能已损坏")
+        self._finish_restored_file(temp_path, entry, target_path)
+    
+    def _load_manifest(self, backup_id: str) -> Dict[str, Dict[str, Any]]:
+        """从索引读取备份的文件清单（旧版本备份没有清单，返回空字典）"""
+        with self._index() as conn:
+            rows = conn.execute(
+                f"SELECT path, {', '.join(self.FILE_COLUMNS)} FROM backup_files WHERE backup_id = ?",
+                (backup_id,)).fetchall()
+        manifest = {}
+        for row in rows:
+            entry = {column: row[column] for column in self.FILE_COLUMNS}
+            if entry['offset'] is None:
+                del entry['offset']
+            manifest[row['path']] = entry
+        return manifest
+    
+    @contextmanager
+    def _index(self):
+        """
+        打开备份索引数据库（WAL模式，支持多个进程同时备份）；正常退出时提交事务
         
-        with open(self.backup_index_file, 'w', encoding='utf-8') as f:
-            json.dump(backup_index, f, ensure_ascii=False, indent=2)
+        首次创建索引时导入旧版本的 backup_index.json
+        """
+        created = not self.backup_index_db.exists()
+        conn = sqlite3.connect(str(self.backup_index_db), timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            if created:
+                # 清理旧备份会删除大量文件行，允许之后回收空闲页
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.INDEX_SCHEMA)
+            if created and self.backup_index_file.exists():
+                self._import_json_index(conn)
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+    
+    def _import_json_index(self, conn: sqlite3.Connection) -> None:
+        """导入旧版本的JSON备份索引（连同各备份目录中的清单），导入后重命名原文件"""
+        with open(self.backup_index_file, 'r', encoding='utf-8') as f:
+            backups = json.load(f).get('backups', [])
+        # 旧版本同一秒内创建的备份ID相同，后一个已覆盖了前一个的备份目录，只导入最后一条
+        backups = list({backup_info['backup_id']: backup_info for backup_info in backups}.values())
+        for backup_info in backups:
+            manifest = {}
+            backup_info_file = self.backup_root / backup_info['backup_id'] / "backup_info.json"
+            if backup_info_file.exists():
+                with open(backup_info_file, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f).get('manifest', {})
+            # 没有清单的是完整副本形式的旧版本备份
+            backup_info.setdefault('storage', 'objects' if manifest else 'legacy')
+            self._insert_backup(conn, backup_info, manifest)
+        conn.commit()
+        self.backup_index_file.rename(self.backup_index_file.with_suffix('.json.migrated'))
+        print(f"📦 已将 {len(backups)} 个备份的索引导入 {self.backup_index_db.name}")
+    
+    def _insert_backup(self, conn: sqlite3.Connection, backup_info: Dict,
+                       manifest: Dict[str, Dict[str, Any]]) -> None:
+        """写入一个备份及其文件清单"""
+        values = dict(backup_info, items=json.dumps(backup_info['files'], ensure_ascii=False))
+        values['full'] = int(values.get('full', True))
+        conn.execute(
+            f"INSERT INTO backups ({', '.join(self.BACKUP_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(self.BACKUP_COLUMNS))})",
+            [values.get(column, 0 if column in ('file_count', 'total_size', 'new_objects', 'new_bytes') else None)
+             for column in self.BACKUP_COLUMNS])
+        conn.executemany(
+            f"INSERT INTO backup_files (backup_id, path, {', '.join(self.FILE_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * (len(self.FILE_COLUMNS) + 2))})",
+            ([backup_info['backup_id'], path] + [entry.get(column) for column in self.FILE_COLUMNS]
+             for path, entry in manifest.items()))
+    
+    def _row_to_backup(self, row: sqlite3.Row) -> Dict:
+        """将索引行转换为备份信息字典"""
+        backup_info = {column: row[column] for column in self.BACKUP_COLUMNS if column != 'items'}
+        backup_info['files'] = json.loads(row['items'])
+        backup_info['full'] = bool(backup_info['full'])
+        return backup_info
+    
+    def _update_backup_index(self, backup_info: Dict, manifest: Dict[str, Dict[str, Any]]) -> None:
+        """更新备份索引"""
+        with self._index() as conn:
+            self._insert_backup(conn, backup_info, manifest)
 
 
 def main():
@@ -198,42 +1519,91 @@ def main():
     
     parser = argparse.ArgumentParser(description="UX工程师备份管理工具")
     parser.add_argument("project_path", help="项目路径")
-    parser.add_argument("--action", choices=['backup', 'list', 'restore', 'cleanup'], 
+    parser.add_argument("--action", choices=['backup', 'list', 'restore', 'extract', 'diff', 'verify', 'cleanup', 'prune', 'gc'], 
                        default='backup', help="操作类型")
     parser.add_argument("--description", "-d", help="备份描述")
     parser.add_argument("--backup-id", help="备份ID（用于恢复）")
     parser.add_argument("--keep", type=int, default=10, help="保留的备份数量")
     parser.add_argument("--confirm", action='store_true', help="确认恢复操作")
+    parser.add_argument("--full", action='store_true', help="完整备份：重新计算所有文件的哈希，不沿用上一个备份的结果")
+    parser.add_argument("--storage", choices=BackupManager.STORAGE_TYPES, default='objects',
+                       help="存储方式：objects（内容寻址对象库）、snapshot（硬链接快照目录）或 archive（压缩归档文件）")
+    parser.add_argument("--compression", choices=BackupManager.COMPRESSION_TYPES, default='gz',
+                       help="归档压缩格式（用于 --storage archive）")
+    parser.add_argument("--path", help="要提取的文件路径（相对于项目根目录，用于 extract）")
+    parser.add_argument("--output", "-o", help="提取文件的输出路径（默认恢复到项目中的原位置）；"
+                                               "diff 时为差异输出文件，以 .html 结尾时生成并排对比页面")
+    parser.add_argument("--from", dest="from_id", help="比较的起始备份ID（用于 diff）")
+    parser.add_argument("--to", dest="to_id", help="比较的目标备份ID（用于 diff，默认最新的备份）")
+    parser.add_argument("--content", action='store_true', help="输出修改文件的逐行差异（用于 diff）")
+    parser.add_argument("--search", help="只列出描述中包含该关键字的备份（用于 list）")
+    parser.add_argument("--restore-path", action='append',
+                       help="只恢复指定文件或目录前缀（如 pages/role1/moduleA，可重复指定）")
+    parser.add_argument("--dry-run", action='store_true', help="只预览不修改：restore 显示将修改、新增和删除的文件，prune 显示将删除的备份")
+    
+    parser.add_argument("--workers", type=int, help="并行复制线程数（默认CPU核数×4，最多32）")
+    parser.add_argument("--hourly", type=int, help=f"保留策略：按小时保留的数量（用于 prune，默认{BackupManager.RETENTION_POLICY['hourly']}）")
+    parser.add_argument("--daily", type=int, help=f"保留策略：按天保留的数量（用于 prune，默认{BackupManager.RETENTION_POLICY['daily']}）")
+    parser.add_argument("--weekly", type=int, help=f"保留策略：按周保留的数量（用于 prune，默认{BackupManager.RETENTION_POLICY['weekly']}）")
+    parser.add_argument("--sample", type=float, help="抽样校验的百分比，如 5 表示随机校验5%%的内容（用于 verify）")
+    parser.add_argument("--gc-seconds", type=float, help="垃圾回收最多执行的秒数，未完成的部分下次继续（用于 gc）")
     
     args = parser.parse_args()
     
-    backup_manager = BackupManager(args.project_path)
+    backup_manager = BackupManager(args.project_path, workers=args.workers)
     
     if args.action == 'backup':
         description = args.description or f"手动备份 - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-        backup_manager.create_backup(description)
+        backup_manager.create_backup(description, full=args.full, storage=args.storage,
+                                     compression=args.compression)
     
     elif args.action == 'list':
-        backups = backup_manager.list_backups()
+        backups = backup_manager.list_backups(limit=10, keyword=args.search)  # 显示最新10个
         if not backups:
             print("📦 暂无备份")
         else:
-            print(f"📦 共有 {len(backups)} 个备份:")
-            for backup in reversed(backups[-10:]):  # 显示最新10个
+            print(f"📦 共有 {backup_manager.count_backups(args.search)} 个备份:")
+            for backup in reversed(backups):
                 print(f"  🗂️  {backup['backup_id']}")
                 print(f"      时间: {backup['timestamp']}")
                 print(f"      描述: {backup['description']}")
-                print(f"      文件: {len(backup['files'])} 个")
+                print(f"      文件: {backup.get('file_count', len(backup['files']))} 个")
                 print()
     
     elif args.action == 'restore':
         if not args.backup_id:
             print("❌ 恢复操作需要指定 --backup-id")
             return
-        backup_manager.restore_backup(args.backup_id, args.confirm)
+        backup_manager.restore_backup(args.backup_id, args.confirm, paths=args.restore_path,
+                                      dry_run=args.dry_run)
+    
+    elif args.action == 'extract':
+        if not args.backup_id or not args.path:
+            print("❌ 提取操作需要指定 --backup-id 和 --path")
+            return
+        backup_manager.extract_file(args.backup_id, args.path, args.output)
+    
+    elif args.action == 'diff':
+        if not args.from_id:
+            print("❌ 比较操作需要指定 --from")
+            return
+        backup_manager.diff_backups(args.from_id, args.to_id, show_content=args.content,
+                                    output_path=args.output)
+    
+    elif args.action == 'verify':
+        if not backup_manager.verify_backups(args.backup_id, args.sample):
+            sys.exit(1)
     
     elif args.action == 'cleanup':
         backup_manager.cleanup_old_backups(args.keep)
+    
+    elif args.action == 'prune':
+        policy = {name: value for name, value in
+                  (('hourly', args.hourly), ('daily', args.daily), ('weekly', args.weekly)) if value is not None}
+        backup_manager.prune_backups(policy, dry_run=args.dry_run)
+    
+    elif args.action == 'gc':
+        backup_manager.collect_garbage(args.gc_seconds)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,234 @@
+"""
+单文件导出器
+将整个原型（导航页、menu.json、样式脚本及全部页面）打包为一个可直接双击打开的HTML文件
+"""
+
+import base64
+import gzip
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class BundleExporter:
+    """单文件导出器类"""
+
+    STYLESHEET_PATTERN = re.compile(r'<link rel="stylesheet" href="(?P<url>[^"#?:]+)"\s*/?>')
+    SCRIPT_PATTERN = re.compile(r'<script src="(?P<url>[^"#?:]+)"></script>')
+    # 导航页打开页面的语句（shell布局下经由页面外壳加载）
+    PREVIEW_SRC_PATTERN = re.compile(
+        r"document\.getElementById\('preview'\)\.src = "
+        r"(?:'(?P<shell>[^'?]+)\?page=' \+ encodeURIComponent\(url\)|url);"
+    )
+    SHELL_LOADER_PATTERN = re.compile(r'\s*<script id="shell-loader">.*?</script>', re.DOTALL)
+    SHELL_BODY_MARKER = 'id="page-body"></div>'
+    TITLE_PATTERN = re.compile(r'<title>.*?</title>', re.DOTALL)
+    RELATIVE_REFERENCE_PATTERN = re.compile(r'(?P<attr>href|src)="(?![a-z][a-z0-9+.-]*:|/|#)(?P<url>[^"]+)"', re.I)
+
+    # 导航页加载前注入：拦截menu.json请求，提供页面懒解压
+    RUNTIME_TEMPLATE = '''<script>
+    (function () {
+      const bundleMenu = __MENU__;
+      const bundleAssets = __ASSETS__;
+      const pageCache = new Map();
+      const nativeFetch = window.fetch ? window.fetch.bind(window) : null;
+
+      window.fetch = function (url, options) {
+        if (url === 'menu.json') {
+          return Promise.resolve(new Response(JSON.stringify(bundleMenu), {
+            headers: { 'Content-Type': 'application/json' }
+          }));
+        }
+        return nativeFetch(url, options);
+      };
+
+      async function inflatePage(url) {
+        if (pageCache.has(url)) {
+          return pageCache.get(url);
+        }
+        const blob = document.getElementById('bundle-page:' + url);
+        if (!blob) {
+          return '<p style="padding:20px;color:#666">页面未包含在导出文件中: ' + url + '</p>';
+        }
+        const bytes = Uint8Array.from(atob(blob.textContent.trim()), c => c.charCodeAt(0));
+        const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+        const html = (await new Response(stream).text())
+          .replace(/<!--bundle-css:(.+?)-->/g, (m, key) => '<style>' + (bundleAssets[key] || '') + '</style>')
+          .replace(/<!--bundle-js:(.+?)-->/g, (m, key) => '<script>' + (bundleAssets[key] || '') + '<\\/script>');
+        pageCache.set(url, html);
+        return html;
+      }
+
+      window.openBundledPage = async function (url) {
+        document.getElementById('preview').srcdoc = await inflatePage(url);
+      };
+    })();
+  </script>'''
+
+    def __init__(self, project_root: str):
+        self.project_root = Path(project_root)
+
+    def export(self, output_file: str) -> bool:
+        """
+        导出单文件原型
+
+        Args:
+            output_file: 输出HTML文件路径
+
+        Returns:
+            bool: 导出是否成功
+        """
+        try:
+            index_file = self.project_root / "index.html"
+            menu_file = self.project_root / "menu.json"
+            if not index_file.exists() or not menu_file.exists():
+                print(f"❌ 项目 {self.project_root} 缺少 index.html 或 menu.json")
+                return False
+
+            with open(menu_file, 'r', encoding='utf-8') as f:
+                menu_data = json.load(f)
+
+            assets = {}
+            index_html = self._inline_index_assets(index_file.read_text(encoding='utf-8'), index_file)
+            preview = self.PREVIEW_SRC_PATTERN.search(index_html)
+            if not preview:
+                print("❌ index.html 结构不符合预期，无法接管页面预览")
+                return False
+            index_html = index_html[:preview.start()] + "openBundledPage(url);" + index_html[preview.end():]
+
+            # shell布局：页面文件只是片段，打包时与页面外壳组合为完整页面
+            shell_html = None
+            if preview.group('shell'):
+                shell_file = self.project_root / preview.group('shell')
+                if not shell_file.exists():
+                    print(f"❌ 页面外壳文件不存在: {shell_file}")
+                    return False
+                shell_html = self.SHELL_LOADER_PATTERN.sub('', shell_file.read_text(encoding='utf-8'))
+
+            page_urls = self._collect_page_urls(menu_data)
+            page_titles = self._collect_page_titles(menu_data)
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as executor:
+                blobs = list(executor.map(
+                    lambda url: self._pack_page(url, assets, shell_html, page_titles.get(url)), page_urls))
+
+            runtime = (self.RUNTIME_TEMPLATE
+                       .replace('__MENU__', self._script_safe(json.dumps(menu_data, ensure_ascii=False)))
+                       .replace('__ASSETS__', self._script_safe(json.dumps(assets, ensure_ascii=False))))
+            index_html = index_html.replace('</head>', f'  {runtime}\n</head>', 1)
+
+            page_elements = [
+                f'<script type="text/plain" id="bundle-page:{url}">{blob}</script>'
+                for url, blob in zip(page_urls, blobs) if blob is not None
+            ]
+            index_html = index_html.replace('</body>', '\n'.join(page_elements) + '\n</body>', 1)
+
+            output_path = Path(output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(index_html, encoding='utf-8')
+
+            packed = sum(1 for blob in blobs if blob is not None)
+            print(f"✅ 单文件导出完成: {output_path}")
+            print(f"📄 已打包页面: {packed}/{len(page_urls)} 个，文件大小 {output_path.stat().st_size} 字节")
+            return True
+
+        except Exception as e:
+            print(f"❌ 单文件导出失败: {e}")
+            return False
+
+    def _inline_index_assets(self, html: str, html_file: Path) -> str:
+        """将导航页引用的本地样式和脚本直接内联"""
+        def inline_css(match):
+            content = self._read_local_asset(html_file, match.group('url'))
+            if content is None:
+                return match.group(0)
+            return f'<style>\n{content}\n</style>'
+
+        def inline_js(match):
+            content = self._read_local_asset(html_file, match.group('url'))
+            if content is None:
+                return match.group(0)
+            return f'<script>\n{self._script_safe(content)}\n</script>'
+
+        html = self.STYLESHEET_PATTERN.sub(inline_css, html)
+        return self.SCRIPT_PATTERN.sub(inline_js, html)
+
+    def _pack_page(self, url: str, assets: Dict[str, str], shell_html: Optional[str] = None,
+                   title: Optional[str] = None) -> Optional[str]:
+        """压缩单个页面，本地样式和脚本替换为占位符（共享资源只保存一份）"""
+        page_file = self.project_root / url
+        if not page_file.exists():
+            print(f"⚠️  页面文件不存在，已跳过: {url}")
+            return None
+
+        html = page_file.read_text(encoding='utf-8')
+        if shell_html is not None:
+            html = self._compose_shell_page(shell_html, html, page_file, title)
+
+        def placeholder(kind: str):
+            def replace(match):
+                logical = self._logical_path(page_file, match.group('url'))
+                content = self._read_local_asset(page_file, match.group('url'))
+                if content is None:
+                    return match.group(0)
+                assets.setdefault(logical, self._script_safe(content) if kind == 'js' else content)
+                return f'<!--bundle-{kind}:{logical}-->'
+            return replace
+
+        html = self.STYLESHEET_PATTERN.sub(placeholder('css'), html)
+        html = self.SCRIPT_PATTERN.sub(placeholder('js'), html)
+        compressed = gzip.compress(html.encode('utf-8'), compresslevel=9, mtime=0)
+        return base64.b64encode(compressed).decode('ascii')
+
+    def _compose_shell_page(self, shell_html: str, fragment: str, page_file: Path,
+                            title: Optional[str] = None) -> str:
+        """将页面片段放入页面外壳，外壳中的相对引用改为相对页面所在目录，标题改为页面标题"""
+        to_root = Path(os.path.relpath(self.project_root, page_file.parent)).as_posix()
+        shell_html = self.RELATIVE_REFERENCE_PATTERN.sub(
+            lambda m: f'{m.group("attr")}="{to_root}/{m.group("url")}"', shell_html)
+        if title:
+            shell_html = self.TITLE_PATTERN.sub(
+                lambda m: f'<title>{escape(title)}</title>', shell_html, count=1)
+        return shell_html.replace(self.SHELL_BODY_MARKER, f'id="page-body">\n{fragment}\n</div>', 1)
+
+    def _collect_page_urls(self, menu_data: List[Dict]) -> List[str]:
+        """从menu.json中收集所有页面地址（去重并保持顺序）"""
+        urls = []
+        for role in menu_data:
+            for module in role.get('modules', []):
+                for page in module.get('pages', []):
+                    url = page.get('url')
+                    if url and url not in urls:
+                        urls.append(url)
+        return urls
+
+    def _collect_page_titles(self, menu_data: List[Dict]) -> Dict[str, str]:
+        """从menu.json中收集页面地址 -> 页面标题（页面名称 - 角色名称，与独立页面一致）"""
+        titles = {}
+        for role in menu_data:
+            for module in role.get('modules', []):
+                for page in module.get('pages', []):
+                    if page.get('url'):
+                        titles.setdefault(page['url'], f"{page.get('name')} - {role.get('name')}")
+        return titles
+
+    def _logical_path(self, html_file: Path, url: str) -> str:
+        """将页面中的相对引用转换为相对项目根目录的路径"""
+        target = os.path.normpath(os.path.join(
+            os.path.relpath(html_file.parent, self.project_root), url))
+        return Path(target).as_posix()
+
+    def _read_local_asset(self, html_file: Path, url: str) -> Optional[str]:
+        """读取页面引用的本地资源，不存在时返回None"""
+        asset_file = self.project_root / self._logical_path(html_file, url)
+        if not asset_file.is_file():
+            return None
+        return asset_file.read_text(encoding='utf-8')
+
+    @staticmethod
+    def _script_safe(content: str) -> str:
+        """避免内联内容提前闭合script标签"""
+        return content.replace('</script', '<\\/script')
@@ -24,6 +24,7 @@ class CLIParser:
   python main.py -n my-project --title "我的产品"  # 自定义项目标题
   python main.py -n my-project --platform pc     # 创建PC端项目
   python main.py -n my-project --platform mobile # 创建手机端项目（默认）
+  python main.py -n my-project --layout shell    # 页面共享外壳，pages/下只保存页面片段
 
 配置文件格式请参考默认配置示例。
 
@@ -31,6 +32,23 @@ class CLIParser:
   python main.py -n my-project --update-page "用户登录" --status completed
   python main.py -n my-project --update-page "用户登录" --page-content login.html
   python main.py -n my-project --update-page "用户登录" --status completed --page-content login.html
+
+页面历史示例:
+  python main.py -n my-project --page-history "用户登录"                 # 查看页面的历史版本
+  python main.py -n my-project --undo-page "用户登录"                    # 撤销最近一次更新
+  python main.py -n my-project --undo-page "用户登录" --to-version 2     # 恢复到指定版本
+
+批量导入示例:
+  python main.py -n my-project --import-dir fragments/                      # 按文件名（页面名称）匹配页面
+  python main.py -n my-project --import-dir fragments/ --import-map map.json --status pending_review
+
+静态资源构建示例:
+  python main.py -n my-project --build-assets     # 生成utilities.css和icons.css，页面不再依赖CDN
+  python main.py -n my-project --build-assets --precompress  # 同时为HTML/CSS/JS/JSON生成.gz/.br预压缩文件
+  python main.py -n my-project --serve --port 8000  # 启动预览服务（指纹资源使用不可变缓存）
+
+单文件导出示例:
+  python main.py -n my-project --single-file out.html  # 导出可直接双击打开的单文件原型
             """
         )
         
@@ -44,6 +62,8 @@ class CLIParser:
                            help='项目描述')
         parser.add_argument('--platform', choices=['mobile', 'pc'], default='mobile',
                            help='平台类型：mobile（手机端，默认）或 pc（PC端）')
+        parser.add_argument('--layout', choices=['standalone', 'shell'], default='standalone',
+                           help='页面布局（创建项目时指定）：standalone（每个页面为完整HTML，默认）或 shell（共享页面外壳加载页面片段）')
         parser.add_argument('--force', action='store_true',
                            help='强制覆盖已存在的项目目录')
         
@@ -57,6 +77,20 @@ class CLIParser:
                            help='页面内容文件路径（HTML文件）')
         parser.add_argument('--keep-source', action='store_true',
                            help='保留源HTML文件（默认会自动删除）')
+        parser.add_argument('--no-validate', action='store_true',
+                           help='写入前不校验页面片段结构（标签配对、完整文档标签、过大内联资源）')
+        parser.add_argument('--import-dir',
+                           help='批量导入页面内容的目录（HTML片段，按文件名匹配页面名称或页面路径）')
+        parser.add_argument('--import-map',
+                           help='批量导入映射文件（JSON格式：{"片段文件名": "页面名称"}）')
+        
+        # 页面历史相关参数
+        parser.add_argument('--undo-page',
+                           help='撤销指定页面（页面名称）的最近一次更新')
+        parser.add_argument('--page-history',
+                           help='查看指定页面（页面名称）的历史版本')
+        parser.add_argument('--to-version', type=int,
+                           help='撤销时恢复到的版本号（配合 --undo-page 使用）')
         
         # 新增页面/模块/角色相关参数
         parser.add_argument('--add-page', action='store_true',
@@ -84,6 +118,20 @@ class CLIParser:
         parser.add_argument('--pages',
                            help='页面列表（逗号分隔）')
         
+        # 静态资源构建相关参数
+        parser.add_argument('--build-assets', action='store_true',
+                           help='构建静态资源（按页面实际使用的类名和图标生成utilities.css、icons.css，并为资源加内容指纹）')
+        parser.add_argument('--precompress', action='store_true',
+                           help='构建时并行生成.gz（brotli可用时另生成.br）预压缩文件')
+        parser.add_argument('--serve', action='store_true',
+                           help='启动本地预览服务')
+        parser.add_argument('--port', type=int, default=8000,
+                           help='预览服务端口（默认8000）')
+        
+        # 导出相关参数
+        parser.add_argument('--single-file', metavar='OUTPUT',
+                           help='将整个原型导出为单个HTML文件（页面压缩内嵌，打开时按需解压）')
+        
         return parser
     
     def parse_args(self):
@@ -162,6 +210,53 @@ class CLIParser:
             if not (hasattr(args, 'status') and args.status) and not (hasattr(args, 'page_content') and args.page_content):
                 print("❌ 页面更新模式必须指定 --status 或 --page-content 参数")
                 return False
+        
+        # 页面历史模式的验证
+        elif (hasattr(args, 'undo_page') and args.undo_page) or (hasattr(args, 'page_history') and args.page_history):
+            # 检查menu.json是否存在
+            menu_file = Path(args.name) / 'menu.json'
+            if not menu_file.exists():
+                print(f"❌ 项目配置文件 '{menu_file}' 不存在")
+                return False
+            
+            if args.to_version is not None and not args.undo_page:
+                print("❌ --to-version 参数只能与 --undo-page 一起使用")
+                return False
+        
+        # 批量导入模式的验证
+        elif hasattr(args, 'import_dir') and args.import_dir:
+            menu_file = Path(args.name) / 'menu.json'
+            if not menu_file.exists():
+                print(f"❌ 项目配置文件 '{menu_file}' 不存在")
+                return False
+            
+            if not Path(args.import_dir).is_dir():
+                print(f"❌ 导入目录 '{args.import_dir}' 不存在")
+                return False
+            
+            if args.import_map and not Path(args.import_map).exists():
+                print(f"❌ 导入映射文件 '{args.import_map}' 不存在")
+                return False
+        
+        # 静态资源构建模式的验证
+        elif (hasattr(args, 'build_assets') and args.build_assets) or (hasattr(args, 'precompress') and args.precompress):
+            # 构建模式：项目目录必须存在
+            if not Path(args.name).exists():
+                print(f"❌ 项目目录 '{args.name}' 不存在，无法构建静态资源")
+                return False
+        
+        # 预览服务模式的验证
+        elif hasattr(args, 'serve') and args.serve:
+            if not Path(args.name).exists():
+                print(f"❌ 项目目录 '{args.name}' 不存在，无法启动预览服务")
+                return False
+        
+        # 单文件导出模式的验证
+        elif hasattr(args, 'single_file') and args.single_file:
+            menu_file = Path(args.name) / 'menu.json'
+            if not menu_file.exists():
+                print(f"❌ 项目配置文件 '{menu_file}' 不存在，无法导出")
+                return False
         else:
             # 项目创建模式的验证
             # 检查项目目录是否已存在
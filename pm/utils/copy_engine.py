@@ -0,0 +1,195 @@
+"""
+并行文件复制引擎
+一次遍历源目录，通过线程池并行复制文件（优先使用内核态 copy_file_range/sendfile），
+保留权限和修改时间，并统计复制吞吐量
+"""
+
+import errno
+import os
+import shutil
+import stat
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+PathLike = Union[str, Path]
+
+
+class CopyEngine:
+    """并行文件复制引擎类
+
+    逐文件复制的耗时主要是每个文件的打开/关闭/stat等系统调用延迟（网络文件系统上尤为明显），
+    多个线程同时复制可以让这些等待重叠；文件内容在内核中直接复制，不经过Python缓冲区
+    """
+
+    COPY_CHUNK_SIZE = 8 * 1024 * 1024
+    # 内核态复制不可用时回退到普通读写的错误码
+    ZERO_COPY_FALLBACK_ERRNOS = {
+        errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.ENOTSUP
+    }
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+
+    def copy_tree(self, src_dir: PathLike, dst_dir: PathLike) -> Dict[str, Any]:
+        """
+        复制整个目录树（目标目录可以已存在）
+
+        Args:
+            src_dir: 源目录
+            dst_dir: 目标目录
+
+        Returns:
+            Dict[str, Any]: 复制统计（见 copy_files）
+        """
+        return self.copy_files(self._walk_tree(str(src_dir), str(dst_dir)))
+
+    def copy_files(self, pairs: Iterable[Tuple[PathLike, PathLike]], preserve_metadata: bool = True,
+                   on_copied: Optional[Callable[[PathLike, PathLike], None]] = None) -> Dict[str, Any]:
+        """
+        并行复制文件（目标文件所在目录需已存在）
+
+        Args:
+            pairs: (源文件, 目标文件) 序列，可以是边遍历边产生的生成器
+            preserve_metadata: 是否保留权限和修改时间
+            on_copied: 每个文件复制完成后在工作线程中调用的回调
+
+        Returns:
+            Dict[str, Any]: 复制统计，包含 files、bytes、seconds、errors（[(源文件, 错误信息)]）
+        """
+        stats = {"files": 0, "bytes": 0, "seconds": 0.0, "errors": []}
+        start = time.perf_counter()
+
+        def collect(futures):
+            for future in futures:
+                src, size, error = future.result()
+                if error:
+                    stats['errors'].append((str(src), error))
+                else:
+                    stats['files'] += 1
+                    stats['bytes'] += size
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = set()
+            for src, dst in pairs:
+                pending.add(executor.submit(self._copy_one, src, dst, preserve_metadata, on_copied))
+                # 限制在途任务数量，遍历大目录时不必先生成全部任务
+                if len(pending) >= self.workers * 4:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+            collect(wait(pending).done)
+
+        stats['seconds'] = time.perf_counter() - start
+        return stats
+
+    @classmethod
+    def copy_file(cls, src: PathLike, dst: PathLike, preserve_metadata: bool = True) -> int:
+        """
+        复制单个文件
+
+        Args:
+            src: 源文件
+            dst: 目标文件（已存在时覆盖）
+            preserve_metadata: 是否保留权限和修改时间
+
+        Returns:
+            int: 复制的字节数
+        """
+        with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+            size = cls.copy_fd(fsrc.fileno(), fdst.fileno())
+        if preserve_metadata:
+            shutil.copystat(src, dst)
+        return size
+
+    @classmethod
+    def copy_fd(cls, src_fd: int, dst_fd: int) -> int:
+        """
+        将源文件描述符的剩余内容写入目标文件描述符
+
+        优先使用 copy_file_range（同一文件系统上可直接共享数据块），其次 sendfile，
+        都不支持时回退为按块读写。源为普通文件时核对复制的字节数：内核态复制提前
+        返回 0（部分文件系统不支持但不报错）时改用下一种方式继续复制剩余内容
+
+        Returns:
+            int: 复制的字节数
+
+        Raises:
+            OSError: 读到文件末尾时仍少于源文件剩余大小（复制过程中源文件被截断）
+        """
+        src_stat = os.fstat(src_fd)
+        expected = None
+        if stat.S_ISREG(src_stat.st_mode):
+            expected = src_stat.st_size - os.lseek(src_fd, 0, os.SEEK_CUR)
+
+        copied = 0
+        copy_funcs = []
+        if hasattr(os, 'copy_file_range'):
+            copy_funcs.append(lambda size: os.copy_file_range(src_fd, dst_fd, size))
+        if hasattr(os, 'sendfile'):
+            copy_funcs.append(lambda size: os.sendfile(dst_fd, src_fd, None, size))
+
+        for copy_chunk in copy_funcs:
+            try:
+                while True:
+                    sent = copy_chunk(cls.COPY_CHUNK_SIZE)
+                    if not sent:
+                        break
+                    copied += sent
+            except OSError as e:
+                # 不支持时尝试下一种方式（已复制部分不会重复，文件偏移已前移）
+                if e.errno not in cls.ZERO_COPY_FALLBACK_ERRNOS:
+                    raise
+                continue
+            if expected is None or copied >= expected:
+                return copied
+
+        while True:
+            chunk = os.read(src_fd, cls.COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            view = memoryview(chunk)
+            while view:
+                written = os.write(dst_fd, view)
+                view = view[written:]
+            copied += len(chunk)
+        if expected is not None and copied < expected:
+            raise OSError(errno.EIO, f"复制不完整：应复制 {expected} 字节，实际 {copied} 字节")
+        return copied
+
+    @staticmethod
+    def format_stats(stats: Dict[str, Any]) -> str:
+        """格式化复制统计"""
+        seconds = max(stats['seconds'], 1e-9)
+        text = (f"📊 复制 {stats['files']} 个文件，{stats['bytes'] / 1024 / 1024:.1f} MB，"
+                f"用时 {stats['seconds']:.2f}s（{stats['bytes'] / 1024 / 1024 / seconds:.1f} MB/s，"
+                f"{stats['files'] / seconds:.0f} 文件/s）")
+        if stats['errors']:
+            text += f"，❌ {len(stats['errors'])} 个失败"
+        return text
+
+    def _copy_one(self, src: PathLike, dst: PathLike, preserve_metadata: bool,
+                  on_copied: Optional[Callable[[PathLike, PathLike], None]]) -> Tuple[PathLike, int, Optional[str]]:
+        """复制单个文件（工作线程），出错时返回错误信息而不是抛出，避免中断其他文件"""
+        try:
+            size = self.copy_file(src, dst, preserve_metadata)
+            if on_copied:
+                on_copied(src, dst)
+            return src, size, None
+        except OSError as e:
+            return src, 0, str(e)
+
+    def _walk_tree(self, src_dir: str, dst_dir: str) -> Iterator[Tuple[str, str]]:
+        """单次遍历源目录：创建目标目录，并产生所有需要复制的文件"""
+        pending = [(src_dir, dst_dir)]
+        while pending:
+            src, dst = pending.pop()
+            os.makedirs(dst, exist_ok=True)
+            shutil.copystat(src, dst)
+            with os.scandir(src) as entries:
+                for entry in entries:
+                    target = os.path.join(dst, entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, target))
+                    elif entry.is_file():
+                        yield entry.path, target
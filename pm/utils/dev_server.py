@@ -0,0 +1,128 @@
+"""
+原型预览开发服务器
+基于http.server提供项目静态文件服务，带指纹的资源使用长期不可变缓存
+"""
+
+import json
+import os
+import sys
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Set
+from urllib.parse import unquote
+
+# 添加父目录到路径以支持导入
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.insert(0, str(parent_dir))
+
+from utils.asset_pipeline import AssetPipeline
+
+
+class PrototypeRequestHandler(SimpleHTTPRequestHandler):
+    """原型静态文件请求处理器"""
+
+    IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+    REVALIDATE_CACHE = "no-cache"
+
+    def __init__(self, *args, immutable_paths: Set[str] = None, **kwargs):
+        self.immutable_paths = immutable_paths or set()
+        super().__init__(*args, **kwargs)
+
+    # 预压缩文件后缀，按优先级排列
+    PRECOMPRESSED_ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+    def send_head(self):
+        """客户端支持时优先返回构建期生成的预压缩文件"""
+        path = self.translate_path(self.path)
+        accepted = self._accepted_encodings(self.headers.get("Accept-Encoding", ""))
+        if os.path.isfile(path):
+            for encoding, suffix in self.PRECOMPRESSED_ENCODINGS:
+                sidecar = path + suffix
+                if accepted.get(encoding, accepted.get("*", 0)) <= 0 or not os.path.isfile(sidecar):
+                    continue
+                # 构建时预压缩文件的修改时间与源文件一致；不一致说明源文件已被修改或从备份恢复
+                if os.stat(sidecar).st_mtime_ns != os.stat(path).st_mtime_ns:
+                    continue
+                f = open(sidecar, 'rb')
+                fs = os.fstat(f.fileno())
+                self.send_response(200)
+                self.send_header("Content-type", self.guess_type(path))
+                self.send_header("Content-Encoding", encoding)
+                self.send_header("Content-Length", str(fs.st_size))
+                self.send_header("Vary", "Accept-Encoding")
+                self.send_header("Last-Modified", self.date_time_string(fs.st_mtime))
+                self.end_headers()
+                return f
+        return super().send_head()
+
+    @staticmethod
+    def _accepted_encodings(header: str) -> Dict[str, float]:
+        """解析 Accept-Encoding 请求头，返回 编码 -> q值（q=0 表示客户端明确拒绝该编码）"""
+        accepted = {}
+        for item in header.split(','):
+            encoding, *params = [part.strip() for part in item.split(';')]
+            if not encoding:
+                continue
+            quality = 1.0
+            for param in params:
+                name, _, value = param.partition('=')
+                if name.strip().lower() == 'q':
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            accepted[encoding.lower()] = quality
+        return accepted
+
+    def end_headers(self):
+        """根据资源是否带指纹设置缓存策略"""
+        request_path = unquote(self.path.split('?', 1)[0].split('#', 1)[0]).lstrip('/')
+        if request_path in self.immutable_paths:
+            self.send_header("Cache-Control", self.IMMUTABLE_CACHE)
+        else:
+            self.send_header("Cache-Control", self.REVALIDATE_CACHE)
+        super().end_headers()
+
+
+class DevServer:
+    """原型预览开发服务器类"""
+
+    def __init__(self, project_root: str, port: int = 8000):
+        self.project_root = Path(project_root)
+        self.port = port
+
+    def serve(self) -> bool:
+        """
+        启动服务器（阻塞直到用户中断）
+
+        Returns:
+            bool: 服务器是否正常启动并退出
+        """
+        try:
+            handler = partial(
+                PrototypeRequestHandler,
+                directory=str(self.project_root),
+                immutable_paths=self._load_immutable_paths()
+            )
+            with ThreadingHTTPServer(("", self.port), handler) as httpd:
+                print(f"🌐 预览服务已启动: http://localhost:{self.port}/index.html")
+                print("   按 Ctrl+C 停止服务")
+                try:
+                    httpd.serve_forever()
+                except KeyboardInterrupt:
+                    print("\n🛑 预览服务已停止")
+            return True
+        except OSError as e:
+            print(f"❌ 启动预览服务失败: {e}")
+            return False
+
+    def _load_immutable_paths(self) -> Set[str]:
+        """从构建清单中读取带指纹的资源路径"""
+        manifest_file = self.project_root / AssetPipeline.MANIFEST_NAME
+        if not manifest_file.exists():
+            return set()
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return set(manifest.get('assets', {}).values())
@@ -3,17 +3,47 @@
 负责文件和目录的创建、写入等操作
 """
 
+import json
 import os
+import re
+import stat
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows下不支持flock，仅依赖独占创建避免编号冲突
+    fcntl = None
+
+# 添加父目录到路径以支持导入
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.insert(0, str(parent_dir))
+
+from utils.copy_engine import CopyEngine
+from utils.fragment_validator import FragmentValidator
+from utils.page_journal import PageJournal
 
 
 class FileManager:
     """文件系统管理器类"""
     
+    # 分块比较业务内容与现有页面时的块大小
+    COPY_CHUNK_SIZE = 1024 * 1024
+    
+    # 项目元数据文件（保存各模块的页面编号计数器等）
+    PROJECT_META_FILE = "project-meta.json"
+    PAGE_FILE_PATTERN = re.compile(r'^page(\d+)\.html$')
+    
     def __init__(self, project_name: str):
         self.project_name = project_name
         self.project_path = Path(project_name)
+        self.page_journal = PageJournal(project_name)
     
     def create_project_structure(self, config: Dict[str, Any]) -> bool:
         """
@@ -118,6 +148,20 @@ class FileManager:
         """
         return self.project_path
     
+    def get_page_layout(self) -> str:
+        """
+        获取项目的页面布局（项目根目录存在页面外壳文件时为shell布局）
+        
+        Returns:
+            str: 页面布局（standalone/shell）
+        """
+        from generators.template_generator import TemplateGenerator
+        
+        for shell_file in TemplateGenerator.SHELL_FILES.values():
+            if (self.project_path / shell_file).exists():
+                return "shell"
+        return "standalone"
+    
     def check_project_exists(self) -> bool:
         """
         检查项目目录是否已存在
@@ -130,7 +174,7 @@ class FileManager:
     def update_page_content(self, page_url: str, content_file: str, platform_type: str = "mobile", 
                            page_name: str = "", page_desc: str = "", 
                            role_name: str = "", module_name: str = "", 
-                           keep_source: bool = False) -> bool:
+                           keep_source: bool = False, validate: bool = True) -> bool:
         """
         更新页面内容 - 支持业务代码自动包装
         
@@ -143,41 +187,34 @@ class FileManager:
             role_name: 角色名称
             module_name: 模块名称
             keep_source: 是否保留源文件（默认False，自动删除）
+            validate: 是否在写入前校验片段结构（默认True）
             
         Returns:
             bool: 更新是否成功
         """
         try:
-            # 读取业务代码内容
+            # 业务代码内容文件（写入时流式复制，不整体读入内存）
             content_path = Path(content_file)
             if not content_path.exists():
                 print(f"❌ 内容文件 {content_file} 不存在")
                 return False
             
-            business_content = content_path.read_text(encoding='utf-8')
-            
             # 目标页面文件路径
             target_file = self.project_path / page_url
             if not target_file.exists():
                 print(f"❌ 目标页面文件 {target_file} 不存在")
                 return False
             
-            # 导入模板生成器
-            import sys
-            current_dir = Path(__file__).parent.parent
-            sys.path.insert(0, str(current_dir))
-            from templates.html_templates import HTMLTemplates
+            # 校验片段结构，存在错误时不写入
+            if validate and not self._validate_fragment(content_path):
+                return False
             
-            # 根据平台类型生成完整页面
-            if platform_type == "mobile":
-                # 手机模式：使用手机框架包装业务内容
-                full_page = self._wrap_mobile_content(business_content, page_name, page_desc, role_name, module_name)
+            # 根据平台类型包装业务内容并更新页面（shell布局下只写入页面片段）
+            if self._write_wrapped_page(target_file, content_path, platform_type, page_name, role_name,
+                                        self.get_page_layout(), self._get_asset_pipeline()):
+                print(f"✅ 已写入页面: {target_file}")
             else:
-                # PC模式：生成完整页面，业务内容替换默认内容
-                full_page = self._wrap_pc_content(business_content, page_name, page_desc, role_name, module_name)
-            
-            # 更新页面内容
-            target_file.write_text(full_page, encoding='utf-8')
+                print(f"⏭️  页面内容未变化，已跳过写入: {target_file}")
             
             # 成功更新后删除源HTML文件（除非用户指定保留）
             if not keep_source:
@@ -195,82 +232,226 @@ class FileManager:
             print(f"❌ 更新页面内容失败: {e}")
             return False
     
-    def _wrap_mobile_content(self, business_content: str, page_name: str, 
-                           page_desc: str, role_name: str, module_name: str) -> str:
+    def import_page_contents(self, updates: List[Dict[str, str]], platform_type: str = "mobile",
+                             keep_source: bool = False, max_workers: Optional[int] = None,
+                             validate: bool = True) -> Dict[str, str]:
         """
-        包装手机端业务内容
+        批量更新页面内容 - 并行包装并写入多个业务代码片段
         
         Args:
-            business_content: 业务代码内容
+            updates: 更新列表，每项包含 page_url、content_file、page_name、role_name、module_name
+            platform_type: 平台类型（mobile/pc）
+            keep_source: 是否保留源文件（默认False，自动删除）
+            max_workers: 并行线程数，None表示自动选择
+            validate: 是否在写入前校验片段结构（默认True）
+            
+        Returns:
+            Dict[str, str]: 页面URL -> 更新结果（updated/unchanged/invalid/failed）
+        """
+        layout = self.get_page_layout()
+        asset_pipeline = self._get_asset_pipeline()
+        
+        def import_one(update: Dict[str, str]) -> str:
+            try:
+                target_file = self.project_path / update['page_url']
+                if not target_file.exists():
+                    print(f"❌ 目标页面文件 {target_file} 不存在")
+                    return "failed"
+                
+                content_path = Path(update['content_file'])
+                if validate and not self._validate_fragment(content_path):
+                    return "invalid"
+                
+                written = self._write_wrapped_page(
+                    target_file, content_path, platform_type,
+                    update.get('page_name', ''), update.get('role_name', ''), layout, asset_pipeline
+                )
+                
+                if not keep_source:
+                    content_path.unlink()
+                return "updated" if written else "unchanged"
+            except Exception as e:
+                print(f"❌ 导入页面 {update.get('page_name', update.get('page_url'))} 失败: {e}")
+                return "failed"
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(import_one, updates))
+        
+        return {update['page_url']: result for update, result in zip(updates, results)}
+    
+    def _validate_fragment(self, content_path: Path) -> bool:
+        """
+        校验业务代码片段结构并输出问题位置
+        
+        Args:
+            content_path: 片段文件路径
+            
+        Returns:
+            bool: 是否通过校验（仅有警告时视为通过）
+        """
+        issues = FragmentValidator().validate_file(content_path)
+        for issue in issues:
+            print(FragmentValidator.format_issue(issue, str(content_path)))
+        
+        if FragmentValidator.has_errors(issues):
+            print(f"❌ 片段 {content_path} 结构校验未通过，未写入页面（可使用 --no-validate 跳过校验）")
+            return False
+        return True
+    
+    def _write_wrapped_page(self, target_file: Path, content_path: Path, platform_type: str,
+                            page_name: str, role_name: str, layout: str = "standalone",
+                            asset_pipeline=None) -> bool:
+        """
+        将业务内容包装后写入目标文件（页面外壳前缀 + 业务内容 + 外壳后缀）
+        
+        业务内容按块流式复制，内存占用与片段大小无关；与现有页面完全一致时不写入，
+        保持文件修改时间不变。实际写入时在撤销日志中记录反向增量
+        
+        Args:
+            target_file: 目标页面文件
+            content_path: 业务代码内容文件
+            platform_type: 平台类型（mobile/pc）
             page_name: 页面名称
-            page_desc: 页面描述
             role_name: 角色名称
-            module_name: 模块名称
+            layout: 页面布局（standalone/shell），shell布局下不包装，只写入页面片段
+            asset_pipeline: 已构建静态资源时的资源构建器，用于按构建结果改写页面头部
             
         Returns:
-            str: 完整的手机端页面HTML
+            bool: 是否实际写入（内容未变化时为False）
         """
-        from templates.html_templates import HTMLTemplates
+        if layout == "shell":
+            prefix, suffix = b'', b''
+        else:
+            prefix, suffix = self._get_page_shell(platform_type, page_name, role_name)
+            if asset_pipeline is not None:
+                prefix = asset_pipeline.render_page(prefix.decode('utf-8'), target_file).encode('utf-8')
         
-        # 获取手机框架模板
-        frame_template = HTMLTemplates.get_mobile_frame_template()
+        try:
+            target_stat = os.stat(target_file)
+        except FileNotFoundError:
+            target_stat = None
         
-        # 替换页面内容占位符
-        full_page = frame_template.replace('<!-- 页面内容将在这里替换 -->', business_content)
+        with open(content_path, 'rb', buffering=0) as src:
+            if target_stat is not None and self._is_page_unchanged(target_file, target_stat.st_size,
+                                                                   prefix, src, suffix):
+                return False
+            src.seek(0)
+            # 已有页面先写入同目录下的临时文件再原子替换，写入中途失败时原页面保持完整；
+            # 新页面没有需要保护的内容，直接独占创建
+            if target_stat is None:
+                temp_file = target_file
+            else:
+                temp_file = target_file.with_name(f"{target_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                with open(temp_file, 'xb' if target_stat is None else 'wb', buffering=0) as dst:
+                    self._write_all(dst, prefix)
+                    CopyEngine.copy_fd(src.fileno(), dst.fileno())
+                    self._write_all(dst, suffix)
+                if target_stat is not None:
+                    # 替换前在撤销日志中记录（旧内容即仍在原位的页面文件，新内容即临时文件）
+                    os.chmod(temp_file, stat.S_IMODE(target_stat.st_mode))
+                    page_url = target_file.relative_to(self.project_path).as_posix()
+                    self.page_journal.record(page_url, target_file, temp_file)
+                    os.replace(temp_file, target_file)
+            except BaseException:
+                temp_file.unlink(missing_ok=True)
+                raise
+        return True
+    
+    def _is_page_unchanged(self, target_file: Path, target_size: int, prefix: bytes, src, suffix: bytes) -> bool:
+        """
+        判断现有页面是否与待写入内容一致（先比较大小，大小相同时再分块比较内容）
         
-        # 更新标题
-        if page_name:
-            full_page = full_page.replace('手机页面框架', f'{page_name} - {role_name}')
+        Args:
+            target_file: 目标页面文件
+            target_size: 目标页面文件大小
+            prefix: 外壳前缀
+            src: 业务内容源文件对象（无缓冲）
+            suffix: 外壳后缀
+            
+        Returns:
+            bool: 内容是否一致
+        """
+        if target_size != len(prefix) + os.fstat(src.fileno()).st_size + len(suffix):
+            return False
         
-        return full_page
+        with open(target_file, 'rb') as existing:
+            if existing.read(len(prefix)) != prefix:
+                return False
+            while True:
+                chunk = src.read(self.COPY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if existing.read(len(chunk)) != chunk:
+                    return False
+            return existing.read() == suffix
+    
+    def _get_asset_pipeline(self):
+        """获取已构建项目的资源构建器（未构建静态资源时返回None）"""
+        from utils.asset_pipeline import AssetPipeline
+        
+        asset_pipeline = AssetPipeline(str(self.project_path))
+        return asset_pipeline if asset_pipeline.is_built() else None
     
-    def _wrap_pc_content(self, business_content: str, page_name: str, 
-                        page_desc: str, role_name: str, module_name: str) -> str:
+    @staticmethod
+    def _write_all(dst, data: bytes) -> None:
         """
-        包装PC端业务内容
+        将数据完整写入无缓冲文件对象（单次 write 可能只写入部分数据）
         
         Args:
-            business_content: 业务代码内容
+            dst: 目标文件对象（无缓冲）
+            data: 待写入的数据
+        """
+        view = memoryview(data)
+        while view:
+            written = dst.write(view)
+            view = view[written:]
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _get_page_shell(platform_type: str, page_name: str, role_name: str) -> Tuple[bytes, bytes]:
+        """
+        获取页面外壳（按平台和标题缓存），预先拆分为业务内容前后的两段字节串
+        
+        页面外壳中只有标题随页面变化，因此以 (平台, 页面名称, 角色名称) 作为缓存键
+        
+        Args:
+            platform_type: 平台类型（mobile/pc）
             page_name: 页面名称
-            page_desc: 页面描述
             role_name: 角色名称
-            module_name: 模块名称
             
         Returns:
-            str: 完整的PC端页面HTML
+            Tuple[bytes, bytes]: (外壳前缀, 外壳后缀)
         """
         from templates.html_templates import HTMLTemplates
         
-        # PC模式：生成完整页面模板，然后替换body内容
+        if platform_type == "mobile":
+            # 获取手机框架模板并更新标题
+            frame_template = HTMLTemplates.get_mobile_frame_template()
+            if page_name:
+                frame_template = frame_template.replace('手机页面框架', f'{page_name} - {role_name}')
+            
+            # 在页面内容占位符处拆分
+            prefix, _, suffix = frame_template.partition('<!-- 页面内容将在这里替换 -->')
+            return prefix.encode('utf-8'), suffix.encode('utf-8')
+        
+        # PC模式：生成完整页面模板，保留body标签及其属性，替换body内容
         if not page_name:
             page_name = "页面标题"
-        if not page_desc:
-            page_desc = "页面描述"
         if not role_name:
             role_name = "角色"
-        if not module_name:
-            module_name = "模块"
-            
-        # 获取PC页面模板
-        pc_template = HTMLTemplates.get_pc_page_template(page_name, page_desc, role_name, module_name)
         
-        # 提取body标签内的内容，替换为业务内容
-        import re
-        body_pattern = r'<body[^>]*>(.*?)</body>'
-        match = re.search(body_pattern, pc_template, re.DOTALL)
+        pc_template = HTMLTemplates.get_pc_page_template(page_name, "页面描述", role_name, "模块")
+        body_start = pc_template.find('<body')
+        body_close = pc_template.rfind('</body>')
         
-        if match:
-            # 保留body标签属性，替换内容
-            body_start = pc_template.find('<body')
+        if body_start != -1 and body_close != -1:
             body_end = pc_template.find('>', body_start) + 1
-            body_close = pc_template.rfind('</body>')
-            
-            body_tag = pc_template[body_start:body_end]
-            result = pc_template[:body_end] + '\n' + business_content + '\n' + pc_template[body_close:]
-            return result
+            prefix = pc_template[:body_end] + '\n'
+            suffix = '\n' + pc_template[body_close:]
         else:
-            # 如果没有找到body标签，直接返回业务内容包装在基本HTML结构中
-            return f'''<!DOCTYPE html>
+            # 如果没有找到body标签，直接将业务内容包装在基本HTML结构中
+            prefix = f'''<!DOCTYPE html>
 <html lang="zh">
 <head>
   <meta charset="UTF-8">
@@ -294,43 +475,12 @@ class FileManager:
   </script>
 </head>
 <body class="font-sans bg-gray-custom">
-{business_content}
+'''
+            suffix = '''
 </body>
 </html>'''
-    
-    def backup_page(self, page_url: str) -> bool:
-        """
-        备份页面文件
         
-        Args:
-            page_url: 页面URL路径（相对于项目根目录）
-            
-        Returns:
-            bool: 备份是否成功
-        """
-        try:
-            from datetime import datetime
-            
-            source_file = self.project_path / page_url
-            if not source_file.exists():
-                print(f"❌ 源页面文件 {source_file} 不存在")
-                return False
-            
-            # 生成备份文件名
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"{source_file.stem}_backup_{timestamp}{source_file.suffix}"
-            backup_file = source_file.parent / backup_name
-            
-            # 复制文件
-            import shutil
-            shutil.copy2(source_file, backup_file)
-            
-            print(f"✅ 页面已备份到: {backup_file}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ 备份页面失败: {e}")
-            return False
+        return prefix.encode('utf-8'), suffix.encode('utf-8')
     
     def create_new_page_file(self, role_name: str, module_name: str, 
                             page_name: str, page_desc: str, platform_type: str = "mobile") -> bool:
@@ -355,16 +505,9 @@ class FileManager:
             from generators.template_generator import TemplateGenerator
             
             # 创建目录结构
-            role_dir = self.project_path / "pages" / self._safe_filename(role_name)
-            module_dir = role_dir / self._safe_filename(module_name)
+            module_dir = self._module_dir(role_name, module_name)
             module_dir.mkdir(parents=True, exist_ok=True)
             
-            # 生成页面文件名（查找现有页面数量，生成新的编号）
-            existing_pages = list(module_dir.glob("*.html"))
-            page_num = len(existing_pages) + 1
-            page_filename = f"page{page_num}.html"
-            page_file = module_dir / page_filename
-            
             # 创建虚拟配置
             temp_config = {
                 "project_name": self.project_name,
@@ -372,13 +515,20 @@ class FileManager:
             }
             
             # 生成页面内容
-            template_generator = TemplateGenerator(temp_config, platform_type)
+            template_generator = TemplateGenerator(temp_config, platform_type, self.get_page_layout())
             page_content = template_generator.generate_page_html(
                 page_name, page_desc, role_name, module_name
             )
             
-            # 写入文件
-            page_file.write_text(page_content, encoding='utf-8')
+            # 分配页面编号并独占创建文件（编号已被手工创建的文件占用时继续分配）
+            while True:
+                page_file = module_dir / f"page{self.allocate_page_number(module_dir)}.html"
+                try:
+                    with open(page_file, 'x', encoding='utf-8') as f:
+                        f.write(page_content)
+                    break
+                except FileExistsError:
+                    continue
             
             print(f"✅ 成功创建页面文件: {page_file}")
             return True
@@ -387,6 +537,87 @@ class FileManager:
             print(f"❌ 创建页面文件失败: {e}")
             return False
     
+    def allocate_page_number(self, module_dir: Path) -> int:
+        """
+        为模块分配下一个页面编号
+        
+        计数器保存在项目元数据中，加锁读取并原子替换写回，编号只增不减，
+        删除部分页面后也不会被重复使用；模块目录被清空或重建（没有任何
+        pageN.html）时计数器随目录一起重新开始
+        
+        Args:
+            module_dir: 模块目录
+            
+        Returns:
+            int: 新的页面编号
+        """
+        key = self._page_counter_key(module_dir)
+        with self._locked_project_meta() as meta:
+            counters = meta.setdefault('page_counters', {})
+            if key not in counters or not self._has_page_files(module_dir):
+                # 旧项目首次分配时，从目录中已有的最大编号继续
+                counters[key] = self._scan_max_page_number(module_dir)
+            counters[key] += 1
+            return counters[key]
+    
+    def _module_dir(self, role_name: str, module_name: str) -> Path:
+        """新增页面所在的模块目录（pages/角色名/模块名，名称转换为安全文件名）"""
+        return self.project_path / "pages" / self._safe_filename(role_name) / self._safe_filename(module_name)
+    
+    def _page_counter_key(self, module_dir: Path) -> str:
+        """模块目录在项目元数据 page_counters 中的键"""
+        return module_dir.relative_to(self.project_path / "pages").as_posix()
+    
+    def _has_page_files(self, module_dir: Path) -> bool:
+        """模块目录中是否有 pageN.html（找到第一个即返回）"""
+        if not module_dir.exists():
+            return False
+        with os.scandir(module_dir) as entries:
+            return any(self.PAGE_FILE_PATTERN.match(entry.name) for entry in entries)
+    
+    def _scan_max_page_number(self, module_dir: Path) -> int:
+        """扫描模块目录中已有 pageN.html 的最大编号（忽略备份等其他文件）"""
+        max_number = 0
+        if module_dir.exists():
+            with os.scandir(module_dir) as entries:
+                for entry in entries:
+                    match = self.PAGE_FILE_PATTERN.match(entry.name)
+                    if match:
+                        max_number = max(max_number, int(match.group(1)))
+        return max_number
+    
+    @contextmanager
+    def _locked_project_meta(self) -> Iterator[Dict[str, Any]]:
+        """
+        加锁读取项目元数据，正常退出时原子写回（临时文件 + os.replace）
+        
+        Yields:
+            Dict[str, Any]: 项目元数据，可直接修改
+        """
+        meta_file = self.project_path / self.PROJECT_META_FILE
+        self.project_path.mkdir(parents=True, exist_ok=True)
+        
+        # 对项目目录加锁（元数据文件会被替换，不能作为锁对象）
+        lock_fd = os.open(self.project_path, os.O_RDONLY) if fcntl is not None else None
+        try:
+            if lock_fd is not None:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            
+            meta = {}
+            if meta_file.exists():
+                with open(meta_file, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            
+            yield meta
+            
+            temp_file = meta_file.with_name(f"{meta_file.name}.{os.getpid()}.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+            os.replace(temp_file, meta_file)
+        finally:
+            if lock_fd is not None:
+                os.close(lock_fd)
+    
     def create_new_module_directory(self, role_name: str, module_name: str) -> bool:
         """
         为新增的模块创建目录
@@ -399,8 +630,7 @@ class FileManager:
             bool: 创建是否成功
         """
         try:
-            role_dir = self.project_path / "pages" / self._safe_filename(role_name)
-            module_dir = role_dir / self._safe_filename(module_name)
+            module_dir = self._module_dir(role_name, module_name)
             module_dir.mkdir(parents=True, exist_ok=True)
             
             print(f"✅ 成功创建模块目录: {module_dir}")
@@ -450,4 +680,9 @@ class FileManager:
         """打印成功消息"""
         print(f"✅ 项目 '{self.project_name}' 创建成功！")
         print(f"📁 项目路径: {self.project_path.absolute()}")
-        print(f"🌐 打开 {self.project_path.absolute()}/index.html 查看原型")
\ No newline at end of file
+        if self.get_page_layout() == "shell":
+            # 页面外壳通过fetch加载页面片段，浏览器不允许从 file:// 读取
+            print(f"🌐 运行 python main.py -n {self.project_name} --serve 启动预览服务后查看原型"
+                  f"（shell布局不支持直接打开 index.html）")
+        else:
+            print(f"🌐 打开 {self.project_path.absolute()}/index.html 查看原型")
\ No newline at end of file
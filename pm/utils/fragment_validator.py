@@ -0,0 +1,173 @@
+"""
+页面片段校验器
+基于html.parser流式扫描业务代码片段，不构建DOM树，检查标签配对、
+禁止出现的完整文档标签以及过大的内联资源，并给出问题所在的行列位置
+"""
+
+import codecs
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class FragmentValidator(HTMLParser):
+    """页面片段校验器类"""
+
+    # 无结束标签的空元素
+    VOID_ELEMENTS = {
+        'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+        'link', 'meta', 'param', 'source', 'track', 'wbr'
+    }
+    # 结束标签可省略的元素（由后续标签或父元素结束隐式关闭）
+    OPTIONAL_END_ELEMENTS = {
+        'p', 'li', 'dt', 'dd', 'option', 'optgroup', 'tr', 'td', 'th',
+        'thead', 'tbody', 'tfoot', 'colgroup', 'caption', 'rt', 'rp'
+    }
+    # 片段中不允许出现的完整文档标签（会破坏外壳页面结构）
+    FORBIDDEN_ELEMENTS = {'html', 'head', 'body'}
+    # 内联资源（data URI、内联脚本和样式）大小上限
+    INLINE_ASSET_MAX_SIZE = 512 * 1024
+    DATA_URI_PATTERN = re.compile(r'data:[^\s"\')]+', re.IGNORECASE)
+    READ_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, inline_asset_max_size: Optional[int] = None):
+        super().__init__(convert_charrefs=True)
+        self.inline_asset_max_size = inline_asset_max_size or self.INLINE_ASSET_MAX_SIZE
+        self._reset_state()
+
+    def validate(self, content: str) -> List[Dict[str, Any]]:
+        """
+        校验片段内容
+
+        Args:
+            content: 片段HTML内容
+
+        Returns:
+            List[Dict[str, Any]]: 问题列表，每项包含 level（error/warning）、line、column、message
+        """
+        self._reset_state()
+        self.feed(content)
+        return self._finish()
+
+    def validate_file(self, file_path: Path) -> List[Dict[str, Any]]:
+        """
+        分块读取并校验片段文件（内存占用与文件大小无关）
+
+        Args:
+            file_path: 片段文件路径
+
+        Returns:
+            List[Dict[str, Any]]: 问题列表
+        """
+        self._reset_state()
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        with open(file_path, 'rb') as f:
+            while True:
+                chunk = f.read(self.READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self.feed(decoder.decode(chunk))
+        self.feed(decoder.decode(b'', final=True))
+        return self._finish()
+
+    @staticmethod
+    def has_errors(issues: List[Dict[str, Any]]) -> bool:
+        """检查问题列表中是否存在错误（警告不影响写入）"""
+        return any(issue['level'] == 'error' for issue in issues)
+
+    @staticmethod
+    def format_issue(issue: Dict[str, Any], source: str = "") -> str:
+        """将问题格式化为 文件:行:列 形式的提示文本"""
+        icon = "❌" if issue['level'] == 'error' else "⚠️ "
+        location = f"{source}:{issue['line']}:{issue['column']}" if source else f"{issue['line']}:{issue['column']}"
+        return f"{icon} {location} {issue['message']}"
+
+    def handle_decl(self, decl: str):
+        if decl.lower().startswith('doctype'):
+            self._add_issue('error', "片段中不应包含 <!DOCTYPE> 声明")
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        self._check_start_tag(tag, attrs)
+        if tag in self.VOID_ELEMENTS or tag in self.FORBIDDEN_ELEMENTS:
+            return
+
+        # 新的同类可省略结束标签元素会隐式关闭上一个（如连续的<li>、<p>）
+        if tag in self.OPTIONAL_END_ELEMENTS and self._stack and self._stack[-1][0] == tag:
+            self._stack.pop()
+        self._stack.append((tag, *self.getpos()))
+        if tag in ('script', 'style'):
+            self._inline_size = 0
+            self._inline_reported = False
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        # 自闭合写法（<div/>）不会打开元素
+        self._check_start_tag(tag, attrs)
+
+    def handle_endtag(self, tag: str):
+        if tag in self.FORBIDDEN_ELEMENTS:
+            self._add_issue('error', f"片段中不应包含 </{tag}> 标签")
+            return
+        if tag in self.VOID_ELEMENTS:
+            return
+
+        open_tags = [name for name, _, _ in self._stack]
+        if tag not in open_tags:
+            self._add_issue('error', f"多余的结束标签 </{tag}>，没有对应的开始标签")
+            return
+
+        # 结束标签之前尚未关闭的元素（可省略结束标签的除外）都视为未关闭
+        while self._stack:
+            name, line, column = self._stack.pop()
+            if name == tag:
+                break
+            if name not in self.OPTIONAL_END_ELEMENTS:
+                self._add_issue('error', f"<{name}> 未关闭（在 </{tag}> 之前）", line, column)
+
+    def handle_data(self, data: str):
+        if self._stack and self._stack[-1][0] in ('script', 'style'):
+            self._inline_size += len(data)
+            if self._inline_size > self.inline_asset_max_size and not self._inline_reported:
+                name, line, column = self._stack[-1]
+                self._add_issue('warning', f"内联 <{name}> 内容超过 {self.inline_asset_max_size // 1024} KB", line, column)
+                self._inline_reported = True
+        else:
+            self._check_data_uris(data)
+
+    def _check_start_tag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        """检查禁止标签和属性中的内联资源"""
+        if tag in self.FORBIDDEN_ELEMENTS:
+            self._add_issue('error', f"片段中不应包含 <{tag}> 标签")
+        for _, value in attrs:
+            if value:
+                self._check_data_uris(value)
+
+    def _check_data_uris(self, text: str):
+        """检查过大的data URI（如内嵌base64图片）"""
+        if 'data:' not in text:
+            return
+        for match in self.DATA_URI_PATTERN.finditer(text):
+            size = match.end() - match.start()
+            if size > self.inline_asset_max_size:
+                self._add_issue('warning', f"内联资源（data URI）大小 {size // 1024} KB，超过 {self.inline_asset_max_size // 1024} KB")
+
+    def _add_issue(self, level: str, message: str, line: Optional[int] = None, column: Optional[int] = None):
+        if line is None:
+            line, column = self.getpos()
+        self._issues.append({"level": level, "line": line, "column": column + 1, "message": message})
+
+    def _finish(self) -> List[Dict[str, Any]]:
+        """结束扫描，报告所有未关闭的元素"""
+        self.close()
+        for name, line, column in self._stack:
+            if name not in self.OPTIONAL_END_ELEMENTS:
+                self._add_issue('error', f"<{name}> 未关闭", line, column)
+        self._stack = []
+        return sorted(self._issues, key=lambda issue: (issue['line'], issue['column']))
+
+    def _reset_state(self):
+        self.reset()
+        self._stack: List[Tuple[str, int, int]] = []
+        self._issues: List[Dict[str, Any]] = []
+        self._inline_size = 0
+        self._inline_reported = False
@@ -6,16 +6,37 @@
 
 import os
 import json
+import hashlib
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from bs4 import BeautifulSoup
 import re
 
 class FunctionAnalyzer:
     """页面功能分析器"""
     
+    # 页面分析缓存（项目目录下，构建和备份时跳过）
+    CACHE_DIR = ".pm-cache"
+    CACHE_FILE = "analysis.sqlite"
+    # 分析逻辑或结果格式变化时递增，使旧缓存全部失效
+    CACHE_VERSION = 1
+    CACHE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS page_analysis (
+        path TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        sha256 TEXT NOT NULL,
+        analysis TEXT NOT NULL
+    );
+    """
+    
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
+        self.cache_db = self.project_root / self.CACHE_DIR / self.CACHE_FILE
         self.analysis_results = {}
         self.function_patterns = {
             'buttons': {
@@ -45,10 +66,14 @@ class FunctionAnalyzer:
             }
         }
     
-    def analyze_project(self) -> Dict:
+    def analyze_project(self, jobs: int = 1, use_cache: bool = True) -> Dict:
         """
         分析整个项目的功能需求
         
+        Args:
+            jobs: 并行分析页面的进程数，1 表示在当前进程中逐个分析
+            use_cache: 是否使用页面分析缓存，只重新分析上次分析后变化的页面
+            
         Returns:
             Dict: 分析结果
         """
@@ -84,15 +109,20 @@ class FunctionAnalyzer:
             "recommendations": []
         }
         
-        # 遍历所有HTML文件
-        for html_file in pages_dir.rglob("*.html"):
-            page_analysis = self._analyze_page(html_file)
+        # 遍历所有HTML文件（排序后分析，结果顺序与并行进程数无关）
+        html_files = sorted(pages_dir.rglob("*.html"))
+        if use_cache:
+            page_results = self._analyze_pages_cached(html_files, jobs)
+        else:
+            page_results = self._analyze_pages(html_files, jobs)
+        # 汇总统计和建议总是由全部页面的结果重新计算
+        for html_file, page_analysis in zip(html_files, page_results):
             relative_path = str(html_file.relative_to(self.project_root))
             analysis_result["pages_analysis"][relative_path] = page_analysis
             analysis_result["total_pages"] += 1
             
-            # 累计统计
-            for func_type, count in page_analysis["function_counts"].items():
+            # 累计统计（分析出错的页面没有计数）
+            for func_type, count in page_analysis.get("function_counts", {}).items():
                 analysis_result["function_summary"][func_type] += count
         
         # 生成建议
@@ -106,6 +136,111 @@ class FunctionAnalyzer:
         
         return analysis_result
     
+    def _analyze_pages(self, html_files: List[Path], jobs: int = 1) -> List[Dict]:
+        """
+        分析多个页面，返回与 html_files 顺序一致的分析结果
+        
+        页面解析完全消耗CPU，多线程受GIL限制无法加速，因此使用进程池；
+        每个工作进程只创建一次分析器，页面按批分发以减少进程间通信
+        
+        Args:
+            html_files: 页面文件列表
+            jobs: 进程数
+            
+        Returns:
+            List[Dict]: 页面分析结果
+        """
+        if jobs <= 1 or len(html_files) < 2:
+            return [self._analyze_page(html_file) for html_file in html_files]
+        
+        start = time.perf_counter()
+        chunksize = max(1, len(html_files) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(str(self.project_root),)) as executor:
+            results = list(executor.map(_analyze_page_in_worker, [str(html_file) for html_file in html_files],
+                                        chunksize=chunksize))
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        
+        # 页面解析的CPU时间之和约等于单进程分析所需时间（不受进程间争抢CPU的影响）
+        busy = sum(seconds for _, seconds in results)
+        print(f"⚡ 并行分析 {len(html_files)} 个页面: {jobs} 个进程，用时 {elapsed:.2f}s"
+              f"（单进程约 {busy:.2f}s，加速比 {busy / elapsed:.2f}x）")
+        return [page_analysis for page_analysis, _ in results]
+    
+    def _analyze_pages_cached(self, html_files: List[Path], jobs: int = 1) -> List[Dict]:
+        """
+        分析多个页面，未变化的页面直接使用缓存的分析结果
+        
+        大小和修改时间都与缓存相同视为未变化；只有修改时间不同时再比较内容哈希，
+        内容相同则更新缓存中的修改时间，不重新分析
+        
+        Args:
+            html_files: 页面文件列表
+            jobs: 重新分析时的进程数
+            
+        Returns:
+            List[Dict]: 与 html_files 顺序一致的页面分析结果
+        """
+        with self._cache() as conn:
+            cached = {row[0]: row for row in conn.execute(
+                "SELECT path, size, mtime_ns, sha256, analysis FROM page_analysis")}
+            
+            results: List[Optional[Dict]] = []
+            pending = []
+            for index, html_file in enumerate(html_files):
+                relative_path = html_file.relative_to(self.project_root).as_posix()
+                # 先取文件状态再读取内容：分析期间文件被修改时，下次会因修改时间不同而重新分析
+                stat = html_file.stat()
+                row = cached.pop(relative_path, None)
+                digest = None
+                if row and row[1] == stat.st_size and row[2] != stat.st_mtime_ns:
+                    digest = hashlib.sha256(html_file.read_bytes()).hexdigest()
+                    if digest == row[3]:
+                        conn.execute("UPDATE page_analysis SET mtime_ns = ? WHERE path = ?",
+                                     (stat.st_mtime_ns, relative_path))
+                if row and row[1] == stat.st_size and (row[2] == stat.st_mtime_ns or digest == row[3]):
+                    page_analysis = json.loads(row[4])
+                    page_analysis["file_path"] = str(html_file)
+                    results.append(page_analysis)
+                else:
+                    results.append(None)
+                    pending.append((index, relative_path, stat, digest))
+            
+            analyzed = self._analyze_pages([html_files[index] for index, *_ in pending], jobs)
+            for (index, relative_path, stat, digest), page_analysis in zip(pending, analyzed):
+                results[index] = page_analysis
+                # 分析出错的页面不缓存，下次重新分析
+                if "error" in page_analysis:
+                    continue
+                if digest is None:
+                    digest = hashlib.sha256(html_files[index].read_bytes()).hexdigest()
+                conn.execute(
+                    "INSERT OR REPLACE INTO page_analysis (path, size, mtime_ns, sha256, analysis) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (relative_path, stat.st_size, stat.st_mtime_ns, digest,
+                     json.dumps(page_analysis, ensure_ascii=False)))
+            
+            # 已删除的页面
+            conn.executemany("DELETE FROM page_analysis WHERE path = ?", [(path,) for path in cached])
+        
+        print(f"💾 分析缓存: 复用 {len(html_files) - len(pending)} 个页面，重新分析 {len(pending)} 个页面")
+        return results
+    
+    @contextmanager
+    def _cache(self):
+        """打开页面分析缓存数据库；缓存版本不同时清空旧结果；正常退出时提交事务"""
+        self.cache_db.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.cache_db), timeout=30)
+        try:
+            conn.executescript(self.CACHE_SCHEMA)
+            if conn.execute("PRAGMA user_version").fetchone()[0] != self.CACHE_VERSION:
+                conn.execute("DELETE FROM page_analysis")
+                conn.execute(f"PRAGMA user_version = {self.CACHE_VERSION}")
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+    
     def _analyze_page(self, html_file: Path) -> Dict:
         """分析单个页面"""
         try:
@@ -335,6 +470,23 @@ class FunctionAnalyzer:
         return datetime.now().isoformat()
 
 
+# 工作进程中的分析器（由进程池初始化函数创建）
+_worker_analyzer: Optional[FunctionAnalyzer] = None
+
+
+def _init_worker(project_root: str) -> None:
+    """进程池初始化：每个工作进程创建一个分析器"""
+    global _worker_analyzer
+    _worker_analyzer = FunctionAnalyzer(project_root)
+
+
+def _analyze_page_in_worker(html_file: str) -> Tuple[Dict, float]:
+    """在工作进程中分析单个页面，返回分析结果和占用的CPU时间（秒）"""
+    start = time.process_time()
+    page_analysis = _worker_analyzer._analyze_page(Path(html_file))
+    return page_analysis, time.process_time() - start
+
+
 def main():
     """命令行界面"""
     import argparse
@@ -343,11 +495,15 @@ def main():
     parser.add_argument("project_path", help="项目路径")
     parser.add_argument("--output", "-o", help="输出文件路径（可选）")
     parser.add_argument("--verbose", "-v", action='store_true', help="详细输出")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                       help="并行分析页面的进程数（默认1；0 表示使用全部CPU核数）")
+    parser.add_argument("--no-cache", action='store_true',
+                       help=f"不使用页面分析缓存（{FunctionAnalyzer.CACHE_DIR}/{FunctionAnalyzer.CACHE_FILE}），重新分析所有页面")
     
     args = parser.parse_args()
     
     analyzer = FunctionAnalyzer(args.project_path)
-    result = analyzer.analyze_project()
+    result = analyzer.analyze_project(jobs=args.jobs or os.cpu_count() or 1, use_cache=not args.no_cache)
     
     if args.verbose:
         print("\n📊 详细分析结果:")
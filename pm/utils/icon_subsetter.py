@@ -0,0 +1,79 @@
+"""
+图标子集构建器
+收集页面中实际使用的 fa-* 图标类，基于内置图标集生成精简的icons.css，
+替代从CDN加载完整的Font Awesome样式表及字体文件
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import Iterable, List, Set, Tuple
+from urllib.parse import quote
+
+# 添加父目录到路径以支持导入
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.insert(0, str(parent_dir))
+
+from templates.icon_templates import IconTemplates
+
+
+class IconSubsetter:
+    """图标子集构建器类"""
+
+    ICON_CLASS_PATTERN = re.compile(r'(?<![\w-])fa-([a-z0-9]+(?:-[a-z0-9]+)*)')
+
+    def collect_icons(self, files: Iterable[Path]) -> Tuple[Set[str], Set[str]]:
+        """
+        收集文件中使用的图标
+
+        Args:
+            files: 待扫描的文件列表（HTML/JS）
+
+        Returns:
+            Tuple[Set[str], Set[str]]: (已使用的图标类名, 内置图标集中缺失的图标类名)
+        """
+        used = set()
+        missing = set()
+        for file_path in files:
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"⚠️  跳过无法读取的文件 {file_path}: {e}")
+                continue
+
+            for name in self.ICON_CLASS_PATTERN.findall(content):
+                class_name = f'fa-{name}'
+                if class_name in IconTemplates.MODIFIERS or class_name in IconTemplates.STYLE_CLASSES:
+                    used.add(class_name)
+                elif IconTemplates.resolve(name):
+                    used.add(class_name)
+                else:
+                    missing.add(class_name)
+        return used, missing
+
+    def build_css(self, icon_classes: Iterable[str]) -> Tuple[str, List[str]]:
+        """
+        生成图标样式表
+
+        Args:
+            icon_classes: 图标类名（含 fa- 前缀）
+
+        Returns:
+            Tuple[str, List[str]]: (CSS内容, 已生成的图标类名列表)
+        """
+        rules = [IconTemplates.BASE_CSS]
+        generated = []
+        for class_name in sorted(set(icon_classes)):
+            if class_name in IconTemplates.MODIFIERS:
+                rules.append(f'.{class_name} {{ {IconTemplates.MODIFIERS[class_name]}; }}')
+                continue
+
+            icon = IconTemplates.resolve(class_name[len('fa-'):])
+            if icon is None:
+                continue
+            data_uri = 'data:image/svg+xml,' + quote(IconTemplates.get_icon_svg(icon), safe=' /=:"')
+            rules.append(f'.{class_name} {{ --fa-icon: url(\'{data_uri}\'); }}')
+            generated.append(class_name)
+
+        return '\n'.join(rules) + '\n', generated
@@ -0,0 +1,339 @@
+"""
+页面撤销日志
+每次页面更新时记录反向增量（difflib行级差异），可重建页面的任意历史版本，
+替代在模块目录中保存带时间戳的完整页面副本
+
+日志中的页面内容去掉了静态资源引用的指纹：重新构建静态资源只会改变指纹，
+不视为页面修改；恢复历史版本时再按当前构建结果改写引用
+"""
+
+import difflib
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# 添加父目录到路径以支持导入
+current_dir = Path(__file__).parent
+parent_dir = current_dir.parent
+sys.path.insert(0, str(parent_dir))
+
+from utils.asset_pipeline import AssetPipeline
+
+PathLike = Union[str, Path]
+
+
+class PageJournal:
+    """页面撤销日志类
+
+    每个页面对应两个文件：
+        <页面路径>.head.gz  最近一次记录的页面内容（即最新版本）
+        <页面路径>.jsonl    历史记录，第i条记录保存由版本i+1重建版本i的反向增量，
+                            以及生成版本i+1的操作时间和类型
+        <页面路径>.blobs/   超过增量大小上限的旧版本，按内容哈希压缩保存（<sha256>.gz）
+    """
+
+    JOURNAL_DIR = Path("backups") / "journal"
+    # 超过该大小的页面不计算行级差异，旧版本完整内容压缩后单独保存
+    DELTA_MAX_SIZE = 2 * 1024 * 1024
+
+    def __init__(self, project_root: str):
+        self.project_root = Path(project_root)
+        self.journal_root = self.project_root / self.JOURNAL_DIR
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def record(self, page_url: str, old_file: Optional[PathLike], new_file: PathLike,
+               action: str = "update") -> None:
+        """
+        记录一次页面更新（页面内容按块读取，不整体读入内存）
+
+        Args:
+            page_url: 页面URL路径（相对于项目根目录）
+            old_file: 更新前的页面文件（页面原本不存在时为None）
+            new_file: 更新后的页面文件（可以是尚未替换到位的临时文件）
+            action: 更新类型（update/undo）
+        """
+        if old_file is None:
+            return
+
+        with self._lock(page_url):
+            head_file = self._head_file(page_url)
+            old_digest = self._digest(old_file)
+            new_digest = self._digest(new_file)
+            entries = []
+            # 页面在上次记录后被外部修改（如重新构建静态资源），先把修改后的内容记为一个版本
+            if head_file.exists():
+                head_digest = self._digest(head_file, compressed=True)
+                if head_digest != old_digest:
+                    entries.append(self._make_entry(page_url, old_file, old_digest,
+                                                    head_file, head_digest, "external", old_compressed=True))
+            entries.append(self._make_entry(page_url, new_file, new_digest, old_file, old_digest, action))
+
+            journal_file = self._journal_file(page_url)
+            journal_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(journal_file, 'a', encoding='utf-8') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._write_head(page_url, new_file)
+
+    def history(self, page_url: str) -> List[Dict[str, Any]]:
+        """
+        获取页面的版本列表（按版本号从旧到新）
+
+        Args:
+            page_url: 页面URL路径
+
+        Returns:
+            List[Dict[str, Any]]: 版本信息列表，每项包含 version、created_at、action、size、current
+        """
+        entries = self._read_entries(page_url)
+        head_file = self._head_file(page_url)
+        if not head_file.exists():
+            return []
+        head_sha256, head_size = self._digest(head_file, compressed=True)
+
+        # 第i条记录由生成版本i+1的操作写入，记录了该操作的时间和类型
+        sizes = [entry['size'] for entry in entries] + [head_size]
+        versions = []
+        for index, size in enumerate(sizes):
+            previous = entries[index - 1] if index > 0 else None
+            versions.append({
+                "version": index + 1,
+                "created_at": previous['saved_at'] if previous else None,
+                "action": previous['action'] if previous else "initial",
+                "size": size,
+                "current": False
+            })
+
+        page_file = self.project_root / page_url
+        versions[-1]['current'] = page_file.exists() and self._digest(page_file) == (head_sha256, head_size)
+        return versions
+
+    def reconstruct(self, page_url: str, version: int) -> Optional[bytes]:
+        """
+        重建页面的指定版本
+
+        Args:
+            page_url: 页面URL路径
+            version: 版本号（从1开始，最新版本号为历史记录数+1）
+
+        Returns:
+            Optional[bytes]: 页面内容（资源引用不带指纹），版本不存在时返回None
+        """
+        entries = self._read_entries(page_url)
+        if not self._head_file(page_url).exists() or version < 1 or version > len(entries) + 1:
+            return None
+
+        # 从离目标版本最近的完整保存版本（没有时为最新内容）开始逐条应用反向增量
+        start = next((index for index in range(version - 1, len(entries)) if 'blob' in entries[index]), None)
+        if start is None:
+            start = len(entries) - 1
+            content = self._read_head(page_url)
+        for index in range(start, version - 2, -1):
+            entry = entries[index]
+            if 'blob' in entry:
+                content = gzip.decompress(self._blob_file(page_url, entry['blob']).read_bytes())
+            else:
+                content = self._apply_delta(content, entry['delta'])
+            if hashlib.sha256(content).hexdigest() != entry['sha256']:
+                raise ValueError(f"版本 {index + 1} 校验失败，撤销日志可能已损坏")
+        return content
+
+    def undo(self, page_url: str, version: Optional[int] = None) -> Optional[int]:
+        """
+        将页面恢复到指定版本（默认恢复到当前内容之前的版本），恢复操作本身也会被记录
+
+        Args:
+            page_url: 页面URL路径
+            version: 目标版本号，None表示上一个版本
+
+        Returns:
+            Optional[int]: 恢复到的版本号，无可恢复版本时返回None
+        """
+        page_file = self.project_root / page_url
+        versions = self.history(page_url)
+        if not versions:
+            return None
+
+        if version is None:
+            # 当前内容与最新记录一致时回到上一个版本，否则（被外部修改过）回到最新记录
+            latest = versions[-1]
+            version = latest['version'] - 1 if latest['current'] else latest['version']
+        content = self.reconstruct(page_url, version)
+        if content is None:
+            return None
+        # 按当前构建结果改写资源引用（历史版本引用的指纹文件可能已被清理）
+        asset_pipeline = AssetPipeline(str(self.project_root))
+        if asset_pipeline.is_built():
+            content = asset_pipeline.render_page(content.decode('utf-8'), page_file).encode('utf-8')
+
+        temp_file = page_file.with_name(f"{page_file.name}.{os.getpid()}.tmp")
+        temp_file.write_bytes(content)
+        try:
+            self.record(page_url, page_file if page_file.exists() else None, temp_file, "undo")
+            os.replace(temp_file, page_file)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
+        return version
+
+    def _make_entry(self, page_url: str, new_file: PathLike, new_digest: Tuple[str, int],
+                    old_file: PathLike, old_digest: Tuple[str, int], action: str,
+                    old_compressed: bool = False) -> Dict[str, Any]:
+        """
+        生成一条历史记录：由新内容重建旧内容的反向增量
+
+        新旧内容都不超过 DELTA_MAX_SIZE 时保存行级差异，否则把旧内容压缩后另存为
+        按哈希命名的文件，记录中只保存其哈希
+
+        Args:
+            page_url: 页面URL路径
+            new_file: 新内容文件
+            new_digest: 新内容的 (sha256, 大小)
+            old_file: 旧内容文件
+            old_digest: 旧内容的 (sha256, 大小)
+            action: 更新类型
+            old_compressed: 旧内容文件是否为gzip压缩（最近记录的页面内容）
+
+        Returns:
+            Dict[str, Any]: 历史记录
+        """
+        entry = {
+            "saved_at": datetime.now().isoformat(),
+            "action": action,
+            "size": old_digest[1],
+            "sha256": old_digest[0]
+        }
+        if new_digest[1] > self.DELTA_MAX_SIZE or old_digest[1] > self.DELTA_MAX_SIZE:
+            self._write_blob(page_url, old_file, old_digest[0], old_compressed)
+            entry['blob'] = old_digest[0]
+            return entry
+
+        new_content = b''.join(self._iter_lines(new_file))
+        old_content = b''.join(self._iter_lines(old_file, old_compressed))
+        entry['delta'] = self._make_delta(new_content, old_content)
+        return entry
+
+    def _make_delta(self, new_content: bytes, old_content: bytes) -> List[Any]:
+        """
+        计算反向增量
+
+        增量为操作列表：[起始行, 结束行] 表示复制新内容中的行，字符串列表表示旧内容中的原文行
+        """
+        new_lines = new_content.decode('utf-8').splitlines(keepends=True)
+        old_lines = old_content.decode('utf-8').splitlines(keepends=True)
+        delta = []
+        matcher = difflib.SequenceMatcher(None, new_lines, old_lines, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                delta.append([i1, i2])
+            elif j1 < j2:
+                delta.append(old_lines[j1:j2])
+        return delta
+
+    def _apply_delta(self, new_content: bytes, delta: List[Any]) -> bytes:
+        """应用反向增量，由新内容重建旧内容"""
+        new_lines = new_content.decode('utf-8').splitlines(keepends=True)
+        old_lines = []
+        for op in delta:
+            if op and isinstance(op[0], int):
+                old_lines.extend(new_lines[op[0]:op[1]])
+            else:
+                old_lines.extend(op)
+        return ''.join(old_lines).encode('utf-8')
+
+    def _read_entries(self, page_url: str) -> List[Dict[str, Any]]:
+        """读取页面的历史记录"""
+        journal_file = self._journal_file(page_url)
+        if not journal_file.exists():
+            return []
+        with open(journal_file, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _read_head(self, page_url: str) -> Optional[bytes]:
+        """读取最近一次记录的页面内容"""
+        head_file = self._head_file(page_url)
+        if not head_file.exists():
+            return None
+        return gzip.decompress(head_file.read_bytes())
+
+    def _write_head(self, page_url: str, new_file: PathLike) -> None:
+        """原子写入最近一次记录的页面内容"""
+        head_file = self._head_file(page_url)
+        temp_file = head_file.with_name(f"{head_file.name}.{os.getpid()}.tmp")
+        self._compress_file(new_file, temp_file)
+        os.replace(temp_file, head_file)
+
+    def _write_blob(self, page_url: str, source: PathLike, sha256: str, compressed: bool) -> None:
+        """压缩保存完整的旧版本内容（相同内容只保存一份）"""
+        blob_file = self._blob_file(page_url, sha256)
+        if blob_file.exists():
+            return
+        blob_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = blob_file.with_name(f"{blob_file.name}.{os.getpid()}.tmp")
+        if compressed:
+            shutil.copyfile(source, temp_file)
+        else:
+            self._compress_file(source, temp_file)
+        os.replace(temp_file, blob_file)
+
+    def _compress_file(self, source: PathLike, target: PathLike) -> None:
+        """逐行gzip压缩去掉指纹后的页面内容（不写入修改时间，相同内容得到相同结果）"""
+        with open(target, 'wb') as raw:
+            with gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as dst:
+                for line in self._iter_lines(source):
+                    dst.write(line)
+
+    def _digest(self, file_path: PathLike, compressed: bool = False) -> Tuple[str, int]:
+        """
+        逐行计算去掉指纹后的页面内容的SHA-256和大小
+
+        Args:
+            file_path: 文件路径
+            compressed: 文件是否为gzip压缩（计算解压后的内容）
+
+        Returns:
+            Tuple[str, int]: (sha256, 字节数)
+        """
+        sha256 = hashlib.sha256()
+        size = 0
+        for line in self._iter_lines(file_path, compressed):
+            sha256.update(line)
+            size += len(line)
+        return sha256.hexdigest(), size
+
+    def _iter_lines(self, file_path: PathLike, compressed: bool = False) -> Iterator[bytes]:
+        """
+        逐行读取页面内容并去掉资源引用中的指纹（资源引用不会跨行，按行处理即可）
+
+        Args:
+            file_path: 文件路径
+            compressed: 文件是否为gzip压缩
+
+        Yields:
+            bytes: 去掉指纹后的一行内容
+        """
+        with (gzip.open(file_path, 'rb') if compressed else open(file_path, 'rb')) as f:
+            for line in f:
+                yield AssetPipeline.strip_fingerprints(line)
+
+    def _journal_file(self, page_url: str) -> Path:
+        return self.journal_root / f"{page_url}.jsonl"
+
+    def _head_file(self, page_url: str) -> Path:
+        return self.journal_root / f"{page_url}.head.gz"
+
+    def _blob_file(self, page_url: str, sha256: str) -> Path:
+        return self.journal_root / f"{page_url}.blobs" / f"{sha256}.gz"
+
+    def _lock(self, page_url: str) -> threading.Lock:
+        """获取页面级锁（批量导入时多个线程并行写入不同页面）"""
+        with self._locks_guard:
+            return self._locks.setdefault(page_url, threading.Lock())
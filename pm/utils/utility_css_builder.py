@@ -0,0 +1,653 @@
+"""
+工具类CSS构建器
+扫描页面中实际使用的TailwindCSS类名，生成静态、精简的utilities.css，
+替代每个页面在浏览器中通过CDN脚本即时编译样式
+"""
+
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+
+class UtilityCSSBuilder:
+    """工具类CSS构建器类"""
+
+    # 项目颜色规范（与 tailwind.config 中的扩展颜色保持一致）
+    CUSTOM_COLORS = {
+        'gray-custom': '#f5f5f5',
+        'border-custom': '#cccccc',
+        'text-primary': '#333333',
+        'text-secondary': '#666666',
+    }
+
+    BASE_COLORS = {
+        'white': '#ffffff',
+        'black': '#000000',
+    }
+
+    # TailwindCSS v3 默认色板
+    PALETTE = {
+        'slate': ['#f8fafc', '#f1f5f9', '#e2e8f0', '#cbd5e1', '#94a3b8',
+                  '#64748b', '#475569', '#334155', '#1e293b', '#0f172a'],
+        'zinc': ['#fafafa', '#f4f4f5', '#e4e4e7', '#d4d4d8', '#a1a1aa',
+                 '#71717a', '#52525b', '#3f3f46', '#27272a', '#18181b'],
+        'neutral': ['#fafafa', '#f5f5f5', '#e5e5e5', '#d4d4d4', '#a3a3a3',
+                    '#737373', '#525252', '#404040', '#262626', '#171717'],
+        'stone': ['#fafaf9', '#f5f5f4', '#e7e5e4', '#d6d3d1', '#a8a29e',
+                  '#78716c', '#57534e', '#44403c', '#292524', '#1c1917'],
+        'gray': ['#f9fafb', '#f3f4f6', '#e5e7eb', '#d1d5db', '#9ca3af',
+                 '#6b7280', '#4b5563', '#374151', '#1f2937', '#111827'],
+        'red': ['#fef2f2', '#fee2e2', '#fecaca', '#fca5a5', '#f87171',
+                '#ef4444', '#dc2626', '#b91c1c', '#991b1b', '#7f1d1d'],
+        'orange': ['#fff7ed', '#ffedd5', '#fed7aa', '#fdba74', '#fb923c',
+                   '#f97316', '#ea580c', '#c2410c', '#9a3412', '#7c2d12'],
+        'amber': ['#fffbeb', '#fef3c7', '#fde68a', '#fcd34d', '#fbbf24',
+                  '#f59e0b', '#d97706', '#b45309', '#92400e', '#78350f'],
+        'yellow': ['#fefce8', '#fef9c3', '#fef08a', '#fde047', '#facc15',
+                   '#eab308', '#ca8a04', '#a16207', '#854d0e', '#713f12'],
+        'lime': ['#f7fee7', '#ecfccb', '#d9f99d', '#bef264', '#a3e635',
+                 '#84cc16', '#65a30d', '#4d7c0f', '#3f6212', '#365314'],
+        'green': ['#f0fdf4', '#dcfce7', '#bbf7d0', '#86efac', '#4ade80',
+                  '#22c55e', '#16a34a', '#15803d', '#166534', '#14532d'],
+        'emerald': ['#ecfdf5', '#d1fae5', '#a7f3d0', '#6ee7b7', '#34d399',
+                    '#10b981', '#059669', '#047857', '#065f46', '#064e3b'],
+        'teal': ['#f0fdfa', '#ccfbf1', '#99f6e4', '#5eead4', '#2dd4bf',
+                 '#14b8a6', '#0d9488', '#0f766e', '#115e59', '#134e4a'],
+        'cyan': ['#ecfeff', '#cffafe', '#a5f3fc', '#67e8f9', '#22d3ee',
+                 '#06b6d4', '#0891b2', '#0e7490', '#155e75', '#164e63'],
+        'sky': ['#f0f9ff', '#e0f2fe', '#bae6fd', '#7dd3fc', '#38bdf8',
+                '#0ea5e9', '#0284c7', '#0369a1', '#075985', '#0c4a6e'],
+        'blue': ['#eff6ff', '#dbeafe', '#bfdbfe', '#93c5fd', '#60a5fa',
+                 '#3b82f6', '#2563eb', '#1d4ed8', '#1e40af', '#1e3a8a'],
+        'indigo': ['#eef2ff', '#e0e7ff', '#c7d2fe', '#a5b4fc', '#818cf8',
+                   '#6366f1', '#4f46e5', '#4338ca', '#3730a3', '#312e81'],
+        'violet': ['#f5f3ff', '#ede9fe', '#ddd6fe', '#c4b5fd', '#a78bfa',
+                   '#8b5cf6', '#7c3aed', '#6d28d9', '#5b21b6', '#4c1d95'],
+        'purple': ['#faf5ff', '#f3e8ff', '#e9d5ff', '#d8b4fe', '#c084fc',
+                   '#a855f7', '#9333ea', '#7e22ce', '#6b21a8', '#581c87'],
+        'fuchsia': ['#fdf4ff', '#fae8ff', '#f5d0fe', '#f0abfc', '#e879f9',
+                    '#d946ef', '#c026d3', '#a21caf', '#86198f', '#701a75'],
+        'pink': ['#fdf2f8', '#fce7f3', '#fbcfe8', '#f9a8d4', '#f472b6',
+                 '#ec4899', '#db2777', '#be185d', '#9d174d', '#831843'],
+        'rose': ['#fff1f2', '#ffe4e6', '#fecdd3', '#fda4af', '#fb7185',
+                 '#f43f5e', '#e11d48', '#be123c', '#9f1239', '#881337'],
+    }
+
+    SHADES = ['50', '100', '200', '300', '400', '500', '600', '700', '800', '900']
+
+    SPACING_KEYS = ['0', 'px', '0.5', '1', '1.5', '2', '2.5', '3', '3.5', '4', '5', '6',
+                    '7', '8', '9', '10', '11', '12', '14', '16', '20', '24', '28', '32',
+                    '36', '40', '44', '48', '52', '56', '60', '64', '72', '80', '96']
+
+    FRACTIONS = {
+        '1/2': '50%', '1/3': '33.333333%', '2/3': '66.666667%',
+        '1/4': '25%', '3/4': '75%', '1/5': '20%', '2/5': '40%',
+        '3/5': '60%', '4/5': '80%', '1/6': '16.666667%', '5/6': '83.333333%',
+    }
+
+    FONT_SIZES = {
+        'xs': ('0.75rem', '1rem'), 'sm': ('0.875rem', '1.25rem'),
+        'base': ('1rem', '1.5rem'), 'lg': ('1.125rem', '1.75rem'),
+        'xl': ('1.25rem', '1.75rem'), '2xl': ('1.5rem', '2rem'),
+        '3xl': ('1.875rem', '2.25rem'), '4xl': ('2.25rem', '2.5rem'),
+        '5xl': ('3rem', '1'), '6xl': ('3.75rem', '1'),
+    }
+
+    MAX_WIDTHS = {
+        'none': 'none', 'xs': '20rem', 'sm': '24rem', 'md': '28rem', 'lg': '32rem',
+        'xl': '36rem', '2xl': '42rem', '3xl': '48rem', '4xl': '56rem', '5xl': '64rem',
+        '6xl': '72rem', '7xl': '80rem', 'full': '100%', 'screen': '100vw',
+    }
+
+    LINE_HEIGHTS = {
+        '3': '.75rem', '4': '1rem', '5': '1.25rem', '6': '1.5rem',
+        '7': '1.75rem', '8': '2rem', '9': '2.25rem', '10': '2.5rem',
+    }
+
+    LETTER_SPACINGS = {
+        'tighter': '-0.05em', 'tight': '-0.025em', 'normal': '0em',
+        'wide': '0.025em', 'wider': '0.05em', 'widest': '0.1em',
+    }
+
+    RADII = {
+        '': '0.25rem', 'none': '0px', 'sm': '0.125rem', 'md': '0.375rem', 'lg': '0.5rem',
+        'xl': '0.75rem', '2xl': '1rem', '3xl': '1.5rem', 'full': '9999px',
+    }
+
+    SHADOWS = {
+        '': '0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)',
+        'sm': '0 1px 2px 0 rgb(0 0 0 / 0.05)',
+        'md': '0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)',
+        'lg': '0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)',
+        'xl': '0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)',
+        '2xl': '0 25px 50px -12px rgb(0 0 0 / 0.25)',
+        'inner': 'inset 0 2px 4px 0 rgb(0 0 0 / 0.05)',
+        'none': '0 0 #0000',
+    }
+
+    SCREENS = [('sm', '640px'), ('md', '768px'), ('lg', '1024px'), ('xl', '1280px'), ('2xl', '1536px')]
+
+    STATE_VARIANTS = {
+        'hover': ':hover', 'focus': ':focus', 'active': ':active',
+        'disabled': ':disabled', 'first': ':first-child', 'last': ':last-child',
+    }
+
+    # 状态变体在样式表中的先后顺序（与TailwindCSS一致，靠后的变体优先）
+    VARIANT_ORDER = ['first', 'last', 'group-hover', 'hover', 'focus', 'active', 'disabled']
+
+    # 工具类在样式表中的先后顺序：按TailwindCSS核心插件的顺序排列CSS属性分组，
+    # 排在后面的规则在层叠时优先（如 leading-* 覆盖 text-sm 的行高）
+    CASCADE_GROUPS = [
+        ['pointer-events'], ['position'], ['top', 'right', 'bottom', 'left'], ['z-index'], ['order'],
+        ['grid-column'],
+        ['margin', 'margin-top', 'margin-right', 'margin-bottom', 'margin-left'],
+        ['display'], ['height'], ['max-height'], ['min-height'], ['width'], ['min-width'], ['max-width'],
+        ['flex', 'flex-shrink', 'flex-grow'], ['cursor'], ['user-select'], ['list-style-type'],
+        ['grid-template-columns'], ['flex-direction'], ['flex-wrap'], ['place-items'], ['align-items'],
+        ['justify-content'], ['gap', 'column-gap', 'row-gap'], ['align-self'],
+        ['overflow', 'overflow-x', 'overflow-y'], ['text-overflow'], ['white-space'], ['word-break'],
+        ['border-radius', 'border-top-left-radius', 'border-top-right-radius',
+         'border-bottom-right-radius', 'border-bottom-left-radius'],
+        ['border-width', 'border-top-width', 'border-right-width', 'border-bottom-width', 'border-left-width'],
+        ['border-style'], ['border-color'], ['background-color'], ['object-fit'],
+        ['padding', 'padding-top', 'padding-right', 'padding-bottom', 'padding-left'],
+        ['text-align'], ['font-family'], ['font-size'], ['font-weight'], ['text-transform'], ['font-style'],
+        ['line-height'], ['letter-spacing'], ['color'], ['text-decoration-line'], ['opacity'], ['box-shadow'],
+        ['outline', 'outline-offset'], ['transition-property'], ['transition-duration'],
+        ['transition-timing-function'],
+    ]
+    CASCADE_INDEX = {prop: index for index, group in enumerate(CASCADE_GROUPS) for prop in group}
+
+    # 简写属性覆盖的普通属性数：同一分组内简写在前、单边属性在后（如 px-2 在 pl-10 之前）
+    SHORTHAND_COVERAGE = {
+        'margin': 4, 'padding': 4, 'border-radius': 4, 'border-width': 4,
+        'overflow': 2, 'gap': 2, 'flex': 3, 'outline': 2,
+    }
+
+    TRANSITION_TIMING = 'cubic-bezier(0.4, 0, 0.2, 1)'
+
+    STATIC_UTILITIES = {
+        # 显示
+        'block': 'display: block', 'inline-block': 'display: inline-block',
+        'inline': 'display: inline', 'flex': 'display: flex',
+        'inline-flex': 'display: inline-flex', 'grid': 'display: grid',
+        'table': 'display: table', 'contents': 'display: contents',
+        'hidden': 'display: none',
+        # 定位
+        'static': 'position: static', 'fixed': 'position: fixed',
+        'absolute': 'position: absolute', 'relative': 'position: relative',
+        'sticky': 'position: sticky',
+        # 弹性布局
+        'flex-row': 'flex-direction: row', 'flex-col': 'flex-direction: column',
+        'flex-wrap': 'flex-wrap: wrap', 'flex-nowrap': 'flex-wrap: nowrap',
+        'flex-1': 'flex: 1 1 0%', 'flex-auto': 'flex: 1 1 auto', 'flex-none': 'flex: none',
+        'flex-grow': 'flex-grow: 1', 'flex-shrink-0': 'flex-shrink: 0', 'shrink-0': 'flex-shrink: 0',
+        'items-start': 'align-items: flex-start', 'items-end': 'align-items: flex-end',
+        'items-center': 'align-items: center', 'items-baseline': 'align-items: baseline',
+        'items-stretch': 'align-items: stretch',
+        'justify-start': 'justify-content: flex-start', 'justify-end': 'justify-content: flex-end',
+        'justify-center': 'justify-content: center', 'justify-between': 'justify-content: space-between',
+        'justify-around': 'justify-content: space-around', 'justify-evenly': 'justify-content: space-evenly',
+        'self-start': 'align-self: flex-start', 'self-end': 'align-self: flex-end',
+        'self-center': 'align-self: center',
+        'place-items-start': 'place-items: start', 'place-items-end': 'place-items: end',
+        'place-items-center': 'place-items: center', 'place-items-stretch': 'place-items: stretch',
+        # 溢出
+        'overflow-auto': 'overflow: auto', 'overflow-hidden': 'overflow: hidden',
+        'overflow-scroll': 'overflow: scroll', 'overflow-x-auto': 'overflow-x: auto',
+        'overflow-y-auto': 'overflow-y: auto', 'overflow-x-hidden': 'overflow-x: hidden',
+        'overflow-y-hidden': 'overflow-y: hidden',
+        # 尺寸
+        'mx-auto': 'margin-left: auto; margin-right: auto',
+        'my-auto': 'margin-top: auto; margin-bottom: auto',
+        'w-auto': 'width: auto', 'w-full': 'width: 100%', 'w-screen': 'width: 100vw',
+        'h-auto': 'height: auto', 'h-full': 'height: 100%', 'h-screen': 'height: 100vh',
+        'min-h-0': 'min-height: 0px', 'min-h-full': 'min-height: 100%',
+        'min-h-screen': 'min-height: 100vh', 'min-w-0': 'min-width: 0px',
+        'max-h-full': 'max-height: 100%', 'max-h-screen': 'max-height: 100vh',
+        # 字体
+        'font-sans': 'font-family: ui-sans-serif, system-ui, -apple-system, "Segoe UI", Roboto, '
+                     '"Helvetica Neue", Arial, "Noto Sans", sans-serif',
+        'font-serif': 'font-family: ui-serif, Georgia, Cambria, "Times New Roman", Times, serif',
+        'font-mono': 'font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, monospace',
+        'font-light': 'font-weight: 300', 'font-normal': 'font-weight: 400',
+        'font-medium': 'font-weight: 500', 'font-semibold': 'font-weight: 600',
+        'font-bold': 'font-weight: 700', 'italic': 'font-style: italic',
+        'underline': 'text-decoration-line: underline', 'line-through': 'text-decoration-line: line-through',
+        'no-underline': 'text-decoration-line: none',
+        'uppercase': 'text-transform: uppercase', 'lowercase': 'text-transform: lowercase',
+        'text-left': 'text-align: left', 'text-center': 'text-align: center',
+        'text-right': 'text-align: right',
+        'truncate': 'overflow: hidden; text-overflow: ellipsis; white-space: nowrap',
+        'whitespace-normal': 'white-space: normal', 'whitespace-nowrap': 'white-space: nowrap',
+        'whitespace-pre': 'white-space: pre', 'whitespace-pre-line': 'white-space: pre-line',
+        'whitespace-pre-wrap': 'white-space: pre-wrap',
+        'break-all': 'word-break: break-all',
+        'leading-none': 'line-height: 1', 'leading-tight': 'line-height: 1.25',
+        'leading-snug': 'line-height: 1.375', 'leading-normal': 'line-height: 1.5',
+        'leading-relaxed': 'line-height: 1.625', 'leading-loose': 'line-height: 2',
+        # 边框
+        'border': 'border-width: 1px', 'border-0': 'border-width: 0px',
+        'border-2': 'border-width: 2px', 'border-4': 'border-width: 4px',
+        'border-t': 'border-top-width: 1px', 'border-b': 'border-bottom-width: 1px',
+        'border-l': 'border-left-width: 1px', 'border-r': 'border-right-width: 1px',
+        'border-t-2': 'border-top-width: 2px', 'border-b-2': 'border-bottom-width: 2px',
+        'border-l-2': 'border-left-width: 2px', 'border-r-2': 'border-right-width: 2px',
+        'border-l-4': 'border-left-width: 4px',
+        'border-solid': 'border-style: solid', 'border-dashed': 'border-style: dashed',
+        'border-dotted': 'border-style: dotted', 'border-none': 'border-style: none',
+        'border-transparent': 'border-color: transparent',
+        'bg-transparent': 'background-color: transparent',
+        # 交互
+        'cursor-pointer': 'cursor: pointer', 'cursor-default': 'cursor: default',
+        'cursor-not-allowed': 'cursor: not-allowed', 'select-none': 'user-select: none',
+        'pointer-events-none': 'pointer-events: none',
+        'outline-none': 'outline: 2px solid transparent; outline-offset: 2px',
+        'list-none': 'list-style-type: none', 'list-disc': 'list-style-type: disc',
+        'object-cover': 'object-fit: cover', 'object-contain': 'object-fit: contain',
+        # 过渡
+        'transition': 'transition-property: color, background-color, border-color, fill, stroke, '
+                      'opacity, box-shadow, transform; transition-timing-function: %s; '
+                      'transition-duration: 150ms' % TRANSITION_TIMING,
+        'transition-colors': 'transition-property: color, background-color, border-color, '
+                             'text-decoration-color, fill, stroke; transition-timing-function: %s; '
+                             'transition-duration: 150ms' % TRANSITION_TIMING,
+        'transition-all': 'transition-property: all; transition-timing-function: %s; '
+                          'transition-duration: 150ms' % TRANSITION_TIMING,
+        'transition-opacity': 'transition-property: opacity; transition-timing-function: %s; '
+                              'transition-duration: 150ms' % TRANSITION_TIMING,
+        'ease-linear': 'transition-timing-function: linear',
+        'ease-in': 'transition-timing-function: cubic-bezier(0.4, 0, 1, 1)',
+        'ease-out': 'transition-timing-function: cubic-bezier(0, 0, 0.2, 1)',
+        'ease-in-out': 'transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1)',
+    }
+
+    # 间距类前缀 -> CSS属性
+    SPACING_PROPERTIES = {
+        'p': ['padding'], 'px': ['padding-left', 'padding-right'],
+        'py': ['padding-top', 'padding-bottom'], 'pt': ['padding-top'],
+        'pr': ['padding-right'], 'pb': ['padding-bottom'], 'pl': ['padding-left'],
+        'm': ['margin'], 'mx': ['margin-left', 'margin-right'],
+        'my': ['margin-top', 'margin-bottom'], 'mt': ['margin-top'],
+        'mr': ['margin-right'], 'mb': ['margin-bottom'], 'ml': ['margin-left'],
+        'gap': ['gap'], 'gap-x': ['column-gap'], 'gap-y': ['row-gap'],
+        'w': ['width'], 'h': ['height'], 'min-w': ['min-width'], 'min-h': ['min-height'],
+        'max-h': ['max-height'],
+        'inset': ['top', 'right', 'bottom', 'left'], 'inset-x': ['left', 'right'], 'inset-y': ['top', 'bottom'],
+        'top': ['top'], 'right': ['right'], 'bottom': ['bottom'], 'left': ['left'],
+    }
+
+    NEGATABLE = {'m', 'mx', 'my', 'mt', 'mr', 'mb', 'ml', 'inset', 'inset-x', 'inset-y',
+                 'top', 'right', 'bottom', 'left'}
+
+    # 看起来是TailwindCSS工具类的类名前缀（类名第一段）：这些类名无法生成时需要保留CDN，
+    # 其余无法生成的类名视为项目自定义类名（如 status-bar、battery）
+    TAILWIND_ROOTS = {
+        'container', 'sr', 'visible', 'invisible', 'collapse', 'static', 'fixed', 'absolute', 'relative',
+        'sticky', 'isolate', 'inset', 'top', 'right', 'bottom', 'left', 'start', 'end', 'z', 'order',
+        'col', 'row', 'float', 'clear', 'm', 'mx', 'my', 'mt', 'mr', 'mb', 'ml', 'ms', 'me', 'box',
+        'block', 'inline', 'flex', 'grid', 'table', 'contents', 'hidden', 'line', 'aspect', 'size',
+        'w', 'h', 'min', 'max', 'basis', 'grow', 'shrink', 'caption', 'border', 'origin', 'translate',
+        'rotate', 'skew', 'scale', 'transform', 'animate', 'cursor', 'touch', 'select', 'resize', 'snap',
+        'scroll', 'list', 'appearance', 'columns', 'break', 'auto', 'place', 'content', 'items',
+        'justify', 'gap', 'space', 'divide', 'self', 'overflow', 'overscroll', 'truncate', 'text',
+        'whitespace', 'rounded', 'bg', 'from', 'via', 'to', 'fill', 'stroke', 'object', 'p', 'px',
+        'py', 'pt', 'pr', 'pb', 'pl', 'ps', 'pe', 'indent', 'align', 'font', 'uppercase', 'lowercase',
+        'capitalize', 'normal', 'italic', 'ordinal', 'leading', 'tracking', 'underline', 'overline',
+        'decoration', 'placeholder', 'caret', 'accent', 'opacity', 'mix', 'shadow', 'outline', 'ring',
+        'filter', 'blur', 'brightness', 'contrast', 'drop', 'grayscale', 'hue', 'invert', 'saturate',
+        'sepia', 'backdrop', 'transition', 'delay', 'duration', 'ease', 'will', 'antialiased', 'hyphens',
+    }
+    # 仅用作状态标记、本身不生成样式的类名
+    MARKER_CLASSES = {'group', 'peer'}
+
+    # 颜色类前缀 -> (CSS属性, 透明度变量)
+    COLOR_PROPERTIES = {
+        'bg': ('background-color', '--tw-bg-opacity'),
+        'text': ('color', '--tw-text-opacity'),
+        'border': ('border-color', '--tw-border-opacity'),
+    }
+
+    PREFLIGHT = '''*, ::before, ::after { box-sizing: border-box; border-width: 0; border-style: solid; border-color: #e5e7eb; }
+html { line-height: 1.5; -webkit-text-size-adjust: 100%; tab-size: 4; font-family: ui-sans-serif, system-ui, -apple-system, "Segoe UI", Roboto, "Helvetica Neue", Arial, "Noto Sans", sans-serif; }
+body { margin: 0; line-height: inherit; }
+h1, h2, h3, h4, h5, h6 { font-size: inherit; font-weight: inherit; }
+a { color: inherit; text-decoration: inherit; }
+b, strong { font-weight: bolder; }
+button, input, optgroup, select, textarea { font-family: inherit; font-size: 100%; font-weight: inherit; line-height: inherit; color: inherit; margin: 0; padding: 0; }
+button, [type='button'], [type='reset'], [type='submit'] { -webkit-appearance: button; background-color: transparent; background-image: none; }
+button, [role="button"] { cursor: pointer; }
+blockquote, dl, dd, h1, h2, h3, h4, h5, h6, hr, figure, p, pre { margin: 0; }
+ol, ul, menu { list-style: none; margin: 0; padding: 0; }
+textarea { resize: vertical; }
+input::placeholder, textarea::placeholder { opacity: 1; color: #9ca3af; }
+img, svg, video, canvas, audio, iframe, embed, object { display: block; vertical-align: middle; }
+img, video { max-width: 100%; height: auto; }
+[hidden] { display: none; }'''
+
+    TOKEN_PATTERN = re.compile(r'[^\s"\'`<>=;{}()\\,]+')
+
+    # 页面及脚本中实际作为类名使用的位置：class/className 属性、classList 调用的字符串参数
+    CLASS_ATTRIBUTE_PATTERN = re.compile(r'''\bclass(?:Name)?\s*=\s*(?:"([^"]*)"|'([^']*)')''')
+    CLASS_LIST_PATTERN = re.compile(r'classList\.(?:add|remove|toggle|replace)\(([^)]*)\)')
+    STRING_LITERAL_PATTERN = re.compile(r'''["']([^"']+)["']''')
+    # 项目样式中定义的类名（.css文件及页面内 <style> 块）
+    STYLE_BLOCK_PATTERN = re.compile(r'<style[^>]*>(.*?)</style>', re.DOTALL | re.IGNORECASE)
+    CSS_CLASS_SELECTOR_PATTERN = re.compile(r'\.(-?[A-Za-z_][\w-]*)')
+
+    def __init__(self):
+        self.spacing = {key: self._spacing_value(key) for key in self.SPACING_KEYS}
+        self.colors = dict(self.BASE_COLORS)
+        self.colors.update(self.CUSTOM_COLORS)
+        for name, values in self.PALETTE.items():
+            for shade, value in zip(self.SHADES, values):
+                self.colors[f'{name}-{shade}'] = value
+
+    def collect_classes(self, files: Iterable[Path]) -> Set[str]:
+        """
+        扫描文件，收集候选类名
+
+        与TailwindCSS的内容扫描一致，文件中出现的每个词元都视为候选，
+        只有能被解析为工具类的词元才会生成样式
+
+        Args:
+            files: 待扫描的文件列表（HTML/JS）
+
+        Returns:
+            Set[str]: 候选类名集合
+        """
+        candidates = set()
+        for file_path in files:
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"⚠️  跳过无法读取的文件 {file_path}: {e}")
+                continue
+            candidates.update(self.TOKEN_PATTERN.findall(content))
+        return candidates
+
+    def find_unsupported(self, files: Iterable[Path], generated: Iterable[str]) -> List[str]:
+        """
+        找出页面实际使用、但无法生成样式的TailwindCSS类名
+
+        只检查 class 属性和 classList 调用中的类名；项目样式中定义的类名、
+        图标等非TailwindCSS类名和模板占位符不计入
+
+        Args:
+            files: 待检查的文件列表（HTML/JS/CSS）
+            generated: 已生成样式的类名
+
+        Returns:
+            List[str]: 无法生成的类名（已排序）
+        """
+        used = set()
+        defined = set()
+        for file_path in files:
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                continue
+            if file_path.suffix == '.css':
+                defined.update(self.CSS_CLASS_SELECTOR_PATTERN.findall(content))
+                continue
+            for style in self.STYLE_BLOCK_PATTERN.findall(content):
+                defined.update(self.CSS_CLASS_SELECTOR_PATTERN.findall(style))
+            for match in self.CLASS_ATTRIBUTE_PATTERN.finditer(content):
+                used.update((match.group(1) or match.group(2) or '').split())
+            for arguments in self.CLASS_LIST_PATTERN.findall(content):
+                for literal in self.STRING_LITERAL_PATTERN.findall(arguments):
+                    used.update(literal.split())
+
+        unsupported = used - set(generated) - defined - self.MARKER_CLASSES
+        return sorted(name for name in unsupported if self._looks_like_utility(name))
+
+    def _looks_like_utility(self, class_name: str) -> bool:
+        """类名是否形如TailwindCSS工具类（跳过模板占位符）"""
+        if any(char in class_name for char in '${}'):
+            return False
+        utility = class_name.split(':')[-1].lstrip('!-')
+        return utility.split('-')[0] in self.TAILWIND_ROOTS
+
+    def build_css(self, classes: Iterable[str]) -> Tuple[str, List[str]]:
+        """
+        根据类名生成CSS
+
+        Args:
+            classes: 候选类名
+
+        Returns:
+            Tuple[str, List[str]]: (CSS内容, 已生成的类名列表)
+        """
+        base_rules = []
+        variant_rules = []
+        media_rules = {screen: [] for screen, _ in self.SCREENS}
+        generated = []
+
+        for class_name in sorted(set(classes)):
+            rule = self._build_rule(class_name)
+            if rule is None:
+                continue
+
+            screen, css, cascade_key = rule
+            generated.append(class_name)
+            if screen:
+                media_rules[screen].append((cascade_key, css))
+            elif ':' in class_name:
+                variant_rules.append((cascade_key, css))
+            else:
+                base_rules.append((cascade_key, css))
+
+        # 同一类名前缀下的规则按层叠顺序排列，后出现的规则覆盖先出现的规则
+        base_rules = [css for _, css in sorted(base_rules)]
+        variant_rules = [css for _, css in sorted(variant_rules)]
+        media_rules = {screen: [css for _, css in sorted(rules)] for screen, rules in media_rules.items()}
+
+        sections = ['/* utilities.css - 由原型生成工具根据页面实际使用的类名自动生成，请勿手动修改 */',
+                    self.PREFLIGHT]
+        sections.extend(base_rules)
+        sections.extend(variant_rules)
+        for screen, min_width in self.SCREENS:
+            if media_rules[screen]:
+                body = '\n'.join(f'  {css}' for css in media_rules[screen])
+                sections.append(f'@media (min-width: {min_width}) {{\n{body}\n}}')
+
+        return '\n'.join(sections) + '\n', generated
+
+    def _build_rule(self, class_name: str) -> Optional[Tuple[Optional[str], str, Tuple]]:
+        """将单个类名转换为CSS规则，返回 (响应式断点, 规则, 层叠排序键)"""
+        *variants, utility = class_name.split(':')
+
+        screens = dict(self.SCREENS)
+        screen = None
+        selector = f'.{self._escape(class_name)}'
+        pseudo = ''
+        group_prefix = ''
+        variant_ranks = []
+
+        for variant in variants:
+            if variant in screens and screen is None:
+                screen = variant
+            elif variant in self.STATE_VARIANTS:
+                pseudo += self.STATE_VARIANTS[variant]
+                variant_ranks.append(self.VARIANT_ORDER.index(variant))
+            elif variant == 'group-hover':
+                group_prefix = '.group:hover '
+                variant_ranks.append(self.VARIANT_ORDER.index(variant))
+            else:
+                return None
+
+        resolved = self._resolve(utility)
+        if resolved is None:
+            return None
+
+        declarations, child_selector = resolved
+        css = f'{group_prefix}{selector}{pseudo}{child_selector} {{ {declarations} }}'
+        return screen, css, (tuple(sorted(variant_ranks)), *self._cascade_rank(declarations), class_name)
+
+    def _cascade_rank(self, declarations: str) -> Tuple[int, int]:
+        """
+        计算规则的层叠位置：(属性分组序号, -覆盖的普通属性数)
+
+        规则按其最靠前的属性归入分组；透明度变量（如 --tw-bg-opacity）归入对应颜色属性的分组，
+        且不计覆盖数，因此 bg-opacity-* 总是排在设置同一透明度变量的 bg-* 之后
+        """
+        opacity_variables = {variable: prop for prop, variable in self.COLOR_PROPERTIES.values()}
+        ranked = []
+        for declaration in declarations.split(';'):
+            prop = declaration.split(':', 1)[0].strip()
+            if not prop:
+                continue
+            if prop in opacity_variables:
+                ranked.append((self.CASCADE_INDEX.get(opacity_variables[prop], len(self.CASCADE_GROUPS)), 0))
+            else:
+                ranked.append((self.CASCADE_INDEX.get(prop, len(self.CASCADE_GROUPS)),
+                               self.SHORTHAND_COVERAGE.get(prop, 1)))
+        group = min(index for index, _ in ranked)
+        return group, -sum(coverage for index, coverage in ranked if index == group)
+
+    def _resolve(self, utility: str) -> Optional[Tuple[str, str]]:
+        """解析工具类，返回 (CSS声明, 子选择器)"""
+        if utility in self.STATIC_UTILITIES:
+            return self.STATIC_UTILITIES[utility], ''
+
+        negative = utility.startswith('-')
+        name = utility[1:] if negative else utility
+
+        # space-x-* / space-y-*
+        match = re.fullmatch(r'space-([xy])-(.+)', name)
+        if match:
+            value = self._spacing_or_arbitrary(match.group(2))
+            if value is None:
+                return None
+            value = f'-{value}' if negative else value
+            side = 'left' if match.group(1) == 'x' else 'top'
+            return f'margin-{side}: {value}', ' > :not([hidden]) ~ :not([hidden])'
+
+        # 间距及尺寸
+        for prefix in sorted(self.SPACING_PROPERTIES, key=len, reverse=True):
+            if not name.startswith(prefix + '-'):
+                continue
+            key = name[len(prefix) + 1:]
+            value = self._spacing_or_arbitrary(key)
+            if value is None and prefix in ('w', 'h', 'top', 'right', 'bottom', 'left'):
+                value = self.FRACTIONS.get(key)
+            if value is None and prefix in ('m', 'mx', 'my', 'mt', 'mr', 'mb', 'ml') and key == 'auto':
+                value = 'auto'
+            if value is None:
+                continue
+            if negative:
+                if prefix not in self.NEGATABLE:
+                    return None
+                value = f'-{value}'
+            props = self.SPACING_PROPERTIES[prefix]
+            return '; '.join(f'{prop}: {value}' for prop in props), ''
+
+        if negative:
+            return None
+
+        # 颜色
+        for prefix, (prop, opacity_var) in self.COLOR_PROPERTIES.items():
+            if not name.startswith(prefix + '-'):
+                continue
+            key = name[len(prefix) + 1:]
+            color = self.colors.get(key)
+            if color is not None:
+                r, g, b = self._hex_to_rgb(color)
+                return f'{opacity_var}: 1; {prop}: rgb({r} {g} {b} / var({opacity_var}))', ''
+            # 颜色透明度修饰（如 bg-black/50）
+            modifier = re.fullmatch(r'(.+)/(\d+)', key)
+            if modifier and modifier.group(1) in self.colors:
+                r, g, b = self._hex_to_rgb(self.colors[modifier.group(1)])
+                return f'{prop}: rgb({r} {g} {b} / {int(modifier.group(2)) / 100:g})', ''
+            opacity = re.fullmatch(r'opacity-(\d+)', key)
+            if opacity:
+                return f'{opacity_var}: {int(opacity.group(1)) / 100:g}', ''
+            arbitrary = self._arbitrary(key)
+            if arbitrary and arbitrary.startswith('#'):
+                return f'{prop}: {arbitrary}', ''
+
+        match = re.fullmatch(r'text-(\w+)', name)
+        if match and match.group(1) in self.FONT_SIZES:
+            size, line_height = self.FONT_SIZES[match.group(1)]
+            return f'font-size: {size}; line-height: {line_height}', ''
+
+        match = re.fullmatch(r'leading-(\d+)', name)
+        if match and match.group(1) in self.LINE_HEIGHTS:
+            return f'line-height: {self.LINE_HEIGHTS[match.group(1)]}', ''
+
+        match = re.fullmatch(r'tracking-(\w+)', name)
+        if match and match.group(1) in self.LETTER_SPACINGS:
+            return f'letter-spacing: {self.LETTER_SPACINGS[match.group(1)]}', ''
+
+        match = re.fullmatch(r'rounded(?:-(t|b|l|r))?(?:-(\w+))?', name)
+        if match and (match.group(2) or '') in self.RADII:
+            radius = self.RADII[match.group(2) or '']
+            corners = {
+                None: ['border-radius'],
+                't': ['border-top-left-radius', 'border-top-right-radius'],
+                'b': ['border-bottom-right-radius', 'border-bottom-left-radius'],
+                'l': ['border-top-left-radius', 'border-bottom-left-radius'],
+                'r': ['border-top-right-radius', 'border-bottom-right-radius'],
+            }[match.group(1)]
+            return '; '.join(f'{prop}: {radius}' for prop in corners), ''
+
+        match = re.fullmatch(r'shadow(?:-(\w+))?', name)
+        if match and (match.group(1) or '') in self.SHADOWS:
+            return f'box-shadow: {self.SHADOWS[match.group(1) or ""]}', ''
+
+        match = re.fullmatch(r'max-w-(\w+)', name)
+        if match and match.group(1) in self.MAX_WIDTHS:
+            return f'max-width: {self.MAX_WIDTHS[match.group(1)]}', ''
+
+        match = re.fullmatch(r'(grid-cols|col-span)-(\d+)', name)
+        if match and 1 <= int(match.group(2)) <= 12:
+            count = match.group(2)
+            if match.group(1) == 'grid-cols':
+                return f'grid-template-columns: repeat({count}, minmax(0, 1fr))', ''
+            return f'grid-column: span {count} / span {count}', ''
+
+        match = re.fullmatch(r'(opacity|z|duration|order)-(\d+)', name)
+        if match:
+            prop, number = match.groups()
+            if prop == 'opacity':
+                return f'opacity: {int(number) / 100:g}', ''
+            if prop == 'z':
+                return f'z-index: {number}', ''
+            if prop == 'duration':
+                return f'transition-duration: {number}ms', ''
+            return f'order: {number}', ''
+
+        return None
+
+    def _spacing_or_arbitrary(self, key: str) -> Optional[str]:
+        """获取间距值（支持 [12px] 形式的任意值）"""
+        if key in self.spacing:
+            return self.spacing[key]
+        return self._arbitrary(key)
+
+    @staticmethod
+    def _arbitrary(key: str) -> Optional[str]:
+        """解析 [value] 形式的任意值"""
+        if len(key) > 2 and key[0] == '[' and key[-1] == ']':
+            return key[1:-1].replace('_', ' ')
+        return None
+
+    @staticmethod
+    def _spacing_value(key: str) -> str:
+        """TailwindCSS间距刻度：1单位 = 0.25rem"""
+        if key == '0':
+            return '0px'
+        if key == 'px':
+            return '1px'
+        return f'{float(key) * 0.25:g}rem'
+
+    @staticmethod
+    def _hex_to_rgb(color: str) -> Tuple[int, int, int]:
+        """十六进制颜色转RGB"""
+        color = color.lstrip('#')
+        return int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+
+    @staticmethod
+    def _escape(class_name: str) -> str:
+        """转义CSS选择器中的特殊字符"""
+        return re.sub(r'([^a-zA-Z0-9_-])', r'\\\1', class_name)